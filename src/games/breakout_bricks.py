@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Breakout Brick Grid
+Grid-indexed bricks with O(1) hit tests and removal, including multi-hit bricks
+"""
+
+import math
+import time
+
+MAX_HITS = 255
+
+class BrickGrid:
+    """Bricks stored as remaining hits per cell in a flat row-major bytearray"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Yield (x, y) of every standing brick in row-major order"""
+        for x, y, _ in self.items():
+            yield x, y
+
+    def __contains__(self, brick):
+        return self.hits_at(*brick) > 0
+
+    def items(self):
+        """Yield (x, y, hits) of every standing brick in row-major order"""
+        if not self.count:
+            return
+        width = self.width
+        cells = self.cells
+        for y in range(self.height):
+            row_start = y * width
+            for x in range(width):
+                hits = cells[row_start + x]
+                if hits:
+                    yield x, y, hits
+
+    def clear(self):
+        self.cells[:] = bytes(len(self.cells))
+        self.count = 0
+
+    def load(self, cells, count):
+        """Replace every brick with a level's precomputed cells in one copy"""
+        self.cells[:] = cells
+        self.count = count
+
+    def add(self, x, y, hits=1):
+        """Place a brick needing hits hits; bricks outside the playfield are dropped"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        index = y * self.width + x
+        if not self.cells[index]:
+            self.count += 1
+        self.cells[index] = max(1, min(hits, MAX_HITS))
+
+    def hits_at(self, x, y):
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.cells[y * self.width + x]
+        return 0
+
+    def hit(self, x, y):
+        """Take one hit off the brick at (x, y); return True if it broke"""
+        index = y * self.width + x
+        hits = self.cells[index]
+        if not hits:
+            return False
+        self.cells[index] = hits - 1
+        if hits == 1:
+            self.count -= 1
+            return True
+        return False
+
+    def boxes_near(self, x, y, dx, dy, size=1):
+        """Return (x, y, 1, 1) boxes of bricks a size x size box could touch moving by (dx, dy)
+
+        Only the cells under the swept bounding box are checked, so the cost depends
+        on the ball's speed rather than on how many bricks are standing.
+        """
+        # Bounds are inclusive: swept_aabb reports boxes that just touch at the end of the step
+        left = max(0, math.ceil(min(x, x + dx)) - 1)
+        right = min(self.width - 1, math.floor(max(x, x + dx) + size))
+        top = max(0, math.ceil(min(y, y + dy)) - 1)
+        bottom = min(self.height - 1, math.floor(max(y, y + dy) + size))
+
+        boxes = []
+        cells = self.cells
+        for cell_y in range(top, bottom + 1):
+            row_start = cell_y * self.width
+            for cell_x in range(left, right + 1):
+                if cells[row_start + cell_x]:
+                    boxes.append((cell_x, cell_y, 1, 1))
+        return boxes
+
+def benchmark(sizes=((60, 20), (200, 60), (600, 200)), ticks=20000):
+    """Time move_ball on growing playfields to show tick cost doesn't grow with bricks"""
+    import random
+    from breakout_game import BreakoutGame
+    from collision import first_hit
+
+    print("\nPlayfield   Bricks    grid(us/tick)  list scan(us/tick)")
+    for width, height in sizes:
+        random.seed(1)
+        game = BreakoutGame(width, height)
+        # Fill the top half with bricks that never break, so the count stays fixed
+        for y in range(2, height // 2):
+            for x in range(2, width - 2):
+                game.bricks.add(x, y, MAX_HITS)
+        game.move_delay = 0
+
+        positions = []
+        start = time.perf_counter()
+        for _ in range(ticks):
+            game.paddle_pos = max(1, min(width - game.paddle_width - 1,
+                                         int(game.ball_x) - game.paddle_width // 2))
+            positions.append((game.ball_x, game.ball_y, game.ball_dx, game.ball_dy))
+            game.move_ball()
+        grid_time = time.perf_counter() - start
+
+        # The old per-tick cost: sweep the ball against every brick in a list
+        boxes = [(x, y, 1, 1) for x, y in game.bricks]
+        sample = positions[:max(1, ticks // 100)]
+        start = time.perf_counter()
+        for ball_x, ball_y, ball_dx, ball_dy in sample:
+            first_hit((ball_x, ball_y, 1, 1), (ball_dx, ball_dy), boxes)
+        scan_time = time.perf_counter() - start
+
+        print(f"{width:4d}x{height:<4d} {len(game.bricks):8,d} {grid_time * 1e6 / ticks:14.2f} "
+              f"{scan_time * 1e6 / len(sample):19.2f}")
+
+if __name__ == '__main__':
+    benchmark()
@@ -1,21 +1,35 @@
 import random
 import sys
-import os
 import time
-import threading
 from threading import Lock
+from collision import first_hit, reflect
+from breakout_bricks import BrickGrid
+from breakout_levels import DEFAULT_LEVELS, load_levels
+from term_render import TerminalRenderer
+from term_input import KeyboardInput
+from replay import ReplayRecorder
+
+# Brick glyphs by hits remaining; tougher bricks look lighter
+BRICK_CHARS = {1: '█', 2: '▓', 3: '▒'}
+TOUGH_BRICK_CHAR = '░'
+
+# Real-time mode redraws and reads keys every frame but moves the ball at the old pace
+FRAME_TIME = 1 / 30
+BALL_TICK = 0.1
 
 class BreakoutGame:
-    def __init__(self):
-        self.width = 60
-        self.height = 20
+    def __init__(self, width=None, height=None, levels=None):
+        # The playfield defaults to the level pack's size
+        self.levels = levels or load_levels(DEFAULT_LEVELS)
+        self.width = width or self.levels.width
+        self.height = height or self.levels.height
         self.paddle_width = 8
         self.paddle_pos = self.width // 2 - self.paddle_width // 2
         self.ball_x = self.width // 2
         self.ball_y = self.height - 3
         self.ball_dx = 1
         self.ball_dy = -1
-        self.bricks = []
+        self.bricks = BrickGrid(self.width, self.height)
         self.score = 0
         self.lives = 3
         self.level = 1
@@ -24,74 +38,46 @@ class BreakoutGame:
         self.lock = Lock()
         self.last_move_time = 0
         self.move_delay = 0.1  # Seconds between moves
+        self.blank_field = self.build_blank_field()
+        self.renderer = TerminalRenderer()
+        self.ticks = 0  # Ball moves so far; replays key paddle moves to this
+        self.recorder = None
         
-    def clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+    def setup_bricks(self, level):
+        """Load a level by 1-based number or name from the level pack"""
+        number = level if isinstance(level, int) else self.levels.number(level)
+        if (self.levels.width, self.levels.height) != (self.width, self.height):
+            raise ValueError(f"Level pack is {self.levels.width}x{self.levels.height}, "
+                             f"playfield is {self.width}x{self.height}")
+        self.bricks.load(self.levels.level_cells(number), self.levels.counts[number - 1])
     
-    def setup_bricks(self, pattern='classic'):
-        self.bricks = []
-        
-        if pattern == 'classic':
-            # Classic brick pattern
-            for row in range(3, 8):
-                for col in range(5, self.width - 5):
-                    if col % 2 == 0:  # Create gaps
-                        self.bricks.append((col, row))
-        
-        elif pattern == 'pyramid':
-            # Pyramid pattern
-            for row in range(3, 8):
-                start = self.width // 2 - (8 - row)
-                end = self.width // 2 + (8 - row)
-                for col in range(max(5, start), min(self.width - 5, end)):
-                    if col % 2 == 0:
-                        self.bricks.append((col, row))
+    def build_blank_field(self):
+        # Borders never change, so build them once and copy rows each frame
+        field = [[' ' for _ in range(self.width)] for _ in range(self.height)]
         
-        elif pattern == 'diamond':
-            # Diamond pattern
-            center = self.width // 2
-            for row in range(2, 10):
-                width = abs(6 - row) + 2
-                for col in range(center - width, center + width):
-                    if col % 2 == 0 and 5 < col < self.width - 5:
-                        self.bricks.append((col, row))
+        # Draw borders
+        for i in range(self.width):
+            field[0][i] = '═'  # Top border
+            field[self.height-1][i] = '═'  # Bottom border
+        for i in range(self.height):
+            field[i][0] = '║'  # Left border
+            field[i][self.width-1] = '║'  # Right border
         
-        elif pattern == 'walls':
-            # Side walls pattern
-            for row in range(3, 12):
-                for col in [8, 10, self.width - 11, self.width - 9]:
-                    self.bricks.append((col, row))
-            # Top section
-            for row in range(3, 6):
-                for col in range(15, self.width - 15):
-                    if col % 3 == 0:
-                        self.bricks.append((col, row))
+        # Draw corners
+        field[0][0] = '╔'
+        field[0][self.width-1] = '╗'
+        field[self.height-1][0] = '╚'
+        field[self.height-1][self.width-1] = '╝'
+        return field
     
     def draw_game(self):
         with self.lock:
-            self.clear_screen()
-            
             # Create game field
-            field = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-            
-            # Draw borders
-            for i in range(self.width):
-                field[0][i] = '═'  # Top border
-                field[self.height-1][i] = '═'  # Bottom border
-            for i in range(self.height):
-                field[i][0] = '║'  # Left border
-                field[i][self.width-1] = '║'  # Right border
-            
-            # Draw corners
-            field[0][0] = '╔'
-            field[0][self.width-1] = '╗'
-            field[self.height-1][0] = '╚'
-            field[self.height-1][self.width-1] = '╝'
+            field = [row[:] for row in self.blank_field]
             
             # Draw bricks
-            for brick_x, brick_y in self.bricks:
-                if 0 <= brick_x < self.width and 0 <= brick_y < self.height:
-                    field[brick_y][brick_x] = '█'  # Full block
+            for brick_x, brick_y, hits in self.bricks.items():
+                field[brick_y][brick_x] = BRICK_CHARS.get(hits, TOUGH_BRICK_CHAR)
             
             # Draw paddle
             for i in range(self.paddle_width):
@@ -103,22 +89,38 @@ class BreakoutGame:
             if 0 <= int(self.ball_x) < self.width and 0 <= int(self.ball_y) < self.height:
                 field[int(self.ball_y)][int(self.ball_x)] = '●'  # Circle
             
-            # Print the field
-            print(f"🎮 BREAKOUT - Level {self.level} 🎮")
-            print(f"Score: {self.score:06d} | Lives: {'♥' * self.lives} | Bricks: {len(self.bricks)}")
-            print()
-            
-            for row in field:
-                print(''.join(row))
-            
-            print()
-            print("Controls: A/D or ←/→ to move paddle, Q to quit")
-            print("Press any key and Enter to move, or just Enter to continue")
+            # Only the cells that changed since the last frame get written
+            lines = [
+                f"🎮 BREAKOUT - Level {self.level} 🎮",
+                f"Score: {self.score:06d} | Lives: {'♥' * self.lives} | Bricks: {len(self.bricks)}",
+                ""
+            ]
+            lines.extend(''.join(row) for row in field)
+            lines.append("")
+            lines.append("Controls: A/D or ←/→ to move paddle, Q to quit")
+            if self.game_running:
+                lines.append("Keys act immediately - no need to press Enter")
+            else:
+                lines.append("Press any key and Enter to move, or just Enter to continue")
+            self.renderer.render(lines)
     
     def move_ball(self):
-        # Move ball
-        self.ball_x += self.ball_dx
-        self.ball_y += self.ball_dy
+        self.ticks += 1
+        # Move ball, stopping at the first brick along the way so fast balls can't skip one
+        # Only bricks in the cells the ball sweeps through are candidates
+        hit = first_hit((self.ball_x, self.ball_y, 1, 1), (self.ball_dx, self.ball_dy),
+                        self.bricks.boxes_near(self.ball_x, self.ball_y, self.ball_dx, self.ball_dy))
+        
+        if hit:
+            time_of_impact, normal_x, normal_y, (brick_x, brick_y, _, _) = hit
+            self.ball_x += self.ball_dx * time_of_impact
+            self.ball_y += self.ball_dy * time_of_impact
+            self.bricks.hit(brick_x, brick_y)
+            self.score += 10
+            self.ball_dx, self.ball_dy = reflect(self.ball_dx, self.ball_dy, normal_x, normal_y)
+        else:
+            self.ball_x += self.ball_dx
+            self.ball_y += self.ball_dy
         
         # Ball collision with walls
         if self.ball_x <= 1:
@@ -140,22 +142,6 @@ class BreakoutGame:
             hit_pos = (self.ball_x - self.paddle_pos) / self.paddle_width
             self.ball_dx = (hit_pos - 0.5) * 2  # Range from -1 to 1
         
-        # Ball collision with bricks
-        ball_grid_x = int(self.ball_x)
-        ball_grid_y = int(self.ball_y)
-        
-        hit_brick = None
-        for brick in self.bricks:
-            brick_x, brick_y = brick
-            if brick_x == ball_grid_x and brick_y == ball_grid_y:
-                hit_brick = brick
-                break
-        
-        if hit_brick:
-            self.bricks.remove(hit_brick)
-            self.score += 10
-            self.ball_dy = -self.ball_dy  # Reverse ball direction
-        
         # Ball goes below paddle (lose life)
         if self.ball_y >= self.height - 1:
             self.lives -= 1
@@ -172,9 +158,8 @@ class BreakoutGame:
         if not self.bricks:
             self.level += 1
             self.score += 100 * self.level
-            if self.level <= 4:
-                patterns = ['classic', 'pyramid', 'diamond', 'walls']
-                self.setup_bricks(patterns[self.level - 1])
+            if self.level <= len(self.levels):
+                self.setup_bricks(self.level)
                 # Reset ball
                 self.ball_x = self.width // 2
                 self.ball_y = self.height - 3
@@ -183,42 +168,34 @@ class BreakoutGame:
             else:
                 self.game_over = True  # Game won!
     
+    def start_recording(self):
+        """Seed the game and start recording paddle moves for a replay"""
+        self.recorder = ReplayRecorder('breakout', width=self.width, height=self.height,
+                                       levels=self.levels.source)
+    
+    def finish_recording(self):
+        if self.recorder:
+            self.recorder.finish(ticks=self.ticks, result=self.result())
+    
+    def result(self):
+        return {'score': self.score, 'level': self.level, 'lives': self.lives}
+    
     def move_paddle(self, direction):
         current_time = time.time()
         if current_time - self.last_move_time < self.move_delay:
             return
         
         self.last_move_time = current_time
-        
+        if self.recorder:
+            self.recorder.record(self.ticks, direction)
+        self.shift_paddle(direction)
+    
+    def shift_paddle(self, direction):
         if direction == 'left' and self.paddle_pos > 1:
             self.paddle_pos -= 2
         elif direction == 'right' and self.paddle_pos < self.width - self.paddle_width - 1:
             self.paddle_pos += 2
     
-    def get_input_with_timeout(self, timeout=0.15):
-        """Get input with timeout for responsive gameplay"""
-        import select
-        import sys
-        
-        if os.name == 'nt':  # Windows
-            import msvcrt
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                if msvcrt.kbhit():
-                    char = msvcrt.getch().decode('utf-8').lower()
-                    # Clear any remaining characters
-                    while msvcrt.kbhit():
-                        msvcrt.getch()
-                    return char
-                time.sleep(0.01)
-            return None
-        else:  # Unix/Linux/Mac
-            ready, _, _ = select.select([sys.stdin], [], [], timeout)
-            if ready:
-                line = sys.stdin.readline().strip().lower()
-                return line[0] if line else None
-            return None
-    
     def play_turn_based(self):
         """Turn-based version for better compatibility"""
         print("🎮 Welcome to Breakout! 🎮")
@@ -227,7 +204,8 @@ class BreakoutGame:
         print("Just press Enter to let the ball move without moving paddle")
         input("\nPress Enter to start...")
         
-        self.setup_bricks('classic')
+        self.start_recording()
+        self.setup_bricks(1)
         
         while not self.game_over:
             self.draw_game()
@@ -236,7 +214,7 @@ class BreakoutGame:
                 print(f"\n😞 GAME OVER! Final Score: {self.score}")
                 break
             
-            if not self.bricks and self.level > 4:
+            if not self.bricks and self.level > len(self.levels):
                 print(f"\n🎆 CONGRATULATIONS! You completed all levels!")
                 print(f"Final Score: {self.score}")
                 break
@@ -259,6 +237,8 @@ class BreakoutGame:
             except KeyboardInterrupt:
                 print("\nGame interrupted!")
                 break
+        
+        self.finish_recording()
     
     def play_real_time(self):
         """Real-time version (may not work on all systems)"""
@@ -267,36 +247,44 @@ class BreakoutGame:
         print("This mode updates automatically - press Q to quit")
         input("\nPress Enter to start...")
         
-        self.setup_bricks('classic')
+        self.start_recording()
+        self.setup_bricks(1)
         self.game_running = True
         
-        # Game loop
-        while self.game_running and not self.game_over:
-            self.draw_game()
-            
-            if self.lives <= 0:
-                print(f"\n😞 GAME OVER! Final Score: {self.score}")
-                break
-            
-            if not self.bricks and self.level > 4:
-                print(f"\n🎆 CONGRATULATIONS! You completed all levels!")
-                print(f"Final Score: {self.score}")
-                break
-            
-            # Get input with timeout
-            key = self.get_input_with_timeout(0.2)
-            
-            if key:
-                if key in ['q', 'quit']:
-                    self.game_running = False
+        # Game loop: keys arrive on a background thread, so polling never blocks
+        with KeyboardInput() as keyboard:
+            next_ball_tick = time.perf_counter()
+            while self.game_running and not self.game_over:
+                frame_start = time.perf_counter()
+                
+                for key in keyboard.drain():
+                    if key == 'q':
+                        self.game_running = False
+                    elif key in ['a', 'left']:
+                        self.move_paddle('left')
+                    elif key in ['d', 'right']:
+                        self.move_paddle('right')
+                if not self.game_running:
                     break
-                elif key in ['a', 'left']:
-                    self.move_paddle('left')
-                elif key in ['d', 'right']:
-                    self.move_paddle('right')
-            
-            self.move_ball()
-            time.sleep(0.1)  # Game speed
+                
+                if frame_start >= next_ball_tick:
+                    self.move_ball()
+                    next_ball_tick += BALL_TICK
+                
+                self.draw_game()
+                
+                if self.lives <= 0:
+                    print(f"\n😞 GAME OVER! Final Score: {self.score}")
+                    break
+                
+                if not self.bricks and self.level > len(self.levels):
+                    print(f"\n🎆 CONGRATULATIONS! You completed all levels!")
+                    print(f"Final Score: {self.score}")
+                    break
+                
+                time.sleep(max(0, FRAME_TIME - (time.perf_counter() - frame_start)))
+        
+        self.finish_recording()
     
     def show_demo(self):
         """Show a demo of the game"""
@@ -330,7 +318,21 @@ class BreakoutGame:
         level_bonus = self.level * 200
         return self.score + life_bonus + level_bonus
 
-def main():
+def play_replay(replay):
+    """Re-run a recorded game headless, as fast as possible"""
+    levels = load_levels(replay.meta.get('levels', DEFAULT_LEVELS))
+    game = BreakoutGame(replay.meta['width'], replay.meta['height'], levels)
+    random.seed(replay.seed)
+    game.setup_bricks(1)
+    moves = replay.inputs_by_tick()
+    
+    while game.ticks < replay.meta['ticks'] and not game.game_over:
+        for direction in moves.get(game.ticks, ()):
+            game.shift_paddle(direction)
+        game.move_ball()
+    return game.result()
+
+def main(levels=None):
     while True:
         print("\n" + "="*50)
         print("🎮 BREAKOUT GAME 🎮")
@@ -347,7 +349,7 @@ def main():
         choice = input("\nChoose option (1-5): ").strip()
         
         if choice == '1':
-            game = BreakoutGame()
+            game = BreakoutGame(levels=levels)
             game.play_turn_based()
             
             if game.score > 0:
@@ -358,7 +360,7 @@ def main():
                 print(f"Lives remaining: {game.lives}")
         
         elif choice == '2':
-            game = BreakoutGame()
+            game = BreakoutGame(levels=levels)
             try:
                 game.play_real_time()
             except Exception as e:
@@ -374,7 +376,7 @@ def main():
                 print(f"Lives remaining: {game.lives}")
         
         elif choice == '3':
-            game = BreakoutGame()
+            game = BreakoutGame(levels=levels)
             game.show_demo()
         
         elif choice == '4':
@@ -401,7 +403,8 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        # python breakout_game.py [level_pack.txt]; see breakout_levels.py for the format
+        main(load_levels(sys.argv[1]) if len(sys.argv) > 1 else None)
     except KeyboardInterrupt:
         print("\nGame interrupted by user. Goodbye! 🎮")
         sys.exit()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Breakout Level Engine
+Parses, validates and caches level packs so loading a level is one array copy
+"""
+
+import argparse
+import hashlib
+import random
+import struct
+import time
+from pathlib import Path
+
+DEFAULT_LEVELS = Path(__file__).parent / "breakout_levels.txt"
+
+# Compiled packs: magic, version, width, height, level count, SHA-1 of the source text
+CACHE_MAGIC = b'BKLV'
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct('<4sBHHH20s')
+EMPTY = '.'
+MAX_LEVEL_HITS = 9
+
+_loaded = {}
+
+class LevelSet:
+    """Every level of a pack as one contiguous bytearray of hits per cell"""
+
+    def __init__(self, width, height, names, counts, cells, source=None):
+        self.width = width
+        self.height = height
+        self.names = names
+        self.counts = counts
+        self.cells = memoryview(cells)
+        self.source = source
+
+    def __len__(self):
+        return len(self.names)
+
+    def number(self, name):
+        """1-based level number for a level name"""
+        try:
+            return self.names.index(name) + 1
+        except ValueError:
+            raise ValueError(f"Unknown level '{name}'. Choose from: {', '.join(self.names)}")
+
+    def level_cells(self, number):
+        """Cells of a 1-based level, as a view into the pack (no copy)"""
+        size = self.width * self.height
+        start = (number - 1) * size
+        return self.cells[start:start + size]
+
+def parse_levels(text, source='<levels>'):
+    """Parse and validate a text level pack; returns a LevelSet"""
+    width = height = None
+    names = []
+    levels = []
+    rows = None
+
+    for line_no, line in enumerate(text.splitlines(), 1):
+        line = line.rstrip()
+        where = f"{source}:{line_no}"
+        if not line or line.startswith('#'):
+            continue
+
+        if line.startswith('size '):
+            if width is not None:
+                raise ValueError(f"{where}: size given twice")
+            try:
+                width, height = (int(value) for value in line.split()[1:])
+            except ValueError:
+                raise ValueError(f"{where}: expected 'size <width> <height>'")
+            if width < 8 or height < 8 or width > 65535 or height > 65535:
+                raise ValueError(f"{where}: playfield must be between 8x8 and 65535x65535")
+        elif line.startswith('level '):
+            if width is None:
+                raise ValueError(f"{where}: 'size' must come before the first level")
+            name = line[len('level '):].strip()
+            if not name or name in names or len(name.encode('utf-8')) > 255:
+                raise ValueError(f"{where}: level names must be unique, non-empty and short")
+            names.append(name)
+            rows = []
+            levels.append((where, rows))
+        else:
+            if rows is None:
+                raise ValueError(f"{where}: brick row outside a level")
+            rows.append((where, line))
+
+    if not levels:
+        raise ValueError(f"{source}: no levels defined")
+
+    size = width * height
+    cells = bytearray(size * len(levels))
+    counts = []
+    for index, (where, rows) in enumerate(levels):
+        # Keep the walls, the ball's serve row and the paddle rows clear
+        if len(rows) > height - 3:
+            raise ValueError(f"{where}: at most {height - 3} brick rows fit a {width}x{height} playfield")
+        offset = index * size
+        count = 0
+        for y, (row_where, row) in enumerate(rows):
+            if len(row) > width:
+                raise ValueError(f"{row_where}: row is wider than {width}")
+            if y == 0 and row.strip(EMPTY):
+                raise ValueError(f"{row_where}: the top row is the wall and must be empty")
+            if row[:1] not in ('', EMPTY) or (len(row) == width and row[-1] != EMPTY):
+                raise ValueError(f"{row_where}: the side walls must be empty")
+            for x, char in enumerate(row):
+                if char == EMPTY:
+                    continue
+                if not ('1' <= char <= str(MAX_LEVEL_HITS)):
+                    raise ValueError(f"{row_where}: unexpected '{char}' (use '.' or 1-{MAX_LEVEL_HITS})")
+                cells[offset + y * width + x] = int(char)
+                count += 1
+        if not count:
+            raise ValueError(f"{where}: level has no bricks")
+        counts.append(count)
+
+    return LevelSet(width, height, names, counts, cells, source)
+
+def encode_levels(levels, digest):
+    header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, levels.width, levels.height,
+                               len(levels), digest)
+    table = bytearray()
+    for name, count in zip(levels.names, levels.counts):
+        encoded = name.encode('utf-8')
+        table += struct.pack('<BI', len(encoded), count) + encoded
+    return header + bytes(table) + bytes(levels.cells)
+
+def decode_levels(data, digest, source=None):
+    """Return the LevelSet in a compiled pack, or None if it is stale or not a pack"""
+    if len(data) < CACHE_HEADER.size:
+        return None
+    magic, version, width, height, level_count, stored = CACHE_HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or stored != digest:
+        return None
+
+    offset = CACHE_HEADER.size
+    names = []
+    counts = []
+    for _ in range(level_count):
+        length, count = struct.unpack_from('<BI', data, offset)
+        offset += 5
+        names.append(data[offset:offset + length].decode('utf-8'))
+        counts.append(count)
+        offset += length
+    cells = memoryview(data)[offset:]
+    if len(cells) != width * height * level_count:
+        return None
+    return LevelSet(width, height, names, counts, cells, source)
+
+def cache_path(path):
+    # Compiled packs sit with the bytecode, so they never end up in version control
+    return path.parent / '__pycache__' / f"{path.stem}.levels"
+
+def load_levels(path=DEFAULT_LEVELS):
+    """Load a level pack, reusing the compiled copy while the text is unchanged"""
+    path = Path(path).resolve()
+    text = path.read_bytes()
+    digest = hashlib.sha1(text).digest()
+
+    cached = _loaded.get(path)
+    if cached and cached[0] == digest:
+        return cached[1]
+
+    compiled = cache_path(path)
+    levels = None
+    if compiled.exists():
+        levels = decode_levels(compiled.read_bytes(), digest, str(path))
+    if levels is None:
+        levels = parse_levels(text.decode('utf-8'), str(path))
+        try:
+            compiled.parent.mkdir(exist_ok=True)
+            compiled.write_bytes(encode_levels(levels, digest))
+        except OSError:
+            pass  # Read-only install: parse again next run
+    _loaded[path] = (digest, levels)
+    return levels
+
+def generate_levels(count, width=60, height=20, seed=0):
+    """Build a text pack of mirrored random levels with some multi-hit bricks"""
+    rng = random.Random(seed)
+    lines = [f"size {width} {height}"]
+    for number in range(1, count + 1):
+        rows = [EMPTY * width, EMPTY * width]
+        density = rng.uniform(0.25, 0.7)
+        for _ in range(rng.randint(3, max(3, height // 2 - 2))):
+            half = [EMPTY] * (width // 2)
+            for x in range(3, width // 2):
+                if rng.random() < density:
+                    half[x] = str(rng.choice([1, 1, 1, 1, 2, 2, 3]))
+            right = half[::-1] if width % 2 == 0 else [EMPTY] + half[::-1]
+            rows.append(''.join(half + right))
+        if not any(row.strip(EMPTY) for row in rows):
+            rows[-1] = rows[-1][:width // 2] + '1' + rows[-1][width // 2 + 1:]
+        lines.append("")
+        lines.append(f"level generated-{number}")
+        lines.extend(rows)
+    return '\n'.join(lines) + '\n'
+
+def benchmark(count=500, rounds=20):
+    """Time parsing, cached loading and per-level array copies for a large pack"""
+    from breakout_bricks import BrickGrid
+
+    text = generate_levels(count)
+    start = time.perf_counter()
+    levels = parse_levels(text)
+    parse_time = time.perf_counter() - start
+
+    digest = hashlib.sha1(text.encode('utf-8')).digest()
+    data = encode_levels(levels, digest)
+    start = time.perf_counter()
+    decode_levels(data, digest)
+    decode_time = time.perf_counter() - start
+
+    grid = BrickGrid(levels.width, levels.height)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for number in range(1, len(levels) + 1):
+            grid.load(levels.level_cells(number), levels.counts[number - 1])
+    copy_time = time.perf_counter() - start
+
+    # The per-brick loop a procedural setup pays on every level change
+    bricks = []
+    for number in range(1, len(levels) + 1):
+        bricks.append([(index % levels.width, index // levels.width, hits)
+                       for index, hits in enumerate(levels.level_cells(number)) if hits])
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for level in bricks:
+            grid.clear()
+            for x, y, hits in level:
+                grid.add(x, y, hits)
+    loop_time = time.perf_counter() - start
+
+    loads = rounds * len(levels)
+    print(f"\n🧱 {len(levels)} levels, {levels.width}x{levels.height}, "
+          f"{sum(levels.counts):,} bricks, {len(data):,} bytes compiled")
+    print(f"Parse + validate text: {parse_time * 1000:8.2f} ms")
+    print(f"Load compiled pack:    {decode_time * 1000:8.2f} ms")
+    print(f"Level change (copy):   {copy_time * 1e6 / loads:8.2f} us")
+    print(f"Level change (loop):   {loop_time * 1e6 / loads:8.2f} us")
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate, generate and benchmark Breakout level packs")
+    parser.add_argument('pack', nargs='?', default=str(DEFAULT_LEVELS), help="level pack to validate")
+    parser.add_argument('--generate', type=int, metavar='N', help="print a pack of N generated levels")
+    parser.add_argument('--size', type=int, nargs=2, default=(60, 20), metavar=('WIDTH', 'HEIGHT'))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    if args.generate:
+        print(generate_levels(args.generate, *args.size, args.seed), end='')
+    elif args.benchmark:
+        benchmark()
+    else:
+        levels = load_levels(args.pack)
+        print(f"✅ {args.pack}: {len(levels)} levels, {levels.width}x{levels.height} playfield")
+        for name, count in zip(levels.names, levels.counts):
+            print(f"   {name:<20s} {count:5d} bricks")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Swept Collision
+Continuous axis-aligned box collision shared by the ball games
+"""
+
+def swept_aabb(box, velocity, obstacle):
+    """Return (time, normal_x, normal_y) of first contact during one step, or None
+
+    box and obstacle are (x, y, width, height); velocity is the box's
+    displacement over the whole step, so time is a fraction in [0, 1].
+    Boxes that already overlap at the start of the step are not reported.
+    """
+    x, y, w, h = box
+    vx, vy = velocity
+    ox, oy, ow, oh = obstacle
+
+    if vx > 0:
+        tx_entry = (ox - (x + w)) / vx
+        tx_exit = (ox + ow - x) / vx
+    elif vx < 0:
+        tx_entry = (ox + ow - x) / vx
+        tx_exit = (ox - (x + w)) / vx
+    elif x + w <= ox or x >= ox + ow:
+        return None
+    else:
+        tx_entry = -float('inf')
+        tx_exit = float('inf')
+
+    if vy > 0:
+        ty_entry = (oy - (y + h)) / vy
+        ty_exit = (oy + oh - y) / vy
+    elif vy < 0:
+        ty_entry = (oy + oh - y) / vy
+        ty_exit = (oy - (y + h)) / vy
+    elif y + h <= oy or y >= oy + oh:
+        return None
+    else:
+        ty_entry = -float('inf')
+        ty_exit = float('inf')
+
+    entry = max(tx_entry, ty_entry)
+    exit_time = min(tx_exit, ty_exit)
+    if entry >= exit_time or entry < 0 or entry > 1:
+        return None
+
+    # The axis that was entered last is the face we hit
+    if tx_entry > ty_entry:
+        return entry, (-1 if vx > 0 else 1), 0
+    return entry, 0, (-1 if vy > 0 else 1)
+
+def first_hit(box, velocity, obstacles):
+    """Return (time, normal_x, normal_y, obstacle) for the earliest contact, or None"""
+    best = None
+    for obstacle in obstacles:
+        hit = swept_aabb(box, velocity, obstacle)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            best = hit + (obstacle,)
+    return best
+
+def reflect(vx, vy, normal_x, normal_y):
+    """Bounce a velocity off a face with the given axis-aligned normal"""
+    if normal_x:
+        vx = -vx
+    if normal_y:
+        vy = -vy
+    return vx, vy
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Hangman Bot Benchmark
+Plays strategy bots over every word of a dictionary in worker processes
+"""
+
+import argparse
+import os
+import random
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from hangman_game import DIFFICULTIES, HangmanGame
+from hangman_solver import HangmanSolver
+from hangman_words import DEFAULT_WORDS, load_words
+
+STRATEGIES = ('frequency', 'entropy', 'random')
+
+# Fallback order when a bot has no candidate words left to learn from
+ENGLISH_ORDER = 'ETAOINSHRDLCUMWFGYPBVKJXQZ'
+
+# A game is played once with the loosest limit; a stricter difficulty would
+# have ended the same game at its own limit, since bots never see the count
+MAX_WRONG = max(DIFFICULTIES.values())
+
+# Per-process game and solvers, created on first use by a worker
+_worker = {}
+
+def next_letter(strategy, game, solver, rng):
+    """The letter a bot guesses next"""
+    if strategy == 'random':
+        return rng.choice([letter for letter in string.ascii_uppercase
+                           if letter not in game.guessed_letters])
+    if strategy == 'frequency':
+        counts = solver.letter_counts(game.display_word(), game.wrong_letters)
+        if counts:
+            return max(sorted(counts), key=counts.get)
+    else:
+        letter, _ = solver.best_letter(game.display_word(), game.wrong_letters)
+        if letter:
+            return letter
+    return next(letter for letter in ENGLISH_ORDER if letter not in game.guessed_letters)
+
+def play_words(words_path, category, strategy, words, seed):
+    """Worker task: wrong guesses each word took to solve (MAX_WRONG if the bot lost)"""
+    game = _worker.get('game')
+    if game is None or _worker.get('path') != words_path:
+        game = _worker['game'] = HangmanGame(words_path)
+        _worker['path'] = words_path
+        _worker['solvers'] = {}
+    solvers = _worker['solvers']
+    if category not in solvers:
+        solvers[category] = HangmanSolver(game.words.words(category))
+    solver = solvers[category]
+    # String seeds hash the same in every process
+    rng = random.Random(f"{seed}:{category}:{strategy}:{words[0]}")
+
+    wrong = []
+    for word in words:
+        game.reset_game()
+        game.max_wrong_guesses = MAX_WRONG
+        game.category = category
+        game.set_word(word)
+        while not game.game_won and not game.game_lost:
+            game.apply_guess(next_letter(strategy, game, solver, rng))
+        wrong.append(game.wrong_guesses)
+    return category, strategy, wrong
+
+def run_benchmark(words_path=DEFAULT_WORDS, strategies=STRATEGIES, workers=None, limit=None,
+                  seed=0, chunk_size=50):
+    """Play every (sampled) word with each strategy; returns ({(strategy, category): [wrong]}, seconds)"""
+    for strategy in strategies:
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'. Choose from: {', '.join(STRATEGIES)}")
+    words_path = str(words_path)
+    pack = load_words(words_path)
+    rng = random.Random(seed)
+
+    tasks = []
+    for category in pack.categories:
+        count = pack.count(category)
+        numbers = range(count) if not limit or limit >= count else sorted(rng.sample(range(count), limit))
+        words = [pack.word(category, number) for number in numbers]
+        for strategy in strategies:
+            for start in range(0, len(words), chunk_size):
+                tasks.append((words_path, category, strategy, words[start:start + chunk_size], seed))
+
+    results = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers or os.cpu_count() or 1) as executor:
+        futures = [executor.submit(play_words, *task) for task in tasks]
+        for future in futures:
+            category, strategy, wrong = future.result()
+            results.setdefault((strategy, category), []).extend(wrong)
+    return results, time.perf_counter() - start
+
+def print_report(results, elapsed, workers):
+    difficulties = sorted(DIFFICULTIES.items(), key=lambda item: -item[1])
+    strategies = list(dict.fromkeys(strategy for strategy, _ in results))
+    categories = list(dict.fromkeys(category for _, category in results))
+
+    for strategy in strategies:
+        print(f"\n🤖 {strategy} bot: win rate / average wrong guesses")
+        print(f"{'Category':<14s}{'Words':>7s}" +
+              ''.join(f"{f'{name.title()} ({limit})':>16s}" for name, limit in difficulties))
+        rows = [(category, results[(strategy, category)]) for category in categories]
+        rows.append(('all', [wrong for _, group in rows for wrong in group]))
+        for category, wrong in rows:
+            cells = []
+            for _, limit in difficulties:
+                # Lost at this limit if the word needed that many misses or more
+                wins = sum(1 for count in wrong if count < limit)
+                average = sum(min(count, limit) for count in wrong) / len(wrong)
+                cells.append(f"{wins / len(wrong):8.0%} {average:5.2f}")
+            print(f"{category:<14s}{len(wrong):7d}" + ''.join(f"{cell:>16s}" for cell in cells))
+
+    played = sum(len(wrong) for wrong in results.values())
+    games = played * len(DIFFICULTIES)
+    print(f"\n⏱️  {played:,} words played, {games:,} games scored across {len(DIFFICULTIES)} difficulties "
+          f"in {elapsed:.2f} s with {workers} worker(s)")
+    print(f"Throughput: {played / elapsed:,.0f} words/sec, {games / elapsed:,.0f} games/sec")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Hangman strategy bots over a word list")
+    parser.add_argument('words', nargs='?', default=str(DEFAULT_WORDS), help="word list file")
+    parser.add_argument('--strategies', nargs='+', default=list(STRATEGIES), metavar='STRATEGY',
+                        help=f"any of {', '.join(STRATEGIES)} (default: all)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--limit', type=int, help="sample at most this many words per category")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    try:
+        results, elapsed = run_benchmark(args.words, args.strategies, args.workers, args.limit, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    print_report(results, elapsed, args.workers)
+
+if __name__ == '__main__':
+    main()
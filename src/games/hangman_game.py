@@ -1,26 +1,17 @@
+import bisect
 import random
 import sys
 import os
+from hangman_solver import HangmanSolver
+from hangman_words import DEFAULT_WORDS, load_words
+from replay import record_terminal
 
-class HangmanGame:
-    def __init__(self):
-        self.word_categories = {
-            'animals': ['elephant', 'giraffe', 'penguin', 'dolphin', 'butterfly', 'kangaroo', 'rhinoceros', 
-                       'octopus', 'chimpanzee', 'crocodile', 'flamingo', 'hedgehog', 'jaguar', 'koala'],
-            'countries': ['australia', 'brazil', 'canada', 'denmark', 'egypt', 'france', 'germany', 
-                         'hungary', 'iceland', 'japan', 'kenya', 'luxembourg', 'morocco', 'norway'],
-            'foods': ['pizza', 'hamburger', 'spaghetti', 'chocolate', 'strawberry', 'pineapple', 
-                     'sandwich', 'pancake', 'avocado', 'broccoli', 'cinnamon', 'doughnut'],
-            'movies': ['titanic', 'avatar', 'inception', 'gladiator', 'casablanca', 'matrix', 
-                      'superman', 'batman', 'spiderman', 'frozen', 'shrek', 'finding'],
-            'sports': ['basketball', 'football', 'tennis', 'swimming', 'volleyball', 'baseball', 
-                      'hockey', 'cricket', 'badminton', 'cycling', 'boxing', 'wrestling'],
-            'technology': ['computer', 'smartphone', 'internet', 'software', 'hardware', 'keyboard', 
-                          'monitor', 'printer', 'scanner', 'webcam', 'bluetooth', 'wireless']
-        }
-        
-        self.hangman_stages = [
-            """
+# Wrong guesses allowed at each difficulty
+DIFFICULTIES = {'easy': 8, 'medium': 6, 'hard': 4, 'expert': 3}
+
+# Gallows drawings, one per wrong guess
+HANGMAN_STAGES = [
+    """
   +---+
   |   |
       |
@@ -29,7 +20,7 @@ class HangmanGame:
       |
 =========
 """,
-            """
+    """
   +---+
   |   |
   O   |
@@ -38,7 +29,7 @@ class HangmanGame:
       |
 =========
 """,
-            """
+    """
   +---+
   |   |
   O   |
@@ -47,7 +38,7 @@ class HangmanGame:
       |
 =========
 """,
-            r"""
+    r"""
   +---+
   |   |
   O   |
@@ -56,7 +47,7 @@ class HangmanGame:
       |
 =========
 """,
-            r"""
+    r"""
   +---+
   |   |
   O   |
@@ -65,7 +56,7 @@ class HangmanGame:
       |
 =========
 """,
-            r"""
+    r"""
   +---+
   |   |
   O   |
@@ -74,7 +65,7 @@ class HangmanGame:
       |
 =========
 """,
-            r"""
+    r"""
   +---+
   |   |
   O   |
@@ -83,14 +74,26 @@ class HangmanGame:
       |
 =========
 """
-        ]
-        
+]
+
+class HangmanGame:
+    def __init__(self, words_path=DEFAULT_WORDS):
+        self.words = load_words(words_path)
+        self.hangman_stages = HANGMAN_STAGES
+        self.solvers = {}
         self.reset_game()
     
     def reset_game(self):
         self.word = ""
         self.category = ""
         self.guessed_letters = set()
+        # Where each hidden letter sits, and the display text ('E _ E _ ...')
+        # patched in place at just those positions as letters are revealed
+        self.letter_positions = {}
+        self.masked_text = bytearray()
+        self.remaining = 0
+        self.correct_letters = []
+        self.wrong_letters = []
         self.wrong_guesses = 0
         self.max_wrong_guesses = len(self.hangman_stages) - 1
         self.game_won = False
@@ -100,24 +103,42 @@ class HangmanGame:
         os.system('cls' if os.name == 'nt' else 'clear')
     
     def choose_word(self, category=None):
-        if category and category in self.word_categories:
+        if category and category in self.words:
             self.category = category
-            self.word = random.choice(self.word_categories[category]).upper()
         else:
-            self.category = random.choice(list(self.word_categories.keys()))
-            self.word = random.choice(self.word_categories[self.category]).upper()
+            self.category = random.choice(self.words.categories)
+        self.set_word(self.words.random_word(self.category))
     
-    def display_word(self):
-        display = ""
-        for letter in self.word:
-            if letter in self.guessed_letters:
-                display += letter + " "
+    def set_word(self, word):
+        self.word = word.upper()
+        self.letter_positions = {}
+        masked = []
+        for position, letter in enumerate(self.word):
+            if letter.isalpha():
+                self.letter_positions.setdefault(letter, []).append(position)
+                masked.append("_")
             else:
-                display += "_ "
-        return display.strip()
+                # The spaces between a phrase's words start out shown
+                masked.append(letter)
+        self.remaining = sum(len(positions) for positions in self.letter_positions.values())
+        # Word lists are ASCII, so position n is byte 2n of the display text
+        self.masked_text = bytearray(" ".join(masked), 'ascii')
+    
+    def reveal(self, letter):
+        """Uncover every occurrence of a letter; returns how many there were"""
+        positions = self.letter_positions.get(letter, ())
+        code = ord(letter)
+        for position in positions:
+            self.masked_text[2 * position] = code
+        self.remaining -= len(positions)
+        return len(positions)
+    
+    def display_word(self):
+        return self.masked_text.decode('ascii')
     
     def display_hangman(self):
-        return self.hangman_stages[self.wrong_guesses]
+        # Easy mode allows more misses than there are drawings
+        return self.hangman_stages[min(self.wrong_guesses, len(self.hangman_stages) - 1)]
     
     def display_game_state(self):
         self.clear_screen()
@@ -132,13 +153,10 @@ class HangmanGame:
         print()
         
         if self.guessed_letters:
-            correct_guesses = [letter for letter in self.guessed_letters if letter in self.word]
-            wrong_guesses = [letter for letter in self.guessed_letters if letter not in self.word]
-            
-            if correct_guesses:
-                print(f"✅ Correct letters: {', '.join(sorted(correct_guesses))}")
-            if wrong_guesses:
-                print(f"❌ Wrong letters: {', '.join(sorted(wrong_guesses))}")
+            if self.correct_letters:
+                print(f"✅ Correct letters: {', '.join(self.correct_letters)}")
+            if self.wrong_letters:
+                print(f"❌ Wrong letters: {', '.join(self.wrong_letters)}")
             print()
     
     def get_guess(self):
@@ -162,31 +180,53 @@ class HangmanGame:
             
             return guess
     
-    def make_guess(self, letter):
+    def apply_guess(self, letter):
+        """Update the game for a guessed letter; returns True if it is in the word"""
         self.guessed_letters.add(letter)
         
-        if letter in self.word:
-            print(f"🎉 Good guess! '{letter}' is in the word.")
+        if self.reveal(letter):
+            bisect.insort(self.correct_letters, letter)
             # Check if word is complete
-            if all(letter in self.guessed_letters for letter in self.word):
+            if self.remaining == 0:
                 self.game_won = True
+            return True
+        
+        bisect.insort(self.wrong_letters, letter)
+        self.wrong_guesses += 1
+        # Check if game is lost
+        if self.wrong_guesses >= self.max_wrong_guesses:
+            self.game_lost = True
+        return False
+    
+    def make_guess(self, letter):
+        if self.apply_guess(letter):
+            print(f"🎉 Good guess! '{letter}' is in the word.")
         else:
-            self.wrong_guesses += 1
             print(f"😞 Sorry, '{letter}' is not in the word.")
-            # Check if game is lost
-            if self.wrong_guesses >= self.max_wrong_guesses:
-                self.game_lost = True
         
         input("\nPress Enter to continue...")
     
     def get_hint(self):
         # Show a random letter that hasn't been guessed
-        available_letters = [letter for letter in self.word if letter not in self.guessed_letters]
+        available_letters = [letter for letter in self.word
+                             if letter.isalpha() and letter not in self.guessed_letters]
         if available_letters:
             hint_letter = random.choice(available_letters)
             return f"💡 Hint: The word contains the letter '{hint_letter}'"
         return "No more hints available!"
     
+    def get_solver_hint(self):
+        # The player knows the category, so only its words are candidates
+        if self.category not in self.solvers:
+            self.solvers[self.category] = HangmanSolver(self.words.words(self.category))
+        candidates, letter = self.solvers[self.category].solve(self.display_word(), self.wrong_letters)
+        if not letter:
+            return "🧠 Solver: no more useful letters to guess!"
+        hint = f"🧠 Solver: {len(candidates)} possible word(s); best next letter: '{letter}'"
+        if len(candidates) <= 5:
+            hint += f"\n   Candidates: {', '.join(candidates)}"
+        return hint
+    
     def show_category_hint(self):
         hints = {
             'animals': "It's a living creature from the animal kingdom",
@@ -200,7 +240,7 @@ class HangmanGame:
     
     def select_category(self):
         print("\n=== Choose a Category ===")
-        categories = list(self.word_categories.keys())
+        categories = self.words.categories
         
         for i, category in enumerate(categories, 1):
             print(f"{i}. {category.title()}")
@@ -229,16 +269,16 @@ class HangmanGame:
             choice = input("\nSelect difficulty (1-4) or Enter for default: ").strip()
             
             if choice == '' or choice == '2':
-                self.max_wrong_guesses = 6
+                self.max_wrong_guesses = DIFFICULTIES['medium']
                 break
             elif choice == '1':
-                self.max_wrong_guesses = 8
+                self.max_wrong_guesses = DIFFICULTIES['easy']
                 break
             elif choice == '3':
-                self.max_wrong_guesses = 4
+                self.max_wrong_guesses = DIFFICULTIES['hard']
                 break
             elif choice == '4':
-                self.max_wrong_guesses = 3
+                self.max_wrong_guesses = DIFFICULTIES['expert']
                 break
             else:
                 print("Invalid choice. Please try again.")
@@ -248,7 +288,7 @@ class HangmanGame:
             self.display_game_state()
             
             # Show available commands
-            print("Commands: letter to guess, 'hint' for hint, 'category' for category hint, 'quit' to exit")
+            print("Commands: letter to guess, 'hint' for hint, 'solve' for solver hint, 'category' for category hint, 'quit' to exit")
             
             user_input = input("Your move: ").strip().lower()
             
@@ -258,6 +298,10 @@ class HangmanGame:
                 print(self.get_hint())
                 input("\nPress Enter to continue...")
                 continue
+            elif user_input == 'solve':
+                print(self.get_solver_hint())
+                input("\nPress Enter to continue...")
+                continue
             elif user_input == 'category':
                 print(self.show_category_hint())
                 input("\nPress Enter to continue...")
@@ -270,7 +314,7 @@ class HangmanGame:
                     print(f"You already guessed '{letter}'. Try a different letter.")
                     input("\nPress Enter to continue...")
             else:
-                print("Please enter a single letter, 'hint', 'category', or 'quit'.")
+                print("Please enter a single letter, 'hint', 'solve', 'category', or 'quit'.")
                 input("\nPress Enter to continue...")
         
         # Game over
@@ -335,8 +379,8 @@ class HangmanGame:
 class WordHintGame(HangmanGame):
     """Enhanced version with word definitions and better hints"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, words_path=DEFAULT_WORDS):
+        super().__init__(words_path)
         self.word_hints = {
             'ELEPHANT': "Large mammal with a trunk",
             'GIRAFFE': "Tallest animal with a long neck",
@@ -371,6 +415,10 @@ class WordHintGame(HangmanGame):
                 print(self.get_hint())
                 input("\nPress Enter to continue...")
                 continue
+            elif user_input == 'solve':
+                print(self.get_solver_hint())
+                input("\nPress Enter to continue...")
+                continue
             elif user_input == 'category':
                 print(self.show_category_hint())
                 input("\nPress Enter to continue...")
@@ -387,7 +435,7 @@ class WordHintGame(HangmanGame):
                     print(f"You already guessed '{letter}'. Try a different letter.")
                     input("\nPress Enter to continue...")
             else:
-                print("Please enter a single letter, 'hint', 'category', 'wordhint', or 'quit'.")
+                print("Please enter a single letter, 'hint', 'solve', 'category', 'wordhint', or 'quit'.")
                 input("\nPress Enter to continue...")
         
         # Game over
@@ -405,7 +453,7 @@ class WordHintGame(HangmanGame):
         
         return True
 
-def main():
+def main(words_path=str(DEFAULT_WORDS)):
     while True:
         print("\n" + "="*40)
         print("🎯 HANGMAN GAME 🎯")
@@ -417,10 +465,10 @@ def main():
         choice = input("\nChoose game mode (1-3): ").strip()
         
         if choice == '1':
-            game = HangmanGame()
+            game = HangmanGame(words_path)
             game.play()
         elif choice == '2':
-            game = WordHintGame()
+            game = WordHintGame(words_path)
             game.play()
         elif choice == '3':
             print("Thanks for playing! 👋")
@@ -430,7 +478,11 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        # An optional word list file replaces the built-in one
+        if len(sys.argv) > 1:
+            record_terminal('hangman', main, words_path=sys.argv[1])
+        else:
+            record_terminal('hangman', main)
     except KeyboardInterrupt:
         print("\nGame interrupted by user. Goodbye! 👋")
         sys.exit()
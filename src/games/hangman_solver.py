@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Hangman Solver
+Narrows a dictionary to the words matching a masked pattern and picks the most informative letter
+"""
+
+import argparse
+import math
+import random
+import string
+import time
+
+UNKNOWN = '_'
+
+def parse_pattern(pattern):
+    """'E _ E _ H A N T' (as display_word shows it) or E_E_HANT -> 'E_E_HANT'
+
+    display_word puts a space after every position, so a phrase's own
+    spaces survive: '_ _ _   _ _ _' -> '___ ___'.
+    """
+    pattern = pattern.upper()
+    if len(pattern) > 1 and not pattern[1::2].strip():
+        return pattern[::2]
+    return pattern
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+class LengthIndex:
+    """Words of one length, with a bitmask of word numbers per (position, letter) and per letter"""
+
+    def __init__(self, words):
+        self.words = words
+        self.all = (1 << len(words)) - 1
+        length = len(words[0])
+        positions = [{} for _ in range(length)]
+        for number, word in enumerate(words):
+            bit = 1 << number
+            for position, letter in enumerate(word):
+                positions[position][letter] = positions[position].get(letter, 0) | bit
+        self.positions = positions
+        # Words containing each letter anywhere (a phrase's spaces are never guessed)
+        self.contains = {}
+        for position in positions:
+            for letter, mask in position.items():
+                if letter != ' ':
+                    self.contains[letter] = self.contains.get(letter, 0) | mask
+
+    def words_in(self, mask):
+        words = self.words
+        found = []
+        number = 0
+        while mask:
+            # Skip runs of absent words a byte at a time
+            if not mask & 0xFF:
+                mask >>= 8
+                number += 8
+                continue
+            if mask & 1:
+                found.append(words[number])
+            mask >>= 1
+            number += 1
+        return found
+
+class HangmanSolver:
+    """Candidate words and best next guesses for Hangman, backed by a per-length bitmask index"""
+
+    def __init__(self, words):
+        by_length = {}
+        for word in set(word.upper() for word in words):
+            if word.replace(' ', '').isalpha():
+                by_length.setdefault(len(word), []).append(word)
+        self.indexes = {length: LengthIndex(sorted(group)) for length, group in by_length.items()}
+        self.size = sum(len(index.words) for index in self.indexes.values())
+
+    def candidate_mask(self, pattern, wrong_letters=()):
+        """(LengthIndex, bitmask of matching words) for a pattern and the letters known to be absent"""
+        pattern = parse_pattern(pattern)
+        index = self.indexes.get(len(pattern))
+        if index is None:
+            return None, 0
+
+        mask = index.all
+        # Phrase spaces are always shown, so like revealed letters they cannot hide
+        revealed = (set(pattern) | {' '}) - {UNKNOWN}
+        for position, letter in enumerate(pattern):
+            if letter != UNKNOWN:
+                mask &= index.positions[position].get(letter, 0)
+            else:
+                # A revealed letter shows every occurrence, so it cannot hide here
+                for shown in revealed:
+                    mask &= ~index.positions[position].get(shown, 0)
+            if not mask:
+                return index, 0
+        for letter in wrong_letters:
+            mask &= ~index.contains.get(letter.upper(), 0)
+        return index, mask
+
+    def candidates(self, pattern, wrong_letters=()):
+        index, mask = self.candidate_mask(pattern, wrong_letters)
+        return index.words_in(mask) if mask else []
+
+    def letter_counts(self, pattern, wrong_letters=()):
+        """{letter: number of candidate words containing it} for every unguessed letter"""
+        index, mask = self.candidate_mask(pattern, wrong_letters)
+        if not mask:
+            return {}
+        guessed = set(parse_pattern(pattern)) | set(letter.upper() for letter in wrong_letters)
+        counts = {}
+        for letter, contains in index.contains.items():
+            if letter not in guessed and contains & mask:
+                counts[letter] = popcount(contains & mask)
+        return counts
+
+    def letter_gains(self, pattern, wrong_letters=()):
+        """{letter: expected information gain in bits} for every unguessed letter that could appear"""
+        index, mask = self.candidate_mask(pattern, wrong_letters)
+        if not mask:
+            return {}
+        pattern = parse_pattern(pattern)
+        guessed = set(pattern) | set(letter.upper() for letter in wrong_letters)
+        hidden = [position for position, letter in enumerate(pattern) if letter == UNKNOWN]
+        total = popcount(mask)
+
+        gains = {}
+        for letter, contains in index.contains.items():
+            if letter in guessed or not contains & mask:
+                continue
+            # Split the candidates by where the letter would be revealed
+            groups = [mask]
+            for position in hidden:
+                at = index.positions[position].get(letter, 0)
+                if not at & mask:
+                    continue
+                split = []
+                for group in groups:
+                    hit = group & at
+                    if hit:
+                        split.append(hit)
+                    if group != hit:
+                        split.append(group & ~at)
+                groups = split
+            gain = 0.0
+            for group in groups:
+                share = popcount(group) / total
+                gain -= share * math.log2(share)
+            gains[letter] = gain
+        return gains
+
+    def best_letter(self, pattern, wrong_letters=()):
+        """(letter, bits) with the highest expected information gain, or (None, 0.0)"""
+        gains = self.letter_gains(pattern, wrong_letters)
+        if not gains:
+            return None, 0.0
+        letter = max(sorted(gains), key=gains.get)
+        return letter, gains[letter]
+
+    def solve(self, pattern, wrong_letters=()):
+        """(candidate words, best next letter) for a game in progress"""
+        return self.candidates(pattern, wrong_letters), self.best_letter(pattern, wrong_letters)[0]
+
+def generate_words(count, seed=0):
+    """Pseudo-English words with realistic letter frequencies, for benchmarking"""
+    rng = random.Random(seed)
+    letters = string.ascii_uppercase
+    weights = [8.2, 1.5, 2.8, 4.3, 12.7, 2.2, 2.0, 6.1, 7.0, 0.2, 0.8, 4.0, 2.4,
+               6.7, 7.5, 1.9, 0.1, 6.0, 6.3, 9.1, 2.8, 1.0, 2.4, 0.2, 2.0, 0.1]
+    words = set()
+    while len(words) < count:
+        length = min(15, max(3, int(rng.gauss(8, 2.5))))
+        words.add(''.join(rng.choices(letters, weights, k=length)))
+    return sorted(words)
+
+def benchmark(count=120000, queries=50):
+    """Time index building and solver queries over a large dictionary"""
+    words = generate_words(count)
+    start = time.perf_counter()
+    solver = HangmanSolver(words)
+    build_time = time.perf_counter() - start
+
+    rng = random.Random(1)
+    # Early-game queries: a couple of hits and a miss, against the biggest candidate sets
+    games = []
+    for word in rng.sample(words, queries):
+        shown = set(rng.sample(sorted(set(word)), min(2, len(set(word)))))
+        wrong = [letter for letter in 'QZXJ' if letter not in word][:1]
+        pattern = ' '.join(letter if letter in shown else UNKNOWN for letter in word)
+        games.append((pattern, wrong))
+
+    start = time.perf_counter()
+    counts = [len(solver.candidates(pattern, wrong)) for pattern, wrong in games]
+    candidate_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for pattern, wrong in games:
+        solver.best_letter(pattern, wrong)
+    letter_time = time.perf_counter() - start
+
+    blank_start = time.perf_counter()
+    letter, bits = solver.best_letter(UNKNOWN * 8)
+    blank_time = time.perf_counter() - blank_start
+
+    print(f"\n🔤 {solver.size:,} words, index built in {build_time:.2f} s")
+    print(f"Candidates:  {candidate_time * 1000 / queries:8.2f} ms/query "
+          f"(avg {sum(counts) / len(counts):,.0f} words)")
+    print(f"Best letter: {letter_time * 1000 / queries:8.2f} ms/query")
+    print(f"Blank 8-letter word: {letter} ({bits:.2f} bits) in {blank_time * 1000:.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Suggest Hangman guesses from a word list")
+    parser.add_argument('pattern', nargs='?', help="masked word, e.g. 'E _ E _ H A N T' or E_E_HANT")
+    parser.add_argument('--wrong', default='', help="letters already guessed wrong, e.g. QZ")
+    parser.add_argument('--words', help="word list file, one word or phrase per line (default: the game's words)")
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    if args.benchmark or not args.pattern:
+        benchmark()
+        return
+
+    if args.words:
+        with open(args.words, 'r', encoding='utf-8') as f:
+            words = [line.strip() for line in f if line.strip()]
+    else:
+        from hangman_words import load_words
+        pack = load_words()
+        words = [word for category in pack.categories for word in pack.words(category)]
+
+    solver = HangmanSolver(words)
+    candidates, letter = solver.solve(args.pattern, args.wrong)
+    print(f"{len(candidates)} candidate(s): {', '.join(candidates[:20])}"
+          f"{' ...' if len(candidates) > 20 else ''}")
+    if letter:
+        print(f"Best next letter: {letter}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Hangman Word Lists
+Compiles categorized word lists into a sorted, memory-mapped pack with an offset index
+"""
+
+import argparse
+import mmap
+import os
+import random
+import struct
+import tempfile
+import time
+from pathlib import Path
+
+DEFAULT_WORDS = Path(__file__).parent / "hangman_words.txt"
+
+# Compiled packs: magic, version, category count, and the source file's size
+# and mtime, so a stale pack is spotted without reading the word list
+PACK_MAGIC = b'HGWD'
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct('<4sBHQQ')
+CATEGORY_ENTRY = struct.Struct('<IQ')  # word count, offset of the category's offset index
+OFFSET = struct.Struct('<I')
+
+_loaded = {}
+
+class WordPack:
+    """Categorized words read straight out of a compiled pack
+
+    Each category's words are stored sorted, back to back, with an index
+    of byte offsets, so word n of a category is two integer reads and one
+    slice no matter how big the list is.
+    """
+
+    def __init__(self, data, source=None):
+        magic, version, category_count, _, _ = PACK_HEADER.unpack_from(data)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{source}: not a Hangman word pack")
+        self.data = data
+        self.source = source
+        self.categories = []
+        self.index = {}
+        offset = PACK_HEADER.size
+        for _ in range(category_count):
+            length = data[offset]
+            name = bytes(data[offset + 1:offset + 1 + length]).decode('utf-8')
+            offset += 1 + length
+            self.categories.append(name)
+            self.index[name] = CATEGORY_ENTRY.unpack_from(data, offset)
+            offset += CATEGORY_ENTRY.size
+
+    def __contains__(self, category):
+        return category in self.index
+
+    def count(self, category=None):
+        if category is None:
+            return sum(count for count, _ in self.index.values())
+        return self.index[category][0]
+
+    def word(self, category, number):
+        count, index_offset = self.index[category]
+        if not 0 <= number < count:
+            raise IndexError(f"{category} has {count} words")
+        start, end = struct.unpack_from('<II', self.data, index_offset + number * OFFSET.size)
+        return bytes(self.data[start:end]).decode('ascii')
+
+    def random_word(self, category, rng=random):
+        return self.word(category, rng.randrange(self.count(category)))
+
+    def words(self, category):
+        """Every word of a category, in sorted order"""
+        return [self.word(category, number) for number in range(self.count(category))]
+
+def parse_words(text, source='<words>'):
+    """Parse and validate a word list; returns {category: sorted unique words}"""
+    categories = {}
+    words = None
+    for line_no, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        where = f"{source}:{line_no}"
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('['):
+            name = line.strip('[]').strip().lower()
+            if not line.endswith(']') or not name or len(name.encode('utf-8')) > 255:
+                raise ValueError(f"{where}: expected '[category]'")
+            if name in categories:
+                raise ValueError(f"{where}: category '{name}' given twice")
+            words = categories[name] = set()
+        elif words is None:
+            raise ValueError(f"{where}: word outside a category")
+        else:
+            # Phrases keep a single space between their words
+            phrase = ' '.join(line.split())
+            if not (phrase.isascii() and phrase.replace(' ', '').isalpha()):
+                raise ValueError(f"{where}: '{line}' is not a word or phrase of letters A-Z")
+            words.add(phrase.lower())
+
+    if not categories:
+        raise ValueError(f"{source}: no categories defined")
+    for name, words in categories.items():
+        if not words:
+            raise ValueError(f"{source}: category '{name}' has no words")
+    return {name: sorted(words) for name, words in categories.items()}
+
+def encode_words(categories, stamp=(0, 0)):
+    """Pack {category: words} as header, category table, then each category's offsets and words"""
+    table_size = sum(1 + len(name.encode('utf-8')) + CATEGORY_ENTRY.size for name in categories)
+    position = PACK_HEADER.size + table_size
+    table = bytearray()
+    body = bytearray()
+    for name, words in categories.items():
+        index_offset = position + len(body)
+        encoded = name.encode('utf-8')
+        table += bytes([len(encoded)]) + encoded + CATEGORY_ENTRY.pack(len(words), index_offset)
+
+        # Offsets of every word plus the end of the last one
+        start = index_offset + (len(words) + 1) * OFFSET.size
+        offsets = [start]
+        for word in words:
+            start += len(word)
+            offsets.append(start)
+        body += struct.pack(f'<{len(offsets)}I', *offsets)
+        body += ''.join(words).encode('ascii')
+
+    if PACK_HEADER.size + len(table) + len(body) > 0xFFFFFFFF:
+        raise ValueError("Word lists are too large for a pack (4 GB limit)")
+    header = PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(categories), *stamp)
+    return header + bytes(table) + bytes(body)
+
+def cache_path(path):
+    # Compiled packs sit with the bytecode, so they never end up in version control
+    return path.parent / '__pycache__' / f"{path.stem}.words"
+
+def source_stamp(path):
+    info = os.stat(path)
+    return info.st_size, info.st_mtime_ns
+
+def map_pack(path, stamp):
+    """Map a compiled pack, or return None if it is missing or out of date"""
+    try:
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(data) < PACK_HEADER.size or PACK_HEADER.unpack_from(data)[3:] != stamp:
+        data.close()
+        return None
+    return data
+
+def write_pack(path, packed):
+    """Write a pack under a temporary name and rename it into place
+
+    The rename is atomic, so another process opening the pack sees either
+    the old file or the complete new one, never a partly written one.
+    """
+    fd, temp = tempfile.mkstemp(prefix=path.name + '.', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(packed)
+        os.replace(temp, path)
+    except OSError:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+
+def load_words(path=DEFAULT_WORDS):
+    """Open a word list through its compiled pack, compiling it first if needed"""
+    path = Path(path).resolve()
+    stamp = source_stamp(path)
+    cached = _loaded.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    compiled = cache_path(path)
+    pack = None
+    data = map_pack(compiled, stamp)
+    if data is not None:
+        try:
+            pack = WordPack(data, str(path))
+        except (ValueError, IndexError, struct.error):
+            data.close()  # Damaged or foreign pack: compile it again
+    if pack is None:
+        categories = parse_words(path.read_text(encoding='utf-8'), str(path))
+        packed = encode_words(categories, stamp)
+        data = None
+        try:
+            compiled.parent.mkdir(exist_ok=True)
+            write_pack(compiled, packed)
+            data = map_pack(compiled, stamp)
+        except OSError:
+            pass
+        if data is None:
+            data = packed  # Read-only install: use the pack from memory this run
+        pack = WordPack(data, str(path))
+    _loaded[path] = (stamp, pack)
+    return pack
+
+def benchmark(sizes=(10000, 100000, 1000000), picks=100000):
+    """Compare opening a compiled pack with reading the word list into Python lists"""
+    from hangman_solver import generate_words
+
+    print("\n📚 Words      Text MB  Compile(s)  Open pack(ms)  Read lists(ms)  Random word(us)")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            words = generate_words(size)
+            path = Path(directory) / f"words{size}.txt"
+            lines = []
+            for number in range(6):
+                lines.append(f"[category{number}]")
+                lines.extend(words[number::6])
+            path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+            start = time.perf_counter()
+            load_words(path)
+            compile_time = time.perf_counter() - start
+
+            _loaded.clear()
+            start = time.perf_counter()
+            pack = load_words(path)
+            open_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            parse_words(path.read_text(encoding='utf-8'))
+            read_time = time.perf_counter() - start
+
+            rng = random.Random(1)
+            start = time.perf_counter()
+            for _ in range(picks):
+                pack.random_word('category3', rng)
+            pick_time = time.perf_counter() - start
+
+            print(f"{size:10,d}  {path.stat().st_size / 1e6:7.1f}  {compile_time:10.2f}  "
+                  f"{open_time * 1000:13.3f}  {read_time * 1000:14.1f}  {pick_time * 1e6 / picks:15.2f}")
+            if isinstance(pack.data, mmap.mmap):
+                pack.data.close()
+            _loaded.clear()
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate, compile and benchmark Hangman word lists")
+    parser.add_argument('words', nargs='?', default=str(DEFAULT_WORDS), help="word list to compile")
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+    else:
+        pack = load_words(args.words)
+        print(f"✅ {args.words}: {pack.count():,} words in {len(pack.categories)} categories")
+        for category in pack.categories:
+            print(f"   {category:<20s} {pack.count(category):9,d} words")
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@ import random
 import sys
 import os
 import time
+from replay import record_terminal
 
 class MemoryMatchGame:
     def __init__(self):
@@ -513,7 +514,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        record_terminal('memory_match', main)
     except KeyboardInterrupt:
         print("\nGame interrupted by user. Goodbye! 🧠")
         sys.exit()
@@ -1,6 +1,7 @@
 import random
 import sys
 import time
+from replay import record_terminal
 
 class NumberGuessingGame:
     def __init__(self):
@@ -308,7 +309,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        record_terminal('number_guessing', main)
     except KeyboardInterrupt:
         print("\nGame interrupted by user. Goodbye! 👋")
         sys.exit()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Batch Pong Simulator
+Advances thousands of independent headless Pong games at once with NumPy
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pong_game import (WIDTH, HEIGHT, BALL_SIZE, PADDLE_WIDTH, PADDLE_HEIGHT,
+                       PADDLE_SPEED, BALL_SPEED_X, BALL_SPEED_Y, AI_DIFFICULTIES, PongGame)
+
+PADDLE1_X = 50
+PADDLE2_X = WIDTH - 50 - PADDLE_WIDTH
+
+def idle_policy(batch, side):
+    return np.zeros(batch.games)
+
+def chase_policy(batch, side):
+    """Vectorized PongGame.ai_player: follow the ball with a 10 px dead zone"""
+    paddle_y = batch.paddle1_y if side == 1 else batch.paddle2_y
+    paddle_center = paddle_y + PADDLE_HEIGHT // 2
+    ball_center = batch.ball_y + BALL_SIZE // 2
+    speed = np.zeros(batch.games)
+    speed[paddle_center < ball_center - 10] = PADDLE_SPEED
+    speed[paddle_center > ball_center + 10] = -PADDLE_SPEED
+    return speed
+
+def make_predictive_policy(difficulty):
+    """Vectorized PredictiveAI: aim at the folded intercept after a reaction delay"""
+    settings = AI_DIFFICULTIES[difficulty]
+    span = HEIGHT - BALL_SIZE
+
+    def predictive_policy(batch, side):
+        key = ('predict', difficulty, side)
+        state = batch.policy_state.get(key)
+        if state is None:
+            state = {
+                'direction': np.zeros(batch.games, dtype=bool),
+                'reaction': np.zeros(batch.games),
+                'planned': np.zeros(batch.games, dtype=bool),
+                'target': np.full(batch.games, HEIGHT / 2)
+            }
+            batch.policy_state[key] = state
+
+        # Re-plan when the ball turns around or is served; wall bounces are folded in
+        direction = batch.speed_x > 0
+        changed = (direction != state['direction']) | batch.served
+        state['direction'][:] = direction
+        state['reaction'][changed] = settings['reaction_frames']
+        state['planned'][changed] = False
+
+        waiting = ~state['planned'] & (state['reaction'] > 0)
+        state['reaction'][waiting] -= batch.scale
+        ready = ~state['planned'] & ~waiting
+        if ready.any():
+            contact_x = PADDLE1_X + PADDLE_WIDTH if side == 1 else PADDLE2_X - BALL_SIZE
+            x = batch.ball_x[ready]
+            vx = batch.speed_x[ready]
+            towards = (contact_x - x) * vx > 0
+            raw_y = batch.ball_y[ready] + batch.speed_y[ready] * (contact_x - x) / np.where(vx == 0, 1, vx)
+            folded = raw_y % (2 * span)
+            folded = np.where(folded <= span, folded, 2 * span - folded)
+            error = batch.rng.uniform(-settings['error'], settings['error'], folded.shape) \
+                if settings['error'] else 0
+            state['target'][ready] = np.where(towards, folded + BALL_SIZE / 2 + error, HEIGHT / 2)
+            state['planned'][ready] = True
+
+        paddle_y = batch.paddle1_y if side == 1 else batch.paddle2_y
+        distance = state['target'] - (paddle_y + PADDLE_HEIGHT / 2)
+        return np.clip(distance / batch.scale, -PADDLE_SPEED, PADDLE_SPEED)
+
+    return predictive_policy
+
+POLICIES = {
+    'idle': idle_policy,
+    'chase': chase_policy,
+}
+for _difficulty in AI_DIFFICULTIES:
+    POLICIES[f'predict-{_difficulty}'] = make_predictive_policy(_difficulty)
+
+class PongBatch:
+    def __init__(self, games, seed=None, scale=1.0):
+        self.games = games
+        self.scale = scale
+        self.rng = np.random.default_rng(seed)
+
+        self.ball_x = np.empty(games)
+        self.ball_y = np.empty(games)
+        self.speed_x = np.empty(games)
+        self.speed_y = np.empty(games)
+        self.prev_x = np.empty(games)
+        self.prev_y = np.empty(games)
+        self.reset_balls(np.ones(games, dtype=bool))
+
+        self.paddle1_y = np.full(games, HEIGHT // 2 - PADDLE_HEIGHT // 2, dtype=float)
+        self.paddle2_y = self.paddle1_y.copy()
+        self.score1 = np.zeros(games, dtype=np.int64)
+        self.score2 = np.zeros(games, dtype=np.int64)
+        self.paddle_hits = np.zeros(games, dtype=np.int64)
+        self.served = np.ones(games, dtype=bool)
+        self.policy_state = {}
+        self.steps = 0
+
+    def reset_balls(self, mask):
+        count = int(mask.sum())
+        if not count:
+            return
+        self.ball_x[mask] = WIDTH // 2
+        self.ball_y[mask] = HEIGHT // 2
+        self.speed_x[mask] = self.rng.choice([-BALL_SPEED_X, BALL_SPEED_X], count)
+        self.speed_y[mask] = self.rng.choice([-BALL_SPEED_Y, BALL_SPEED_Y], count)
+
+    def bounce_off_paddle(self, paddle_x, paddle_y, paddle_prev_y, towards):
+        """Vectorized swept test of PongGame.handle_collisions for balls moving towards a paddle"""
+        moving = self.speed_x * towards > 0
+        # Sweep each ball's step relative to the paddle, as swept_aabb does
+        dx = self.ball_x - self.prev_x
+        dy = (self.ball_y - self.prev_y) - (paddle_y - paddle_prev_y)
+        if towards > 0:
+            near = paddle_x - (self.prev_x + BALL_SIZE)
+            far = paddle_x + PADDLE_WIDTH - self.prev_x
+        else:
+            near = paddle_x + PADDLE_WIDTH - self.prev_x
+            far = paddle_x - (self.prev_x + BALL_SIZE)
+        above = paddle_prev_y - (self.prev_y + BALL_SIZE)
+        below = paddle_prev_y + PADDLE_HEIGHT - self.prev_y
+        with np.errstate(divide='ignore', invalid='ignore'):
+            tx_entry = near / dx
+            tx_exit = far / dx
+            ty_entry = np.where(dy > 0, above / dy, below / dy)
+            ty_exit = np.where(dy > 0, below / dy, above / dy)
+        # Not moving vertically: always or never overlapping in y
+        still = dy == 0
+        overlapping = (above < 0) & (below > 0)
+        ty_entry[still] = np.where(overlapping[still], -np.inf, np.inf)
+        ty_exit[still] = np.where(overlapping[still], np.inf, -np.inf)
+
+        entry = np.maximum(tx_entry, ty_entry)
+        hit = (moving & (entry < np.minimum(tx_exit, ty_exit)) & (entry >= 0) & (entry <= 1))
+        face = hit & (tx_entry > ty_entry)
+        glance = hit & ~face
+
+        # Put the ball back on the paddle face and bounce the rest of the step
+        self.ball_x[face] = 2 * (self.prev_x[face] + dx[face] * entry[face]) - self.ball_x[face]
+        # Glancing hits on the paddle's end push the ball off it, still travelling the same way
+        if glance.any():
+            down = glance & (dy > 0)
+            up = glance & (dy <= 0)
+            self.ball_y[down] = paddle_y[down] - BALL_SIZE
+            self.speed_y[down] = -np.abs(self.speed_y[down])
+            self.ball_y[up] = paddle_y[up] + PADDLE_HEIGHT
+            self.speed_y[up] = np.abs(self.speed_y[up])
+
+        # Balls already overlapping the paddle bounce too
+        overlap = (moving & ~hit &
+                   (self.ball_x < paddle_x + PADDLE_WIDTH) & (self.ball_x + BALL_SIZE > paddle_x) &
+                   (self.ball_y < paddle_y + PADDLE_HEIGHT) & (self.ball_y + BALL_SIZE > paddle_y))
+        bounced = face | overlap
+        count = int(bounced.sum())
+        if count:
+            self.speed_x[bounced] = -self.speed_x[bounced]
+            # Add some randomness to the bounce
+            self.speed_y[bounced] += self.rng.integers(-2, 3, count)
+            self.paddle_hits += bounced
+
+    def step(self, policy1=idle_policy, policy2=chase_policy):
+        scale = self.scale
+
+        # Move balls and bounce off top and bottom
+        self.prev_x[:] = self.ball_x
+        self.prev_y[:] = self.ball_y
+        self.ball_x += self.speed_x * scale
+        self.ball_y += self.speed_y * scale
+        top = self.ball_y <= 0
+        bottom = self.ball_y >= HEIGHT - BALL_SIZE
+        self.ball_y[top] = 0
+        self.speed_y[top] = np.abs(self.speed_y[top])
+        self.ball_y[bottom] = HEIGHT - BALL_SIZE
+        self.speed_y[bottom] = -np.abs(self.speed_y[bottom])
+
+        # Move paddles, keeping them on screen
+        paddle1_prev_y = self.paddle1_y.copy()
+        paddle2_prev_y = self.paddle2_y.copy()
+        self.paddle1_y += policy1(self, 1) * scale
+        self.paddle2_y += policy2(self, 2) * scale
+        np.clip(self.paddle1_y, 0, HEIGHT - PADDLE_HEIGHT, out=self.paddle1_y)
+        np.clip(self.paddle2_y, 0, HEIGHT - PADDLE_HEIGHT, out=self.paddle2_y)
+
+        self.bounce_off_paddle(PADDLE1_X, self.paddle1_y, paddle1_prev_y, -1)
+        self.bounce_off_paddle(PADDLE2_X, self.paddle2_y, paddle2_prev_y, 1)
+
+        # Score and serve again
+        left_out = self.ball_x < 0
+        right_out = self.ball_x > WIDTH
+        self.score2 += left_out
+        self.score1 += right_out
+        self.served = left_out | right_out
+        self.reset_balls(self.served)
+        self.steps += 1
+
+    def run(self, steps, policy1=idle_policy, policy2=chase_policy):
+        for _ in range(steps):
+            self.step(policy1, policy2)
+
+def get_policy(name):
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy '{name}'. Choose from: {', '.join(sorted(POLICIES))}")
+    return POLICIES[name]
+
+def benchmark(games=10000, steps=3600, seed=0, left='chase', right='chase'):
+    batch = PongBatch(games, seed)
+    policy1 = get_policy(left)
+    policy2 = get_policy(right)
+
+    start = time.perf_counter()
+    batch.run(steps, policy1, policy2)
+    elapsed = time.perf_counter() - start
+
+    ball_steps = games * steps
+    points = int(batch.score1.sum() + batch.score2.sum())
+    print(f"\n🏓 Pong batch: {games:,} games x {steps:,} steps in {elapsed:.2f}s")
+    print(f"Ball-steps/sec: {ball_steps / elapsed:,.0f}")
+    print(f"Points: left ({left}) {int(batch.score1.sum()):,} | "
+          f"right ({right}) {int(batch.score2.sum()):,}")
+    if points:
+        print(f"Right win rate per point: {batch.score2.sum() / points:.1%}")
+        print(f"Average rally length: {batch.paddle_hits.sum() / points:.2f} paddle hits")
+    return batch
+
+def benchmark_ai_cost(steps=100000, seed=0):
+    """Time one PongGame.ai_player call for the chasing and predictive AIs"""
+    import random
+
+    print(f"\n🤖 AI cost per physics step ({steps:,} steps)")
+    for difficulty in (None, 'medium', 'perfect'):
+        random.seed(seed)
+        game = PongGame(difficulty)
+        elapsed = 0.0
+        for _ in range(steps):
+            game.ball.move()
+            game.player2.move()
+            game.handle_collisions()
+            game.check_score()
+            start = time.perf_counter()
+            game.ai_player()
+            elapsed += time.perf_counter() - start
+        name = f"predictive ({difficulty})" if difficulty else "chase"
+        recomputes = f", {game.ai.recomputes:,} intercept solves" if game.ai else ""
+        print(f"{name:<22s} {elapsed * 1e9 / steps:7.0f} ns/step{recomputes}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate many headless Pong games with NumPy")
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--steps', type=int, default=3600)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--left', default='chase', choices=sorted(POLICIES))
+    parser.add_argument('--right', default='chase', choices=sorted(POLICIES))
+    parser.add_argument('--ai-cost', action='store_true', help="time the scalar AIs per step")
+    args = parser.parse_args()
+    if args.ai_cost:
+        benchmark_ai_cost(seed=args.seed)
+    else:
+        benchmark(args.games, args.steps, args.seed, args.left, args.right)
+
+if __name__ == '__main__':
+    main()
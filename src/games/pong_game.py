@@ -1,6 +1,9 @@
 import pygame
 import sys
 import random
+from collision import swept_aabb
+from text_cache import render_text
+from replay import ReplayRecorder
 
 # Initialize Pygame
 pygame.init()
@@ -13,42 +16,87 @@ PADDLE_SPEED = 5
 BALL_SPEED_X = 7
 BALL_SPEED_Y = 7
 
+# Speeds above are pixels per 60 Hz frame; physics runs on a fixed, finer step
+BASE_HZ = 60
+PHYSICS_HZ = 240
+PHYSICS_DT = 1.0 / PHYSICS_HZ
+STEP_SCALE = BASE_HZ / PHYSICS_HZ
+MAX_FRAME_TIME = 0.25  # Drop simulation time after long stalls
+MAX_RENDER_FPS = 240
+
+# Paddle commands, as recorded in replays
+PADDLE_COMMANDS = {'up': -PADDLE_SPEED, 'down': PADDLE_SPEED, 'stop': 0}
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 
+# Predictive AI settings: reaction delay in 60 Hz frames, aiming error in pixels
+AI_DIFFICULTIES = {
+    'easy': {'reaction_frames': 30, 'error': 110},
+    'medium': {'reaction_frames': 18, 'error': 80},
+    'hard': {'reaction_frames': 8, 'error': 65},
+    'perfect': {'reaction_frames': 0, 'error': 0}
+}
+
+def predict_intercept(x, y, speed_x, speed_y, target_x):
+    """Return the ball's y when it reaches target_x, folding in wall bounces"""
+    if speed_x == 0 or (target_x - x) * speed_x < 0:
+        return None
+    
+    raw_y = y + speed_y * (target_x - x) / speed_x
+    # Bounces between 0 and span mirror the straight-line path
+    span = HEIGHT - BALL_SIZE
+    folded = raw_y % (2 * span)
+    return folded if folded <= span else 2 * span - folded
+
 class Ball:
     def __init__(self):
         self.x = WIDTH // 2
         self.y = HEIGHT // 2
         self.speed_x = random.choice([-BALL_SPEED_X, BALL_SPEED_X])
         self.speed_y = random.choice([-BALL_SPEED_Y, BALL_SPEED_Y])
+        self.prev_x = self.x
+        self.prev_y = self.y
         
-    def move(self):
-        self.x += self.speed_x
-        self.y += self.speed_y
+    def move(self, scale=1.0):
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.x += self.speed_x * scale
+        self.y += self.speed_y * scale
         
         # Bounce off top and bottom
-        if self.y <= 0 or self.y >= HEIGHT - BALL_SIZE:
-            self.speed_y = -self.speed_y
+        if self.y <= 0:
+            self.y = 0
+            self.speed_y = abs(self.speed_y)
+        elif self.y >= HEIGHT - BALL_SIZE:
+            self.y = HEIGHT - BALL_SIZE
+            self.speed_y = -abs(self.speed_y)
             
     def reset(self):
         self.x = WIDTH // 2
         self.y = HEIGHT // 2
         self.speed_x = random.choice([-BALL_SPEED_X, BALL_SPEED_X])
         self.speed_y = random.choice([-BALL_SPEED_Y, BALL_SPEED_Y])
+        # Don't interpolate across the jump back to the centre
+        self.prev_x = self.x
+        self.prev_y = self.y
         
-    def draw(self, screen):
-        pygame.draw.rect(screen, WHITE, (self.x, self.y, BALL_SIZE, BALL_SIZE))
+    def draw(self, screen, alpha=1.0):
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        pygame.draw.rect(screen, WHITE, (round(x), round(y), BALL_SIZE, BALL_SIZE))
 
 class Paddle:
     def __init__(self, x, y):
         self.x = x
         self.y = y
+        self.prev_y = y
         self.speed = 0
         
-    def move(self):
-        self.y += self.speed
+    def move(self, scale=1.0):
+        self.prev_y = self.y
+        self.y += self.speed * scale
         
         # Keep paddle on screen
         if self.y < 0:
@@ -56,46 +104,138 @@ class Paddle:
         elif self.y > HEIGHT - PADDLE_HEIGHT:
             self.y = HEIGHT - PADDLE_HEIGHT
             
-    def draw(self, screen):
-        pygame.draw.rect(screen, WHITE, (self.x, self.y, PADDLE_WIDTH, PADDLE_HEIGHT))
+    def draw(self, screen, alpha=1.0):
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        pygame.draw.rect(screen, WHITE, (self.x, round(y), PADDLE_WIDTH, PADDLE_HEIGHT))
         
     def get_rect(self):
         return pygame.Rect(self.x, self.y, PADDLE_WIDTH, PADDLE_HEIGHT)
 
+class PredictiveAI:
+    """Paddle controller that aims at the ball's predicted intercept"""
+    
+    def __init__(self, paddle, difficulty='medium'):
+        settings = AI_DIFFICULTIES[difficulty]
+        self.paddle = paddle
+        self.difficulty = difficulty
+        self.reaction_frames = settings['reaction_frames']
+        self.error = settings['error']
+        # Face of the paddle the ball's near edge touches
+        if paddle.x < WIDTH // 2:
+            self.contact_x = paddle.x + PADDLE_WIDTH
+        else:
+            self.contact_x = paddle.x - BALL_SIZE
+        self.direction = None
+        self.reaction_left = 0
+        self.planned = False
+        self.target_y = HEIGHT // 2
+        # Paddle top that centres the paddle on target_y
+        self.target_top = self.target_y - PADDLE_HEIGHT / 2
+        self.recomputes = 0
+    
+    def reset(self):
+        """Forget the current plan, e.g. after the ball is served again"""
+        self.direction = None
+    
+    def update(self, ball, scale=1.0):
+        # Only re-plan when the ball turns around (paddle hits, serves);
+        # predict_intercept already folds in the wall bounces
+        direction = ball.speed_x > 0
+        if direction is not self.direction:
+            self.direction = direction
+            self.reaction_left = self.reaction_frames
+            self.planned = False
+        
+        if not self.planned:
+            if self.reaction_left > 0:
+                self.reaction_left -= scale
+            else:
+                self.plan(ball)
+        
+        # Head for the target, arriving exactly on it
+        distance = self.target_top - self.paddle.y
+        if distance > PADDLE_SPEED * scale:
+            self.paddle.speed = PADDLE_SPEED
+        elif distance < -PADDLE_SPEED * scale:
+            self.paddle.speed = -PADDLE_SPEED
+        else:
+            self.paddle.speed = distance / scale
+    
+    def plan(self, ball):
+        self.planned = True
+        self.recomputes += 1
+        intercept = predict_intercept(ball.x, ball.y, ball.speed_x, ball.speed_y, self.contact_x)
+        if intercept is None:
+            # Ball is heading away: drift back to the middle
+            self.target_y = HEIGHT // 2
+        else:
+            self.target_y = intercept + BALL_SIZE / 2 + random.uniform(-self.error, self.error)
+        self.target_top = self.target_y - PADDLE_HEIGHT / 2
+
 class PongGame:
-    def __init__(self):
+    def __init__(self, ai_difficulty='medium', two_player=False):
         self.ball = Ball()
         self.player1 = Paddle(50, HEIGHT // 2 - PADDLE_HEIGHT // 2)
         self.player2 = Paddle(WIDTH - 50 - PADDLE_WIDTH, HEIGHT // 2 - PADDLE_HEIGHT // 2)
         self.score1 = 0
         self.score2 = 0
-        self.font = pygame.font.Font(None, 74)
+        self.steps = 0
+        self.two_player = two_player
+        # None keeps the original ball-chasing AI
+        self.ai = PredictiveAI(self.player2, ai_difficulty) if ai_difficulty else None
         
     def handle_collisions(self):
-        ball_rect = pygame.Rect(self.ball.x, self.ball.y, BALL_SIZE, BALL_SIZE)
+        ball = self.ball
+        ball_rect = pygame.Rect(ball.x, ball.y, BALL_SIZE, BALL_SIZE)
         
         # Check collision with paddles
-        if ball_rect.colliderect(self.player1.get_rect()):
-            if self.ball.speed_x < 0:  # Only bounce if ball is moving towards paddle
-                self.ball.speed_x = -self.ball.speed_x
-                # Add some randomness to the bounce
-                self.ball.speed_y += random.randint(-2, 2)
-                
-        if ball_rect.colliderect(self.player2.get_rect()):
-            if self.ball.speed_x > 0:  # Only bounce if ball is moving towards paddle
-                self.ball.speed_x = -self.ball.speed_x
-                # Add some randomness to the bounce
-                self.ball.speed_y += random.randint(-2, 2)
+        for paddle, direction in ((self.player1, -1), (self.player2, 1)):
+            if ball.speed_x * direction <= 0:  # Only bounce if ball is moving towards paddle
+                continue
+            
+            # Sweep the ball's whole step relative to the paddle so neither can skip the other
+            velocity = (ball.x - ball.prev_x, (ball.y - ball.prev_y) - (paddle.y - paddle.prev_y))
+            hit = swept_aabb((ball.prev_x, ball.prev_y, BALL_SIZE, BALL_SIZE), velocity,
+                             (paddle.x, paddle.prev_y, PADDLE_WIDTH, PADDLE_HEIGHT))
+            
+            if hit is not None:
+                time_of_impact, normal_x, normal_y = hit
+                if normal_x:
+                    # Put the ball back on the paddle face and bounce the rest of the step
+                    contact_x = ball.prev_x + velocity[0] * time_of_impact
+                    ball.x = 2 * contact_x - ball.x
+                else:
+                    # Glancing hit on the paddle's end: push the ball off it
+                    if normal_y < 0:
+                        ball.y = paddle.y - BALL_SIZE
+                    else:
+                        ball.y = paddle.y + PADDLE_HEIGHT
+                    ball.speed_y = normal_y * abs(ball.speed_y)
+                    # It keeps travelling the same way, past the paddle
+                    continue
+            elif not ball_rect.colliderect(paddle.get_rect()):
+                continue
+            
+            ball.speed_x = -ball.speed_x
+            # Add some randomness to the bounce
+            ball.speed_y += random.randint(-2, 2)
                 
     def check_score(self):
         if self.ball.x < 0:
             self.score2 += 1
-            self.ball.reset()
         elif self.ball.x > WIDTH:
             self.score1 += 1
-            self.ball.reset()
+        else:
+            return
+        self.ball.reset()
+        if self.ai:
+            self.ai.reset()
             
-    def ai_player(self):
+    def ai_player(self, scale=1.0):
+        if self.ai:
+            self.ai.update(self.ball, scale)
+            return
+        
         # Simple AI for player 2
         paddle_center = self.player2.y + PADDLE_HEIGHT // 2
         ball_center = self.ball.y + BALL_SIZE // 2
@@ -107,15 +247,26 @@ class PongGame:
         else:
             self.player2.speed = 0
             
-    def update(self):
-        self.ball.move()
-        self.player1.move()
-        self.player2.move()
+    def steer(self, player, command):
+        paddle = self.player1 if player == 1 else self.player2
+        paddle.speed = PADDLE_COMMANDS[command]
+        
+    def result(self):
+        return {'score1': self.score1, 'score2': self.score2}
+            
+    def update(self, scale=1.0):
+        """Advance the simulation by one step of scale 60 Hz frames"""
+        self.steps += 1
+        self.ball.move(scale)
+        self.player1.move(scale)
+        self.player2.move(scale)
         self.handle_collisions()
         self.check_score()
-        self.ai_player()
+        if not self.two_player:
+            self.ai_player(scale)
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        """Draw the game, blending alpha of the way from the previous physics step"""
         screen.fill(BLACK)
         
         # Draw center line
@@ -124,55 +275,78 @@ class PongGame:
                 pygame.draw.rect(screen, WHITE, (WIDTH // 2 - 2, i, 4, 10))
         
         # Draw game objects
-        self.ball.draw(screen)
-        self.player1.draw(screen)
-        self.player2.draw(screen)
+        self.ball.draw(screen, alpha)
+        self.player1.draw(screen, alpha)
+        self.player2.draw(screen, alpha)
         
         # Draw scores
-        score1_text = self.font.render(str(self.score1), True, WHITE)
-        score2_text = self.font.render(str(self.score2), True, WHITE)
+        score1_text = render_text(str(self.score1), 74, WHITE)
+        score2_text = render_text(str(self.score2), 74, WHITE)
         
         screen.blit(score1_text, (WIDTH // 4, 50))
         screen.blit(score2_text, (WIDTH * 3 // 4, 50))
         
         # Draw instructions
-        font_small = pygame.font.Font(None, 36)
-        instruction_text = font_small.render('W/S to move paddle', True, WHITE)
+        instruction_text = render_text('W/S to move paddle', 36, WHITE)
         screen.blit(instruction_text, (10, HEIGHT - 40))
 
-def main():
+def main(ai_difficulty='medium', two_player=False):
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption('Pong')
     clock = pygame.time.Clock()
-    game = PongGame()
+    # Seed before the game exists so its serve is part of the replay
+    recorder = ReplayRecorder('pong', ai_difficulty=ai_difficulty, two_player=two_player)
+    game = PongGame(ai_difficulty, two_player)
+    accumulator = 0.0
+    commands = {1: 'stop', 2: 'stop'}
+    
+    def steer(player, command):
+        # Only changes are recorded, keyed to the next physics step
+        if commands[player] != command:
+            commands[player] = command
+            recorder.record(game.steps, f"{command}{player}")
+        game.steer(player, command)
     
     while True:
+        frame_time = min(clock.tick(MAX_RENDER_FPS) / 1000.0, MAX_FRAME_TIME)
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                recorder.finish(steps=game.steps, result=game.result())
                 pygame.quit()
                 sys.exit()
                 
         # Handle input
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_w]:
-            game.player1.speed = -PADDLE_SPEED
-        elif keys[pygame.K_s]:
-            game.player1.speed = PADDLE_SPEED
-        else:
-            game.player1.speed = 0
+        steer(1, 'up' if keys[pygame.K_w] else 'down' if keys[pygame.K_s] else 'stop')
             
-        # Optional: Two player mode
-        if keys[pygame.K_UP]:
-            game.player2.speed = -PADDLE_SPEED
-        elif keys[pygame.K_DOWN]:
-            game.player2.speed = PADDLE_SPEED
-        # Comment out the ai_player() call in update() for two player mode
-        
-        game.update()
-        game.draw(screen)
+        # Two player mode (python pong_game.py two); see pong_net.py for network play
+        if game.two_player:
+            steer(2, 'up' if keys[pygame.K_UP] else 'down' if keys[pygame.K_DOWN] else 'stop')
+        
+        # Run physics at a fixed rate however fast we are rendering
+        accumulator += frame_time
+        while accumulator >= PHYSICS_DT:
+            game.update(STEP_SCALE)
+            accumulator -= PHYSICS_DT
+        
+        game.draw(screen, accumulator / PHYSICS_DT)
         pygame.display.flip()
-        clock.tick(60)
+
+def play_replay(replay):
+    """Re-run a recorded match headless, as fast as possible"""
+    random.seed(replay.seed)
+    game = PongGame(replay.meta['ai_difficulty'], replay.meta['two_player'])
+    commands = replay.inputs_by_tick()
+    
+    while game.steps < replay.meta['steps']:
+        for command in commands.get(game.steps, ()):
+            game.steer(int(command[-1]), command[:-1])
+        game.update(STEP_SCALE)
+    return game.result()
 
 if __name__ == '__main__':
-    main()
+    # python pong_game.py [easy|medium|hard|perfect|two]
+    mode = sys.argv[1] if len(sys.argv) > 1 else 'medium'
+    main(mode if mode in AI_DIFFICULTIES else 'medium', two_player=(mode == 'two'))
 
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Networked Pong
+Authoritative asyncio server with predicting, interpolating clients over TCP
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from collections import deque
+
+import pygame
+
+from pong_game import (WIDTH, HEIGHT, BALL_SIZE, PADDLE_WIDTH, PADDLE_HEIGHT, PADDLE_SPEED,
+                       PHYSICS_HZ, PHYSICS_DT, STEP_SCALE, Paddle, PongGame)
+
+DEFAULT_PORT = 5555
+SNAPSHOT_HZ = 30
+INPUT_HZ = 60
+STEPS_PER_INPUT = PHYSICS_HZ // INPUT_HZ
+MAX_PENDING_INPUTS = INPUT_HZ  # Unacknowledged inputs a client may have in flight (one second)
+INTERPOLATION_DELAY = 2.5 / SNAPSHOT_HZ  # Render remote objects this far in the past
+PADDLE_X = {1: 50, 2: WIDTH - 50 - PADDLE_WIDTH}
+
+class LossyLink:
+    """Line-delimited JSON sender with optional simulated latency, jitter and loss"""
+
+    def __init__(self, writer, latency=0.0, jitter=0.0, loss=0.0, rng=None):
+        self.writer = writer
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = rng or random.Random()
+        self.sent = 0
+        self.dropped = 0
+
+    def send(self, message, reliable=False):
+        # Unreliable messages (inputs, snapshots) may be dropped like UDP datagrams
+        if not reliable and self.rng.random() < self.loss:
+            self.dropped += 1
+            return
+        data = (json.dumps(message, separators=(',', ':')) + '\n').encode()
+        delay = self.latency + self.rng.uniform(0, self.jitter)
+        self.sent += 1
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self._write, data)
+        else:
+            self._write(data)
+
+    def _write(self, data):
+        if not self.writer.is_closing():
+            self.writer.write(data)
+
+    def close(self):
+        self.writer.close()
+
+class PongServer:
+    """Owns the only real PongGame; clients just send paddle directions"""
+
+    def __init__(self, latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        self.game = PongGame(ai_difficulty=None, two_player=True)
+        self.rng = random.Random(seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.links = {}
+        # Received inputs by seq; each one drives its paddle for STEPS_PER_INPUT ticks, in order
+        self.inputs = {1: {}, 2: {}}
+        self.next_seq = {1: 1, 2: 1}
+        self.steps_left = {1: 0, 2: 0}
+        self.directions = {1: 0, 2: 0}
+        # Last fully applied input, and the paddle position it left behind
+        self.acks = {1: 0, 2: 0}
+        self.acked_y = {1: self.game.player1.y, 2: self.game.player2.y}
+        self.tick = 0
+        self.server = None
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT):
+        self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle_client(self, reader, writer):
+        player = next((p for p in (1, 2) if p not in self.links), None)
+        if player is None:
+            writer.write(b'{"type":"full"}\n')
+            writer.close()
+            return
+
+        link = LossyLink(writer, self.latency, self.jitter, self.loss, self.rng)
+        self.links[player] = link
+        link.send({'type': 'welcome', 'player': player}, reliable=True)
+        print(f"🏓 Player {player} connected")
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                if message.get('type') != 'input':
+                    continue
+                dirs = message['dirs']
+                last_seq = message['seq'] + len(dirs) - 1
+                if len(dirs) > MAX_PENDING_INPUTS:
+                    continue  # More than any well-behaved client keeps in flight
+                if len(self.links) < 2:
+                    # No match running yet: acknowledge the inputs without playing them
+                    self.skip_inputs(player, last_seq)
+                    continue
+                # Each message repeats every unacknowledged input, filling in lost or reordered ones
+                queued = self.inputs[player]
+                window_end = self.next_seq[player] + MAX_PENDING_INPUTS
+                for seq, direction in enumerate(dirs, message['seq']):
+                    if self.next_seq[player] <= seq < window_end:
+                        queued.setdefault(seq, max(-1, min(1, direction)))
+        except (ConnectionError, json.JSONDecodeError, KeyError, TypeError):
+            pass
+        finally:
+            del self.links[player]
+            self.skip_inputs(player, 0)
+            self.next_seq[player] = 1
+            self.acks[player] = 0
+            link.close()
+            print(f"👋 Player {player} disconnected")
+
+    def snapshot(self):
+        game = self.game
+        return {
+            'type': 'state',
+            'tick': self.tick,
+            'time': self.tick * PHYSICS_DT,
+            'ball': [game.ball.x, game.ball.y, game.ball.speed_x, game.ball.speed_y],
+            'paddles': [game.player1.y, game.player2.y],
+            'score': [game.score1, game.score2],
+            'ack': [self.acks[1], self.acks[2]],
+            'acked': [self.acked_y[1], self.acked_y[2]]
+        }
+
+    def paddle(self, player):
+        return self.game.player1 if player == 1 else self.game.player2
+
+    def skip_inputs(self, player, last_seq):
+        """Acknowledge a player's inputs up to last_seq without playing them, and stop their paddle"""
+        self.inputs[player].clear()
+        self.steps_left[player] = 0
+        self.directions[player] = 0
+        self.next_seq[player] = max(self.next_seq[player], last_seq + 1)
+        self.acks[player] = self.next_seq[player] - 1
+        self.acked_y[player] = self.paddle(player).y
+
+    def step(self):
+        for player in (1, 2):
+            if not self.steps_left[player]:
+                # Start the next input in sequence, or hold still until it arrives
+                direction = self.inputs[player].pop(self.next_seq[player], None)
+                if direction is None:
+                    self.directions[player] = 0
+                else:
+                    self.directions[player] = direction
+                    self.steps_left[player] = STEPS_PER_INPUT
+                    self.next_seq[player] += 1
+            self.paddle(player).speed = self.directions[player] * PADDLE_SPEED
+        self.game.update(STEP_SCALE)
+
+        for player in (1, 2):
+            if self.steps_left[player]:
+                self.steps_left[player] -= 1
+                if not self.steps_left[player]:
+                    self.acks[player] += 1
+                    self.acked_y[player] = self.paddle(player).y
+        self.tick += 1
+
+    async def run(self, duration=None):
+        """Step physics at PHYSICS_HZ while two players are connected"""
+        loop = asyncio.get_running_loop()
+        snapshot_every = PHYSICS_HZ // SNAPSHOT_HZ
+        next_time = loop.time()
+        end_time = None if duration is None else next_time + duration
+
+        while end_time is None or loop.time() < end_time:
+            if len(self.links) == 2:
+                self.step()
+                if self.tick % snapshot_every == 0:
+                    state = self.snapshot()
+                    for link in list(self.links.values()):
+                        link.send(state)
+            next_time += PHYSICS_DT
+            await asyncio.sleep(max(0.0, next_time - loop.time()))
+
+    def close(self):
+        if self.server:
+            self.server.close()
+
+class PongClient:
+    """Predicts its own paddle and interpolates everything else between snapshots"""
+
+    def __init__(self, latency=0.0, jitter=0.0, loss=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.rng = random.Random(seed)
+        self.player = None
+        self.link = None
+        self.reader = None
+        self.paddle = None
+        self.seq = 0
+        self.pending = deque()
+        self.snapshots = deque(maxlen=32)
+        self.clock_offset = None
+        self.corrections = []
+
+    async def connect(self, host='127.0.0.1', port=DEFAULT_PORT):
+        self.reader, writer = await asyncio.open_connection(host, port)
+        self.link = LossyLink(writer, self.latency, self.jitter, self.loss, self.rng)
+        welcome = json.loads(await self.reader.readline())
+        if welcome.get('type') != 'welcome':
+            raise ConnectionError("Server is full")
+        self.player = welcome['player']
+        self.paddle = Paddle(PADDLE_X[self.player], HEIGHT // 2 - PADDLE_HEIGHT // 2)
+        return self.player
+
+    async def receive(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            if message.get('type') == 'state':
+                self.on_snapshot(message, loop.time())
+
+    def on_snapshot(self, state, received_at):
+        if self.snapshots and state['tick'] <= self.snapshots[-1]['tick']:
+            return  # Late duplicate or reordered packet
+
+        # The largest (server time - local time) seen came from the least delayed snapshot
+        offset = state['time'] - received_at
+        if self.clock_offset is None or offset > self.clock_offset:
+            self.clock_offset = offset
+        self.snapshots.append(state)
+        self.reconcile(state)
+
+    def reconcile(self, state):
+        """Rewind our paddle to where the server's last applied input left it and replay the rest"""
+        ack = state['ack'][self.player - 1]
+        while self.pending and self.pending[0][0] <= ack:
+            self.pending.popleft()
+
+        predicted_y = self.paddle.y
+        self.paddle.y = state['acked'][self.player - 1]
+        for _, direction in self.pending:
+            self.apply_input(direction)
+        self.corrections.append(abs(self.paddle.y - predicted_y))
+
+    def apply_input(self, direction):
+        self.paddle.speed = direction * PADDLE_SPEED
+        for _ in range(STEPS_PER_INPUT):
+            self.paddle.move(STEP_SCALE)
+
+    def send_input(self, direction):
+        """Send one INPUT_HZ tick of input and apply it locally right away
+
+        Nothing is sent before the match starts (the first snapshot). With
+        MAX_PENDING_INPUTS unacknowledged the new input is dropped, exactly
+        as the server would have to wait for it, and the backlog resent.
+        """
+        if not self.snapshots:
+            return
+        if len(self.pending) < MAX_PENDING_INPUTS:
+            self.seq += 1
+            self.pending.append((self.seq, direction))
+            self.apply_input(direction)
+        # Resend everything unacknowledged so the server never has to skip an input
+        self.link.send({'type': 'input', 'seq': self.pending[0][0],
+                        'dirs': [pending for _, pending in self.pending]})
+
+    def view(self, now):
+        """Return (ball_x, ball_y, opponent_y, score) interpolated at render time"""
+        if not self.snapshots:
+            return None
+
+        latest = self.snapshots[-1]
+        render_time = now + self.clock_offset - INTERPOLATION_DELAY
+        older = newer = latest
+        for state in reversed(self.snapshots):
+            if state['time'] <= render_time:
+                older = state
+                break
+            newer = state
+        else:
+            older = newer = self.snapshots[0]
+
+        span = newer['time'] - older['time']
+        alpha = 0.0 if span <= 0 else min(1.0, (render_time - older['time']) / span)
+
+        ball_x = older['ball'][0] + (newer['ball'][0] - older['ball'][0]) * alpha
+        ball_y = older['ball'][1] + (newer['ball'][1] - older['ball'][1]) * alpha
+        if abs(newer['ball'][0] - older['ball'][0]) > WIDTH // 2:
+            ball_x, ball_y = newer['ball'][0], newer['ball'][1]  # Served again: don't sweep
+
+        other = 2 - self.player
+        opponent_y = older['paddles'][other] + (newer['paddles'][other] - older['paddles'][other]) * alpha
+        return ball_x, ball_y, opponent_y, latest['score']
+
+    def close(self):
+        if self.link:
+            self.link.close()
+
+async def run_server(host, port, latency, jitter, loss):
+    server = PongServer(latency, jitter, loss)
+    port = await server.start(host, port)
+    print(f"🏓 Pong server listening on {host}:{port} - waiting for two players...")
+    try:
+        await server.run()
+    finally:
+        server.close()
+
+async def run_client(host, port, latency, jitter, loss):
+    client = PongClient(latency, jitter, loss)
+    player = await client.connect(host, port)
+    receiver = asyncio.create_task(client.receive())
+
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption(f'Pong - Network Player {player}')
+    view = PongGame(ai_difficulty=None, two_player=True)
+    loop = asyncio.get_running_loop()
+
+    try:
+        while not receiver.done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return
+
+            keys = pygame.key.get_pressed()
+            direction = 0
+            if keys[pygame.K_w] or keys[pygame.K_UP]:
+                direction = -1
+            elif keys[pygame.K_s] or keys[pygame.K_DOWN]:
+                direction = 1
+            client.send_input(direction)
+
+            state = client.view(loop.time())
+            if state:
+                ball_x, ball_y, opponent_y, score = state
+                mine, theirs = ((view.player1, view.player2) if player == 1
+                                else (view.player2, view.player1))
+                view.ball.x = view.ball.prev_x = ball_x
+                view.ball.y = view.ball.prev_y = ball_y
+                mine.y = mine.prev_y = client.paddle.y
+                theirs.y = theirs.prev_y = opponent_y
+                view.score1, view.score2 = score
+            view.draw(screen)
+            pygame.display.flip()
+            await asyncio.sleep(1 / INPUT_HZ)
+    finally:
+        receiver.cancel()
+        client.close()
+        pygame.quit()
+
+async def run_selftest(seconds, latency, jitter, loss):
+    """Play two ball-chasing bots over localhost and report how the netcode copes"""
+    server = PongServer(latency, jitter, loss, seed=1)
+    port = await server.start('127.0.0.1', 0)
+    clients = [PongClient(latency, jitter, loss, seed=i) for i in (2, 3)]
+    for client in clients:
+        await client.connect('127.0.0.1', port)
+    receivers = [asyncio.create_task(client.receive()) for client in clients]
+    loop = asyncio.get_running_loop()
+
+    async def bot(client):
+        while True:
+            state = client.view(loop.time())
+            direction = 0
+            if state:
+                target = state[1] + BALL_SIZE / 2
+                center = client.paddle.y + PADDLE_HEIGHT / 2
+                if center < target - 10:
+                    direction = 1
+                elif center > target + 10:
+                    direction = -1
+            client.send_input(direction)
+            await asyncio.sleep(1 / INPUT_HZ)
+
+    bots = [asyncio.create_task(bot(client)) for client in clients]
+    await server.run(seconds)
+
+    for task in bots + receivers:
+        task.cancel()
+    await asyncio.gather(*bots, *receivers, return_exceptions=True)
+    for client in clients:
+        client.close()
+    # Let the server's connection handlers see the disconnects before shutting down
+    while server.links:
+        await asyncio.sleep(0.01)
+    server.close()
+
+    print(f"\n🏓 Network self-test: {seconds}s, latency {latency * 1000:.0f}ms "
+          f"+ up to {jitter * 1000:.0f}ms jitter, {loss:.0%} loss (each direction)")
+    print(f"Server ticks: {server.tick:,} ({server.tick / seconds:.0f} Hz)")
+    print(f"Score: {server.game.score1} - {server.game.score2}")
+    for client in clients:
+        corrections = client.corrections or [0]
+        print(f"Player {client.player}: {len(corrections)} snapshots applied, "
+              f"{client.link.dropped} inputs dropped, "
+              f"mean paddle correction {sum(corrections) / len(corrections):.2f}px, "
+              f"max {max(corrections):.1f}px")
+
+def main():
+    parser = argparse.ArgumentParser(description="Two-player Pong over the network")
+    parser.add_argument('mode', choices=['server', 'client', 'selftest'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency', type=float, default=0.0, help="simulated one-way delay (s)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="extra random delay (s)")
+    parser.add_argument('--loss', type=float, default=0.0, help="chance of dropping a packet")
+    parser.add_argument('--seconds', type=float, default=5.0, help="self-test duration")
+    args = parser.parse_args()
+
+    try:
+        if args.mode == 'server':
+            asyncio.run(run_server(args.host, args.port, args.latency, args.jitter, args.loss))
+        elif args.mode == 'client':
+            asyncio.run(run_client(args.host, args.port, args.latency, args.jitter, args.loss))
+        else:
+            asyncio.run(run_selftest(args.seconds, args.latency, args.jitter, args.loss))
+    except KeyboardInterrupt:
+        print("\nGame interrupted by user.")
+        sys.exit()
+    except ConnectionError as e:
+        print(f"❌ Connection failed: {e}")
+
+if __name__ == '__main__':
+    main()
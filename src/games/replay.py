@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Game Replays
+Records the RNG seed and input stream of a session and plays it back headless
+"""
+
+import argparse
+import builtins
+import hashlib
+import importlib
+import json
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+# Replays live next to the scoreboard data they back up
+REPLAY_DIR = Path(__file__).parent / "replays"
+REPLAY_VERSION = 1
+
+# Module that knows how to re-run each game from a replay
+REPLAY_PLAYERS = {
+    'breakout': 'breakout_game',
+    'snake': 'snake_game',
+    'pong': 'pong_game',
+    'tetris': 'tetris_game',
+    'tictactoe': 'tictactoe_game',
+    'number_guessing': 'number_guessing_game',
+    'rock_paper_scissors': 'rock_paper_scissors',
+    'hangman': 'hangman_game',
+    'memory_match': 'memory_match_game'
+}
+
+# Machine-dependent results of the terminal session being recorded or played back
+_choices = {}
+
+def new_seed():
+    return random.SystemRandom().randrange(2 ** 32)
+
+class Replay:
+    """A session's seed, settings and (tick, key) inputs
+
+    For real-time games a tick is a fixed simulation step; for terminal
+    games it is milliseconds since the session started and each key is a
+    line typed at an input() prompt.
+    """
+
+    def __init__(self, game_id, seed, kind='ticks', inputs=None, meta=None, created=None):
+        self.game_id = game_id
+        self.seed = seed
+        self.kind = kind
+        self.inputs = inputs or []
+        self.meta = meta or {}
+        self.created = created or datetime.now().isoformat(timespec='seconds')
+        self.path = None
+
+    def to_dict(self):
+        # Delta-encode ticks so long sessions stay small
+        packed = []
+        last_tick = 0
+        for tick, key in self.inputs:
+            packed.append([tick - last_tick, key])
+            last_tick = tick
+        return {
+            'version': REPLAY_VERSION,
+            'game': self.game_id,
+            'seed': self.seed,
+            'kind': self.kind,
+            'created': self.created,
+            'meta': self.meta,
+            'inputs': packed
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        inputs = []
+        tick = 0
+        for delta, key in data['inputs']:
+            tick += delta
+            inputs.append((tick, key))
+        return cls(data['game'], data['seed'], data['kind'], inputs, data['meta'], data['created'])
+
+    def save(self, directory=None):
+        directory = Path(directory) if directory else REPLAY_DIR
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = self.created.replace(':', '').replace('-', '')
+        self.path = directory / f"{self.game_id}-{stamp}-{self.seed}.json"
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'), ensure_ascii=False)
+        return self.path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            replay = cls.from_dict(json.load(f))
+        replay.path = Path(path)
+        return replay
+
+    def inputs_by_tick(self):
+        """Return {tick: [keys]} for stepping through a playback"""
+        by_tick = {}
+        for tick, key in self.inputs:
+            by_tick.setdefault(tick, []).append(key)
+        return by_tick
+
+class ReplayRecorder:
+    """Seeds random for a new session and collects its inputs"""
+
+    def __init__(self, game_id, seed=None, kind='ticks', **meta):
+        self.replay = Replay(game_id, new_seed() if seed is None else seed, kind, meta=meta)
+        self.finished = False
+        random.seed(self.replay.seed)
+
+    def record(self, tick, key):
+        self.replay.inputs.append((tick, key))
+
+    def finish(self, **meta):
+        """Save the replay with the session's final result; returns the path or None"""
+        if self.finished:
+            return self.replay.path
+        self.finished = True
+        self.replay.meta.update(meta)
+        try:
+            return self.replay.save()
+        except OSError as e:
+            print(f"Error saving replay: {e}")
+            return None
+
+class OutputDigest:
+    """Stdout wrapper that hashes everything printed, optionally passing it through"""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.hasher = hashlib.sha1()
+
+    def write(self, text):
+        self.hasher.update(text.encode('utf-8', 'replace'))
+        if self.stream is not None:
+            return self.stream.write(text)
+        return len(text)
+
+    def flush(self):
+        if self.stream is not None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def result(self):
+        return {'output_sha1': self.hasher.hexdigest()}
+
+def recorded(compute):
+    """Return compute(), saving the result in the current terminal replay
+
+    For results the seed and typed lines do not determine, such as a move
+    searched until a deadline. Playback returns the saved results in order
+    instead of calling compute(), so values must be JSON-serializable.
+    """
+    if 'playing' in _choices:
+        try:
+            return next(_choices['playing'])
+        except StopIteration:
+            raise EOFError("replay finished")
+    value = compute()
+    if 'recording' in _choices:
+        _choices['recording'].append(value)
+    return value
+
+def record_terminal(game_id, main, **args):
+    """Run an input()-driven main(**args), recording the seed, every line typed and a digest of the output"""
+    recorder = ReplayRecorder(game_id, kind='lines', args=args)
+    start = time.monotonic()
+    real_input = builtins.input
+    output = OutputDigest(sys.stdout)
+
+    def recording_input(prompt=''):
+        # Prompts go through the digest, as in playback, not straight to the terminal
+        output.write(prompt)
+        output.flush()
+        line = real_input()
+        recorder.record(round((time.monotonic() - start) * 1000), line)
+        return line
+
+    builtins.input = recording_input
+    choices = _choices['recording'] = []
+    try:
+        with redirect_stdout(output):
+            main(**args)
+    finally:
+        builtins.input = real_input
+        _choices.clear()
+        if choices:
+            recorder.replay.meta['choices'] = choices
+        recorder.finish(result=output.result())
+
+def play_terminal(replay, main):
+    """Re-run a terminal game from its typed lines without waiting or printing
+
+    time.time() reports the recorded moment of the latest line, plus any
+    sleeps since, so timers and time-based scores come out as they did.
+    """
+    lines = iter(replay.inputs)
+    clock = {'now': 0.0}
+    base_time = datetime.fromisoformat(replay.created).timestamp()
+
+    def replay_input(prompt=''):
+        output.write(prompt)
+        try:
+            tick, line = next(lines)
+        except StopIteration:
+            raise EOFError("replay finished")
+        clock['now'] = tick / 1000
+        return line
+
+    def replay_sleep(seconds):
+        clock['now'] += seconds
+
+    real_input, real_time, real_sleep, real_system = builtins.input, time.time, time.sleep, os.system
+    builtins.input = replay_input
+    time.time = lambda: base_time + clock['now']
+    time.sleep = replay_sleep
+    os.system = lambda command: 0  # Skip screen clears
+    output = OutputDigest()
+    random.seed(replay.seed)
+    _choices['playing'] = iter(replay.meta.get('choices', []))
+    try:
+        with redirect_stdout(output):
+            main(**replay.meta.get('args', {}))
+    except (EOFError, SystemExit):
+        pass
+    finally:
+        builtins.input, time.time, time.sleep, os.system = real_input, real_time, real_sleep, real_system
+        _choices.clear()
+    return output.result()
+
+def play(replay):
+    """Play a replay headless at full speed and return the game's result"""
+    # Pygame games need no window for playback
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    if replay.game_id not in REPLAY_PLAYERS:
+        raise ValueError(f"No replay player for '{replay.game_id}'")
+    module = importlib.import_module(REPLAY_PLAYERS[replay.game_id])
+    if replay.kind == 'lines':
+        return play_terminal(replay, module.main)
+    return module.play_replay(replay)
+
+def verify(replay):
+    """True if playback reproduces the recorded result (None if nothing was recorded)"""
+    expected = replay.meta.get('result')
+    if expected is None:
+        return None
+    return play(replay) == expected
+
+def list_replays(directory=None):
+    directory = Path(directory) if directory else REPLAY_DIR
+    if not directory.exists():
+        return []
+    return sorted(directory.glob('*.json'))
+
+def main():
+    parser = argparse.ArgumentParser(description="List, play back and verify game replays")
+    parser.add_argument('command', choices=['list', 'play', 'verify'])
+    parser.add_argument('paths', nargs='*', help="replay files (default: every saved replay)")
+    args = parser.parse_args()
+    paths = args.paths or list_replays()
+
+    if not paths:
+        print("No replays recorded yet.")
+        return
+
+    for path in paths:
+        replay = Replay.load(path)
+        name = Path(path).name
+        if args.command == 'list':
+            result = replay.meta.get('result', {})
+            print(f"{name:<48s} {len(replay.inputs):6,d} inputs  {result}")
+        elif args.command == 'play':
+            start = time.perf_counter()
+            result = play(replay)
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {result} ({elapsed * 1000:.1f} ms)")
+        else:
+            status = {True: "✅ verified", False: "❌ MISMATCH", None: "⚪ no result recorded"}
+            print(f"{name}: {status[verify(replay)]}")
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nInterrupted.")
+        sys.exit()
@@ -1,6 +1,7 @@
 import random
 import sys
 from collections import defaultdict
+from replay import record_terminal
 
 class RockPaperScissors:
     def __init__(self):
@@ -67,7 +68,8 @@ class RockPaperScissors:
             if random.random() < 0.7 and len(player_history) > 2:
                 # Look at last 3 moves and try to predict
                 recent_moves = player_history[-3:]
-                most_recent = max(set(recent_moves), key=recent_moves.count)
+                # dict.fromkeys keeps ties in play order; set order changes per run and breaks replays
+                most_recent = max(dict.fromkeys(recent_moves), key=recent_moves.count)
                 for move, data in moves.items():
                     if most_recent in data['beats']:
                         return move
@@ -313,7 +315,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        record_terminal('rock_paper_scissors', main)
     except KeyboardInterrupt:
         print("\nGame interrupted by user. Goodbye! 👋")
         sys.exit()
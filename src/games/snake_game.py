@@ -1,6 +1,8 @@
 import pygame
 import random
 import sys
+from text_cache import render_text
+from replay import ReplayRecorder
 
 # Initialize Pygame
 pygame.init()
@@ -18,6 +20,10 @@ RED = (255, 0, 0)
 WHITE = (255, 255, 255)
 DARK_GREEN = (0, 150, 0)
 
+DIRECTIONS = {'up': (0, -1), 'down': (0, 1), 'left': (-1, 0), 'right': (1, 0)}
+KEY_DIRECTIONS = {pygame.K_UP: 'up', pygame.K_DOWN: 'down',
+                  pygame.K_LEFT: 'left', pygame.K_RIGHT: 'right'}
+
 class Snake:
     def __init__(self):
         self.body = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
@@ -74,33 +80,42 @@ class Food:
         pygame.draw.rect(screen, BLACK, (x, y, GRID_SIZE, GRID_SIZE), 1)
 
 class Game:
-    def __init__(self):
+    def __init__(self, record=True):
+        self.clock = pygame.time.Clock()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.new_round(record)
+
+    def new_round(self, record=True):
+        # Seed first so the snake and food come from the replay's RNG stream
+        self.recorder = ReplayRecorder('snake') if record else None
         self.snake = Snake()
         self.food = Food()
         self.score = 0
-        self.clock = pygame.time.Clock()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.ticks = 0
         pygame.display.set_caption("Snake Game - Score: 0")
-        self.font = pygame.font.Font(None, 36)
+
+    def finish_recording(self):
+        if self.recorder:
+            self.recorder.finish(ticks=self.ticks, result={'score': self.score})
+
+    def steer(self, direction):
+        if self.recorder:
+            self.recorder.record(self.ticks, direction)
+        self.snake.change_direction(DIRECTIONS[direction])
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_UP:
-                    self.snake.change_direction((0, -1))
-                elif event.key == pygame.K_DOWN:
-                    self.snake.change_direction((0, 1))
-                elif event.key == pygame.K_LEFT:
-                    self.snake.change_direction((-1, 0))
-                elif event.key == pygame.K_RIGHT:
-                    self.snake.change_direction((1, 0))
+                if event.key in KEY_DIRECTIONS:
+                    self.steer(KEY_DIRECTIONS[event.key])
                 elif event.key == pygame.K_ESCAPE:
                     return False
         return True
 
     def update(self):
+        self.ticks += 1
         if not self.snake.move():
             return False  # Game over
         
@@ -122,7 +137,7 @@ class Game:
         self.food.draw(self.screen)
         
         # Draw score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
+        score_text = render_text(f"Score: {self.score}", 36, WHITE)
         self.screen.blit(score_text, (10, 10))
         
         pygame.display.flip()
@@ -133,9 +148,9 @@ class Game:
         overlay.fill(BLACK)
         self.screen.blit(overlay, (0, 0))
         
-        game_over_text = self.font.render("GAME OVER!", True, WHITE)
-        final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-        restart_text = self.font.render("Press SPACE to restart or ESC to quit", True, WHITE)
+        game_over_text = render_text("GAME OVER!", 36, WHITE)
+        final_score_text = render_text(f"Final Score: {self.score}", 36, WHITE)
+        restart_text = render_text("Press SPACE to restart or ESC to quit", 36, WHITE)
         
         game_over_rect = game_over_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 60))
         score_rect = final_score_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 20))
@@ -171,23 +186,34 @@ class Game:
                     self.clock.tick(10)  # Control game speed
                 
                 if not game_active:
+                    self.finish_recording()
                     self.game_over_screen()
             else:
                 # Game over state
                 restart = self.wait_for_restart()
                 if restart:
-                    # Reset game
-                    self.snake = Snake()
-                    self.food = Food()
-                    self.score = 0
-                    pygame.display.set_caption("Snake Game - Score: 0")
+                    self.new_round()
                     game_active = True
                 else:
                     running = False
         
+        self.finish_recording()
         pygame.quit()
         sys.exit()
 
+def play_replay(replay):
+    """Re-run a recorded round headless, as fast as possible"""
+    random.seed(replay.seed)
+    game = Game(record=False)
+    turns = replay.inputs_by_tick()
+    
+    while game.ticks < replay.meta['ticks']:
+        for direction in turns.get(game.ticks, ()):
+            game.steer(direction)
+        if not game.update():
+            break
+    return {'score': game.score}
+
 if __name__ == "__main__":
     print("Starting Snake Game!")
     print("Controls:")
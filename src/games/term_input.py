@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Terminal Keyboard Input
+Reads single keystrokes on a background thread so real-time terminal games never block
+"""
+
+import atexit
+import collections
+import os
+import sys
+import threading
+import time
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import select
+    import termios
+    import tty
+
+# ANSI escape sequences and Windows scan codes for the arrow keys
+ESCAPE_KEYS = {
+    '\x1b[A': 'up', '\x1b[B': 'down', '\x1b[C': 'right', '\x1b[D': 'left',
+    '\x1bOA': 'up', '\x1bOB': 'down', '\x1bOC': 'right', '\x1bOD': 'left'
+}
+WINDOWS_KEYS = {'H': 'up', 'P': 'down', 'M': 'right', 'K': 'left'}
+
+POLL_INTERVAL = 0.05  # How often the reader thread checks whether it should stop
+
+class KeyboardInput:
+    """Unbuffered keyboard reader; use as a context manager and poll() each frame
+
+    Keys are lowercased characters, or 'up'/'down'/'left'/'right' for arrows.
+    The reader thread appends to a deque and the game pops from it; both are
+    atomic in CPython, so polling takes no lock and never waits.
+    """
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdin
+        self.keys = collections.deque()
+        self.running = False
+        self.thread = None
+        self.saved_attributes = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        if self.running:
+            return
+        if os.name != 'nt' and self.stream.isatty():
+            fd = self.stream.fileno()
+            self.saved_attributes = termios.tcgetattr(fd)
+            # cbreak keeps Ctrl+C working, unlike full raw mode
+            tty.setcbreak(fd)
+            atexit.register(self.restore_terminal)
+        self.running = True
+        reader = self.read_windows if os.name == 'nt' else self.read_posix
+        self.thread = threading.Thread(target=reader, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.restore_terminal()
+
+    def restore_terminal(self):
+        if self.saved_attributes is not None:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self.saved_attributes)
+            self.saved_attributes = None
+            atexit.unregister(self.restore_terminal)
+
+    def poll(self):
+        """Return the oldest unread key, or None without waiting"""
+        try:
+            return self.keys.popleft()
+        except IndexError:
+            return None
+
+    def drain(self):
+        """Return every key pressed since the last call"""
+        keys = []
+        while self.keys:
+            keys.append(self.keys.popleft())
+        return keys
+
+    def read_posix(self):
+        fd = self.stream.fileno()
+        pending = ''
+        while self.running:
+            ready, _, _ = select.select([fd], [], [], POLL_INTERVAL)
+            if not ready:
+                # A lone escape with nothing after it is the Esc key itself
+                if pending:
+                    self.keys.append(pending)
+                    pending = ''
+                continue
+            data = os.read(fd, 64)
+            if not data:
+                break
+            pending = self.push_keys(pending + data.decode('utf-8', 'ignore'))
+
+    def push_keys(self, text):
+        """Queue every complete key in text; return an unfinished escape sequence"""
+        index = 0
+        while index < len(text):
+            char = text[index]
+            if char == '\x1b':
+                sequence = text[index:index + 3]
+                if sequence in ('\x1b', '\x1b[', '\x1bO'):
+                    # The rest of the sequence is still on its way
+                    return text[index:]
+                if sequence in ESCAPE_KEYS:
+                    self.keys.append(ESCAPE_KEYS[sequence])
+                    index += 3
+                    continue
+            self.keys.append(char.lower())
+            index += 1
+        return ''
+
+    def read_windows(self):
+        while self.running:
+            if not msvcrt.kbhit():
+                time.sleep(POLL_INTERVAL / 5)
+                continue
+            char = msvcrt.getwch()
+            if char in ('\x00', '\xe0'):
+                # Arrow and function keys arrive as a prefix plus a scan code
+                code = msvcrt.getwch()
+                if code in WINDOWS_KEYS:
+                    self.keys.append(WINDOWS_KEYS[code])
+            else:
+                self.keys.append(char.lower())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Terminal Renderer
+Redraws only the cells that changed since the last frame using ANSI cursor moves
+"""
+
+import os
+import shutil
+import sys
+import unicodedata
+
+CSI = '\x1b['
+
+def is_wide(line):
+    """True if the line contains double-width characters (emoji, CJK)"""
+    return any(unicodedata.east_asian_width(char) in ('W', 'F') for char in line)
+
+class TerminalRenderer:
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self.previous = None
+        self.bytes_written = 0
+
+    def start(self):
+        """Clear the screen once before the first frame"""
+        if os.name == 'nt':
+            os.system('')  # Turns on ANSI escape handling in the Windows console
+        self.previous = []
+        self._write(f'{CSI}2J{CSI}H')
+
+    def render(self, lines):
+        """Draw a frame given as a list of strings, emitting only the differences"""
+        if self.previous is None:
+            self.start()
+
+        # A frame plus prompt that doesn't fit would scroll and shift every row
+        if len(lines) + 2 > shutil.get_terminal_size().lines:
+            self.previous = list(lines)
+            self._write(f'{CSI}H{CSI}2J' + '\n'.join(lines) + '\n')
+            return
+
+        out = []
+        previous = self.previous
+        for y, line in enumerate(lines):
+            old = previous[y] if y < len(previous) else None
+            if line == old:
+                continue
+
+            if old is None or len(old) != len(line) or is_wide(line) or is_wide(old):
+                # Column positions can't be trusted; rewrite the whole row
+                out.append(f'{CSI}{y + 1};1H{line}{CSI}K')
+                continue
+
+            # Emit each run of changed cells with a single cursor move
+            x = 0
+            width = len(line)
+            while x < width:
+                if line[x] == old[x]:
+                    x += 1
+                    continue
+                start = x
+                while x < width and line[x] != old[x]:
+                    x += 1
+                out.append(f'{CSI}{y + 1};{start + 1}H{line[start:x]}')
+
+        # Blank out rows left over from a taller previous frame
+        for y in range(len(lines), len(previous)):
+            out.append(f'{CSI}{y + 1};1H{CSI}K')
+
+        # Park the cursor under the frame so prompts print below it
+        out.append(f'{CSI}{len(lines) + 1};1H{CSI}J')
+        self.previous = list(lines)
+        self._write(''.join(out))
+
+    def invalidate(self):
+        """Force a full redraw on the next frame (e.g. after other output)"""
+        self.previous = None
+
+    def _write(self, text):
+        self.bytes_written += len(text)
+        self.stream.write(text)
+        self.stream.flush()
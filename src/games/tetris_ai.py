@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tetris AI
+Placement-search bot that scores every reachable drop with board heuristics
+"""
+
+import argparse
+import time
+
+from tetris_core import PIECE_MASKS, mask_fits
+
+# Weights for (aggregate height, lines, holes, bumpiness)
+DEFAULT_WEIGHTS = (-0.510066, 0.760666, -0.35663, -0.184483)
+
+def column_heights(rows, width):
+    """Height of the highest filled cell in each column (0 for empty columns)"""
+    height = len(rows)
+    heights = [0] * width
+    seen = 0
+    for y, row in enumerate(rows):
+        new = row & ~seen
+        while new:
+            low = new & -new
+            heights[low.bit_length() - 1] = height - y
+            new ^= low
+        seen |= row
+    return heights
+
+def board_features(rows, width):
+    """Return (aggregate height, holes, bumpiness) for a list of row bitmasks"""
+    height = len(rows)
+    heights = [0] * width
+    seen = 0
+    holes = 0
+    for y, row in enumerate(rows):
+        if seen:
+            # Empty cells with a filled cell somewhere above them
+            holes += bin(seen & ~row).count('1')
+        new = row & ~seen
+        while new:
+            low = new & -new
+            heights[low.bit_length() - 1] = height - y
+            new ^= low
+        seen |= row
+
+    bumpiness = 0
+    for i in range(width - 1):
+        bumpiness += abs(heights[i] - heights[i + 1])
+    return sum(heights), holes, bumpiness
+
+def drop_piece(rows, width, mask, x, y):
+    """Lock a mask into a copy of rows; returns (new rows, lines cleared) or None on top-out"""
+    shift = x + mask.left
+    top = y + mask.top
+    if top < 0:
+        return None
+
+    new_rows = rows[:]
+    for i, row_mask in enumerate(mask.rows):
+        new_rows[top + i] |= row_mask << shift
+
+    full_row = (1 << width) - 1
+    lines = 0
+    for i in range(mask.height):
+        if new_rows[top + i] == full_row:
+            lines += 1
+    if lines:
+        new_rows = [0] * lines + [row for row in new_rows if row != full_row]
+    return new_rows, lines
+
+class TetrisBot:
+    def __init__(self, weights=DEFAULT_WEIGHTS, lookahead=True):
+        self.weights = weights
+        self.lookahead = lookahead
+        self.evaluations = 0
+
+    def placements(self, rows, width, piece_type, start_x, start_y):
+        """List every (rotation, x, y) reachable by rotating at spawn, sliding, then dropping"""
+        result = []
+        heights = column_heights(rows, width)
+        board_height = len(rows)
+
+        for rotation, mask in enumerate(PIECE_MASKS[piece_type]):
+            if not mask_fits(rows, width, mask, start_x, start_y):
+                continue
+
+            for step in (-1, 1):
+                x = start_x if step == -1 else start_x + 1
+                while mask_fits(rows, width, mask, x, start_y):
+                    shift = x + mask.left
+                    # Straight drop: stop just above the tallest column under the piece
+                    top = min(board_height - heights[shift + i] - bottom
+                              for i, bottom in enumerate(mask.bottoms)) - 1
+                    y = top - mask.top
+                    if y < start_y:
+                        # Piece is under an overhang; fall back to stepping down
+                        y = start_y
+                        while mask_fits(rows, width, mask, x, y + 1):
+                            y += 1
+                    result.append((rotation, x, y))
+                    x += step
+        return result
+
+    def evaluate(self, rows, width, lines):
+        self.evaluations += 1
+        aggregate_height, holes, bumpiness = board_features(rows, width)
+        w_height, w_lines, w_holes, w_bumpiness = self.weights
+        return (w_height * aggregate_height + w_lines * lines +
+                w_holes * holes + w_bumpiness * bumpiness)
+
+    def best_move(self, rows, width, piece, next_piece=None):
+        """Return the best (rotation, x) for piece, looking one piece ahead if known"""
+        best_score = -float('inf')
+        best_move = None
+
+        for rotation, x, y in self.placements(rows, width, piece['type'], piece['x'], piece['y']):
+            dropped = drop_piece(rows, width, PIECE_MASKS[piece['type']][rotation], x, y)
+            if dropped is None:
+                continue
+            new_rows, lines = dropped
+
+            if next_piece is not None and self.lookahead:
+                score = -float('inf')
+                for next_rotation, next_x, next_y in self.placements(
+                        new_rows, width, next_piece['type'], next_piece['x'], next_piece['y']):
+                    next_dropped = drop_piece(new_rows, width,
+                                              PIECE_MASKS[next_piece['type']][next_rotation],
+                                              next_x, next_y)
+                    if next_dropped is None:
+                        continue
+                    score = max(score, self.evaluate(next_dropped[0], width,
+                                                     lines + next_dropped[1]))
+                if score == -float('inf'):
+                    # No safe follow-up; still prefer this over topping out now
+                    score = self.evaluate(new_rows, width, lines) - 1000
+            else:
+                score = self.evaluate(new_rows, width, lines)
+
+            if score > best_score:
+                best_score = score
+                best_move = (rotation, x)
+
+        return best_move
+
+def play_sim(sim, bot):
+    """Place the simulator's current piece where the bot wants it"""
+    move = bot.best_move(sim.board.rows, sim.board.width, sim.current_piece, sim.next_piece)
+    if move is None:
+        sim.hard_drop()
+    else:
+        sim.place(*move)
+
+def benchmark(pieces=500, seed=0, lookahead=True):
+    """Let the bot play headless and report search throughput"""
+    from tetris_sim import TetrisSim
+
+    sim = TetrisSim(seed)
+    bot = TetrisBot(lookahead=lookahead)
+    games = 1
+    start = time.perf_counter()
+    for _ in range(pieces):
+        if sim.game_over:
+            games += 1
+            sim = TetrisSim(seed + games)
+        play_sim(sim, bot)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n🤖 Tetris AI benchmark ({'with' if lookahead else 'without'} next-piece lookahead)")
+    print(f"Pieces placed: {pieces:,} over {games} game(s)")
+    print(f"Lines cleared (current game): {sim.lines_cleared:,}")
+    print(f"Placements evaluated: {bot.evaluations:,}")
+    print(f"Placements/sec: {bot.evaluations / elapsed:,.0f}")
+    print(f"Average decision time: {elapsed / pieces * 1000:.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Tetris placement-search AI")
+    parser.add_argument('--demo', action='store_true', help="watch the AI play in pygame")
+    parser.add_argument('--pieces', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-lookahead', action='store_true')
+    args = parser.parse_args()
+
+    if args.demo:
+        import tetris_game
+        tetris_game.main(autoplay=True)
+    else:
+        benchmark(args.pieces, args.seed, not args.no_lookahead)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Tetris Core
+Bitboard playfield and precomputed piece masks shared by the Tetris games
+"""
+
+import time
+
+GRID_WIDTH = 10
+GRID_HEIGHT = 20
+SPAWN_X = GRID_WIDTH // 2 - 2
+
+# Tetris pieces
+TETRIS_PIECES = [
+    [['.....',
+      '..#..',
+      '.###.',
+      '.....',
+      '.....'],
+     ['.....',
+      '.#...',
+      '.##..',
+      '.#...',
+      '.....']],
+    [['.....',
+      '.....',
+      '.###.',
+      '.#...',
+      '.....'],
+     ['.....',
+      '.##..',
+      '..#..',
+      '..#..',
+      '.....']],
+    [['.....',
+      '.....',
+      '.###.',
+      '...#.',
+      '.....'],
+     ['.....',
+      '..#..',
+      '..#..',
+      '.##..',
+      '.....']],
+    [['.....',
+      '.....',
+      '.##..',
+      '.##..',
+      '.....']],
+    [['.....',
+      '.....',
+      '.##..',
+      '..##.',
+      '.....'],
+     ['.....',
+      '..#..',
+      '.##..',
+      '.#...',
+      '.....']],
+    [['.....',
+      '.....',
+      '..##.',
+      '.##..',
+      '.....'],
+     ['.....',
+      '.#...',
+      '.##..',
+      '..#..',
+      '.....']],
+    [['.....',
+      '.....',
+      '####.',
+      '.....',
+      '.....'],
+     ['.....',
+      '..#..',
+      '..#..',
+      '..#..',
+      '..#..']]
+]
+
+class PieceMask:
+    """One piece rotation as row bitmasks (bit 0 = leftmost filled column)"""
+
+    def __init__(self, shape):
+        filled = [(x, y) for y, row in enumerate(shape)
+                  for x, cell in enumerate(row) if cell == '#']
+        self.left = min(x for x, _ in filled)
+        self.top = min(y for _, y in filled)
+        self.width = max(x for x, _ in filled) - self.left + 1
+        bottom = max(y for _, y in filled)
+
+        self.rows = []
+        for y in range(self.top, bottom + 1):
+            mask = 0
+            for x, cell in enumerate(shape[y]):
+                if cell == '#':
+                    mask |= 1 << (x - self.left)
+            self.rows.append(mask)
+        self.height = len(self.rows)
+        self.cells = [(x, y) for x, y in filled]
+        # Lowest filled row (relative to top) in each column, for drop lookups
+        self.bottoms = [max(y for cell_x, y in filled if cell_x == x) - self.top
+                        for x in range(self.left, self.left + self.width)]
+
+# PIECE_MASKS[piece_type][rotation]
+PIECE_MASKS = [[PieceMask(shape) for shape in rotations] for rotations in TETRIS_PIECES]
+
+def mask_fits(rows, width, mask, x, y):
+    """Check a PieceMask with its 5x5 origin at (x, y) against a list of row bitmasks"""
+    shift = x + mask.left
+    if shift < 0 or shift + mask.width > width:
+        return False
+
+    y += mask.top
+    if y + mask.height > len(rows):
+        return False
+
+    for row_mask in mask.rows:
+        if y >= 0 and rows[y] & (row_mask << shift):
+            return False
+        y += 1
+    return True
+
+class TetrisBoard:
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.full_row = (1 << width) - 1
+        # One integer per row for collisions, plus piece colors for drawing
+        self.rows = [0] * height
+        self.cells = [[0] * width for _ in range(height)]
+
+    def copy(self):
+        board = TetrisBoard(self.width, self.height)
+        board.rows = self.rows[:]
+        board.cells = [row[:] for row in self.cells]
+        return board
+
+    def fits(self, piece_type, rotation, x, y):
+        """Check whether a piece rotation fits with its 5x5 origin at (x, y)"""
+        return mask_fits(self.rows, self.width, PIECE_MASKS[piece_type][rotation], x, y)
+
+    def place(self, piece_type, rotation, x, y, value=None):
+        """Lock a piece into the board; rows above the top are discarded"""
+        mask = PIECE_MASKS[piece_type][rotation]
+        shift = x + mask.left
+        top = y + mask.top
+        for i, row_mask in enumerate(mask.rows):
+            if top + i >= 0:
+                self.rows[top + i] |= row_mask << shift
+
+        if value is None:
+            value = piece_type + 1
+        for cell_x, cell_y in mask.cells:
+            if y + cell_y >= 0:
+                self.cells[y + cell_y][x + cell_x] = value
+
+    def drop_y(self, piece_type, rotation, x, y):
+        """Return the lowest y the piece can fall to from (x, y)"""
+        while self.fits(piece_type, rotation, x, y + 1):
+            y += 1
+        return y
+
+    def full_lines(self):
+        full_row = self.full_row
+        return [y for y, row in enumerate(self.rows) if row == full_row]
+
+    def clear_lines(self):
+        """Remove full rows in one bottom-up compaction pass; returns how many were cleared"""
+        full_row = self.full_row
+        rows = self.rows
+        if full_row not in rows:
+            return 0
+
+        cells = self.cells
+        freed = []
+        write = self.height - 1
+        for read in range(self.height - 1, -1, -1):
+            row = rows[read]
+            if row == full_row:
+                freed.append(cells[read])
+                continue
+            if write != read:
+                rows[write] = row
+                cells[write] = cells[read]
+            write -= 1
+
+        # Reuse the cleared rows' cell lists as the new empty rows on top
+        for y, cell_row in enumerate(freed):
+            rows[y] = 0
+            cell_row[:] = [0] * self.width
+            cells[y] = cell_row
+        return len(freed)
+
+def line_clear_score(cleared, level):
+    return cleared * 100 * level
+
+def level_for_lines(lines_cleared):
+    return lines_cleared // 10 + 1
+
+def fall_speed_for_level(level):
+    """Milliseconds between gravity steps"""
+    return max(50, 500 - (level - 1) * 50)
+
+def benchmark(iterations=200000):
+    """Compare string-walking collision checks with the bitboard version"""
+    import random
+
+    rng = random.Random(1)
+    board = TetrisBoard()
+    grid = [[0] * GRID_WIDTH for _ in range(GRID_HEIGHT)]
+    for y in range(GRID_HEIGHT // 2, GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            if rng.random() < 0.6:
+                grid[y][x] = 1
+                board.rows[y] |= 1 << x
+
+    def legacy_valid_move(shape, piece_x, piece_y):
+        for y, row in enumerate(shape):
+            for x, cell in enumerate(row):
+                if cell == '#':
+                    new_x = piece_x + x
+                    new_y = piece_y + y
+                    if (new_x < 0 or new_x >= GRID_WIDTH or
+                        new_y >= GRID_HEIGHT or
+                        (new_y >= 0 and grid[new_y][new_x])):
+                        return False
+        return True
+
+    probes = []
+    for _ in range(1000):
+        piece_type = rng.randrange(len(TETRIS_PIECES))
+        rotation = rng.randrange(len(TETRIS_PIECES[piece_type]))
+        probes.append((piece_type, rotation, rng.randint(-1, GRID_WIDTH - 2),
+                       rng.randint(0, GRID_HEIGHT - 3)))
+
+    rounds = max(1, iterations // len(probes))
+    count = rounds * len(probes)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for piece_type, rotation, x, y in probes:
+            legacy_valid_move(TETRIS_PIECES[piece_type][rotation], x, y)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for piece_type, rotation, x, y in probes:
+            board.fits(piece_type, rotation, x, y)
+    bitboard_time = time.perf_counter() - start
+
+    print(f"Collision checks: {count:,}")
+    print(f"String grid: {legacy_time * 1e9 / count:8.1f} ns/check")
+    print(f"Bitboard:    {bitboard_time * 1e9 / count:8.1f} ns/check")
+    print(f"Speedup:     {legacy_time / bitboard_time:8.1f}x")
+
+def benchmark_line_clears(heights=(GRID_HEIGHT, 40), rounds=2000):
+    """Time per-clear cost of repeated del/insert versus single-pass compaction"""
+    import random
+
+    def legacy_clear(board):
+        lines_to_clear = [y for y in range(board.height) if all(board.cells[y])]
+        for y in lines_to_clear:
+            del board.cells[y]
+            board.cells.insert(0, [0 for _ in range(board.width)])
+            del board.rows[y]
+            board.rows.insert(0, 0)
+        return len(lines_to_clear)
+
+    def filled_board(height, lines, rng):
+        board = TetrisBoard(height=height)
+        full_rows = set(rng.sample(range(height // 2, height), lines))
+        for y in range(height // 2, height):
+            for x in range(board.width):
+                if y in full_rows or rng.random() < 0.5:
+                    board.cells[y][x] = 1
+                    board.rows[y] |= 1 << x
+            if y not in full_rows and board.rows[y] == board.full_row:
+                board.cells[y][0] = 0
+                board.rows[y] &= ~1
+        return board
+
+    def percentile(samples, fraction):
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+    rng = random.Random(1)
+    print("\nRows  Lines  Method       mean(us)   p99(us)   max(us)")
+    for height in heights:
+        for lines in (1, 2, 3, 4):
+            boards = [filled_board(height, lines, rng) for _ in range(rounds)]
+            for name, clear in (('del/insert', legacy_clear),
+                                ('compaction', TetrisBoard.clear_lines)):
+                samples = []
+                for board in boards:
+                    board = board.copy()
+                    start = time.perf_counter()
+                    clear(board)
+                    samples.append((time.perf_counter() - start) * 1e6)
+                samples.sort()
+                print(f"{height:4d}  {lines:5d}  {name:<11s} {sum(samples) / len(samples):9.2f} "
+                      f"{percentile(samples, 0.99):9.2f} {samples[-1]:9.2f}")
+
+if __name__ == '__main__':
+    benchmark()
+    benchmark_line_clears()
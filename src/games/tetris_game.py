@@ -1,6 +1,11 @@
 import pygame
 import random
 import sys
+from tetris_core import (GRID_WIDTH, GRID_HEIGHT, SPAWN_X, TETRIS_PIECES, PIECE_MASKS,
+                         TetrisBoard, line_clear_score, level_for_lines, fall_speed_for_level)
+from tetris_ai import TetrisBot
+from text_cache import render_text
+from replay import ReplayRecorder
 
 # Initialize Pygame
 pygame.init()
@@ -8,10 +13,12 @@ pygame.init()
 # Constants
 WIDTH, HEIGHT = 800, 600
 BLOCK_SIZE = 30
-GRID_WIDTH = 10
-GRID_HEIGHT = 20
-GRID_X = (WIDTH - GRID_WIDTH * BLOCK_SIZE) // 2
-GRID_Y = (HEIGHT - GRID_HEIGHT * BLOCK_SIZE) // 2
+MARATHON_HEIGHT = 40
+STEP_MS = 1000 / 60  # Gravity and the AI advance in fixed steps so replays match
+MAX_FRAME_MS = 250
+
+KEY_COMMANDS = {pygame.K_LEFT: 'left', pygame.K_RIGHT: 'right', pygame.K_DOWN: 'down',
+                pygame.K_UP: 'rotate', pygame.K_a: 'ai'}
 
 # Colors
 BLACK = (0, 0, 0)
@@ -24,94 +31,36 @@ ORANGE = (255, 165, 0)
 PURPLE = (128, 0, 128)
 CYAN = (0, 255, 255)
 
-# Tetris pieces
-TETRIS_PIECES = [
-    [['.....',
-      '..#..',
-      '.###.',
-      '.....',
-      '.....'],
-     ['.....',
-      '.#...',
-      '.##..',
-      '.#...',
-      '.....']],
-    [['.....',
-      '.....',
-      '.###.',
-      '.#...',
-      '.....'],
-     ['.....',
-      '.##..',
-      '..#..',
-      '..#..',
-      '.....']],
-    [['.....',
-      '.....',
-      '.###.',
-      '...#.',
-      '.....'],
-     ['.....',
-      '..#..',
-      '..#..',
-      '.##..',
-      '.....']],
-    [['.....',
-      '.....',
-      '.##..',
-      '.##..',
-      '.....']],
-    [['.....',
-      '.....',
-      '.##..',
-      '..##.',
-      '.....'],
-     ['.....',
-      '..#..',
-      '.##..',
-      '.#...',
-      '.....']],
-    [['.....',
-      '.....',
-      '..##.',
-      '.##..',
-      '.....'],
-     ['.....',
-      '.#...',
-      '.##..',
-      '..#..',
-      '.....']],
-    [['.....',
-      '.....',
-      '####.',
-      '.....',
-      '.....'],
-     ['.....',
-      '..#..',
-      '..#..',
-      '..#..',
-      '..#..']]
-]
-
 COLORS = [CYAN, BLUE, ORANGE, YELLOW, GREEN, PURPLE, RED]
 
 class TetrisGame:
-    def __init__(self):
-        self.grid = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+    def __init__(self, grid_height=GRID_HEIGHT):
+        self.board = TetrisBoard(GRID_WIDTH, grid_height)
+        # Shrink blocks so taller boards still fit on screen
+        self.block_size = min(BLOCK_SIZE, HEIGHT // grid_height)
+        self.grid_x = (WIDTH - GRID_WIDTH * self.block_size) // 2
+        self.grid_y = (HEIGHT - grid_height * self.block_size) // 2
         self.current_piece = self.new_piece()
         self.next_piece = self.new_piece()
         self.score = 0
         self.level = 1
         self.lines_cleared = 0
         self.fall_time = 0
-        self.fall_speed = 500
+        self.fall_speed = fall_speed_for_level(self.level)
+        self.autoplay = False
+        self.ai_plan = None
+        self.steps = 0
         
+    @property
+    def grid(self):
+        return self.board.cells
+
     def new_piece(self):
         piece_type = random.randint(0, len(TETRIS_PIECES) - 1)
         return {
             'type': piece_type,
             'rotation': 0,
-            'x': GRID_WIDTH // 2 - 2,
+            'x': SPAWN_X,
             'y': 0,
             'shape': TETRIS_PIECES[piece_type][0]
         }
@@ -122,42 +71,18 @@ class TetrisGame:
         piece['shape'] = rotations[piece['rotation']]
     
     def valid_move(self, piece, dx, dy):
-        for y, row in enumerate(piece['shape']):
-            for x, cell in enumerate(row):
-                if cell == '#':
-                    new_x = piece['x'] + x + dx
-                    new_y = piece['y'] + y + dy
-                    
-                    if (new_x < 0 or new_x >= GRID_WIDTH or 
-                        new_y >= GRID_HEIGHT or 
-                        (new_y >= 0 and self.grid[new_y][new_x])):
-                        return False
-        return True
+        return self.board.fits(piece['type'], piece['rotation'],
+                               piece['x'] + dx, piece['y'] + dy)
     
     def place_piece(self, piece):
-        for y, row in enumerate(piece['shape']):
-            for x, cell in enumerate(row):
-                if cell == '#':
-                    grid_x = piece['x'] + x
-                    grid_y = piece['y'] + y
-                    if grid_y >= 0:
-                        self.grid[grid_y][grid_x] = piece['type'] + 1
+        self.board.place(piece['type'], piece['rotation'], piece['x'], piece['y'])
     
     def clear_lines(self):
-        lines_to_clear = []
-        for y in range(GRID_HEIGHT):
-            if all(self.grid[y]):
-                lines_to_clear.append(y)
-        
-        for y in lines_to_clear:
-            del self.grid[y]
-            self.grid.insert(0, [0 for _ in range(GRID_WIDTH)])
-        
-        cleared = len(lines_to_clear)
+        cleared = self.board.clear_lines()
         self.lines_cleared += cleared
-        self.score += cleared * 100 * self.level
-        self.level = self.lines_cleared // 10 + 1
-        self.fall_speed = max(50, 500 - (self.level - 1) * 50)
+        self.score += line_clear_score(cleared, self.level)
+        self.level = level_for_lines(self.lines_cleared)
+        self.fall_speed = fall_speed_for_level(self.level)
     
     def game_over(self):
         return not self.valid_move(self.current_piece, 0, 0)
@@ -174,84 +99,166 @@ class TetrisGame:
                 self.next_piece = self.new_piece()
             self.fall_time = 0
     
+    def handle_command(self, command):
+        piece = self.current_piece
+        if command == 'ai':
+            self.autoplay = not self.autoplay
+        elif command == 'left':
+            if self.valid_move(piece, -1, 0):
+                piece['x'] -= 1
+        elif command == 'right':
+            if self.valid_move(piece, 1, 0):
+                piece['x'] += 1
+        elif command == 'down':
+            if self.valid_move(piece, 0, 1):
+                piece['y'] += 1
+        elif command == 'rotate':
+            old_rotation = piece['rotation']
+            old_shape = piece['shape']
+            self.rotate_piece(piece)
+            if not self.valid_move(piece, 0, 0):
+                piece['rotation'] = old_rotation
+                piece['shape'] = old_shape
+    
+    def step(self, bot):
+        """Advance one fixed step: the AI's move (if playing) then gravity"""
+        if self.autoplay:
+            self.ai_move(bot)
+        self.update(STEP_MS)
+        self.steps += 1
+    
+    def ai_move(self, bot):
+        """Take one step towards the bot's chosen placement for the current piece"""
+        piece = self.current_piece
+        if self.ai_plan is None or self.ai_plan[0] is not piece:
+            move = bot.best_move(self.board.rows, self.board.width, piece, self.next_piece)
+            self.ai_plan = (piece, move)
+        
+        move = self.ai_plan[1]
+        if move is None:
+            return
+        rotation, x = move
+        
+        # Rotate and slide straight away so fast gravity cannot strand the plan
+        for _ in range(len(TETRIS_PIECES[piece['type']])):
+            if piece['rotation'] == rotation:
+                break
+            old_rotation = piece['rotation']
+            old_shape = piece['shape']
+            self.rotate_piece(piece)
+            if not self.valid_move(piece, 0, 0):
+                piece['rotation'] = old_rotation
+                piece['shape'] = old_shape
+                break
+        
+        dx = 1 if x > piece['x'] else -1
+        while piece['x'] != x and self.valid_move(piece, dx, 0):
+            piece['x'] += dx
+        
+        if self.valid_move(piece, 0, 1):
+            piece['y'] += 1
+    
     def draw(self, screen):
         screen.fill(BLACK)
         
         # Draw grid
-        for y in range(GRID_HEIGHT):
+        size = self.block_size
+        for y in range(self.board.height):
             for x in range(GRID_WIDTH):
-                rect = pygame.Rect(GRID_X + x * BLOCK_SIZE, GRID_Y + y * BLOCK_SIZE, 
-                                 BLOCK_SIZE, BLOCK_SIZE)
+                rect = pygame.Rect(self.grid_x + x * size, self.grid_y + y * size, 
+                                 size, size)
                 if self.grid[y][x]:
                     color = COLORS[(self.grid[y][x] - 1) % len(COLORS)]
                     pygame.draw.rect(screen, color, rect)
                 pygame.draw.rect(screen, WHITE, rect, 1)
         
         # Draw current piece
-        for y, row in enumerate(self.current_piece['shape']):
-            for x, cell in enumerate(row):
-                if cell == '#':
-                    rect = pygame.Rect(GRID_X + (self.current_piece['x'] + x) * BLOCK_SIZE,
-                                     GRID_Y + (self.current_piece['y'] + y) * BLOCK_SIZE,
-                                     BLOCK_SIZE, BLOCK_SIZE)
-                    color = COLORS[self.current_piece['type'] % len(COLORS)]
-                    pygame.draw.rect(screen, color, rect)
-                    pygame.draw.rect(screen, WHITE, rect, 1)
+        piece = self.current_piece
+        color = COLORS[piece['type'] % len(COLORS)]
+        for x, y in PIECE_MASKS[piece['type']][piece['rotation']].cells:
+            rect = pygame.Rect(self.grid_x + (piece['x'] + x) * size,
+                             self.grid_y + (piece['y'] + y) * size,
+                             size, size)
+            pygame.draw.rect(screen, color, rect)
+            pygame.draw.rect(screen, WHITE, rect, 1)
         
         # Draw UI
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f'Score: {self.score}', True, WHITE)
-        level_text = font.render(f'Level: {self.level}', True, WHITE)
-        lines_text = font.render(f'Lines: {self.lines_cleared}', True, WHITE)
+        score_text = render_text(f'Score: {self.score}', 36, WHITE)
+        level_text = render_text(f'Level: {self.level}', 36, WHITE)
+        lines_text = render_text(f'Lines: {self.lines_cleared}', 36, WHITE)
         
         screen.blit(score_text, (10, 10))
         screen.blit(level_text, (10, 50))
         screen.blit(lines_text, (10, 90))
+        
+        if self.autoplay:
+            ai_text = render_text('AI playing (A to stop)', 36, GREEN)
+            screen.blit(ai_text, (10, 130))
 
-def main():
+def main(autoplay=False, grid_height=GRID_HEIGHT):
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption('Tetris')
     clock = pygame.time.Clock()
-    game = TetrisGame()
+    bot = TetrisBot()
+    
+    def new_game(autoplay):
+        # Seed before the first pieces are drawn so they are part of the replay
+        recorder = ReplayRecorder('tetris', grid_height=grid_height, autoplay=autoplay)
+        game = TetrisGame(grid_height)
+        game.autoplay = autoplay
+        return recorder, game
+    
+    def finish(recorder, game):
+        recorder.finish(steps=game.steps, result={'score': game.score, 'lines': game.lines_cleared,
+                                                  'level': game.level})
+    
+    recorder, game = new_game(autoplay)
+    accumulator = 0.0
     
     while True:
-        dt = clock.tick(60)
+        accumulator += min(clock.tick(60), MAX_FRAME_MS)
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                finish(recorder, game)
                 pygame.quit()
                 sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    if game.valid_move(game.current_piece, -1, 0):
-                        game.current_piece['x'] -= 1
-                elif event.key == pygame.K_RIGHT:
-                    if game.valid_move(game.current_piece, 1, 0):
-                        game.current_piece['x'] += 1
-                elif event.key == pygame.K_DOWN:
-                    if game.valid_move(game.current_piece, 0, 1):
-                        game.current_piece['y'] += 1
-                elif event.key == pygame.K_UP:
-                    old_rotation = game.current_piece['rotation']
-                    old_shape = game.current_piece['shape']
-                    game.rotate_piece(game.current_piece)
-                    if not game.valid_move(game.current_piece, 0, 0):
-                        game.current_piece['rotation'] = old_rotation
-                        game.current_piece['shape'] = old_shape
+            elif event.type == pygame.KEYDOWN and event.key in KEY_COMMANDS:
+                command = KEY_COMMANDS[event.key]
+                recorder.record(game.steps, command)
+                game.handle_command(command)
         
-        game.update(dt)
+        while accumulator >= STEP_MS and not game.game_over():
+            game.step(bot)
+            accumulator -= STEP_MS
         
         if game.game_over():
-            font = pygame.font.Font(None, 72)
-            game_over_text = font.render('GAME OVER', True, RED)
+            finish(recorder, game)
+            game_over_text = render_text('GAME OVER', 72, RED)
             screen.blit(game_over_text, (WIDTH//2 - 150, HEIGHT//2))
             pygame.display.flip()
             pygame.time.wait(3000)
-            game = TetrisGame()
+            recorder, game = new_game(game.autoplay)
+            accumulator = 0.0
         
         game.draw(screen)
         pygame.display.flip()
 
+def play_replay(replay):
+    """Re-run a recorded game headless, as fast as possible"""
+    random.seed(replay.seed)
+    game = TetrisGame(replay.meta['grid_height'])
+    game.autoplay = replay.meta['autoplay']
+    bot = TetrisBot()
+    commands = replay.inputs_by_tick()
+    
+    while game.steps < replay.meta['steps'] and not game.game_over():
+        for command in commands.get(game.steps, ()):
+            game.handle_command(command)
+        game.step(bot)
+    return {'score': game.score, 'lines': game.lines_cleared, 'level': game.level}
+
 if __name__ == '__main__':
-    main()
+    # python tetris_game.py --marathon for a 40-row board
+    main(grid_height=MARATHON_HEIGHT if '--marathon' in sys.argv else GRID_HEIGHT)
 
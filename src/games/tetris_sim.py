@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Headless Tetris Simulator
+Pure-logic Tetris environment with seeded pieces and batch runs across processes
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tetris_ai import TetrisBot, play_sim
+from tetris_core import (GRID_WIDTH, GRID_HEIGHT, TETRIS_PIECES, TetrisBoard,
+                         line_clear_score, level_for_lines, fall_speed_for_level)
+
+ACTIONS = ('none', 'left', 'right', 'rotate', 'down', 'drop')
+FRAME_MS = 1000 / 60  # Virtual time per step, matching the pygame loop
+
+class TetrisSim:
+    def __init__(self, seed=None, width=GRID_WIDTH, height=GRID_HEIGHT, frame_ms=FRAME_MS):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.board = TetrisBoard(width, height)
+        self.frame_ms = frame_ms
+        self.score = 0
+        self.level = 1
+        self.lines_cleared = 0
+        self.fall_time = 0
+        self.fall_speed = fall_speed_for_level(self.level)
+        self.pieces_placed = 0
+        self.frames = 0
+        self.game_over = False
+        self.current_piece = self.new_piece()
+        self.next_piece = self.new_piece()
+
+    def new_piece(self):
+        piece_type = self.rng.randint(0, len(TETRIS_PIECES) - 1)
+        return {
+            'type': piece_type,
+            'rotation': 0,
+            'x': self.board.width // 2 - 2,
+            'y': 0
+        }
+
+    def valid_move(self, piece, dx, dy, rotation=None):
+        if rotation is None:
+            rotation = piece['rotation']
+        return self.board.fits(piece['type'], rotation, piece['x'] + dx, piece['y'] + dy)
+
+    def move(self, dx):
+        if self.valid_move(self.current_piece, dx, 0):
+            self.current_piece['x'] += dx
+            return True
+        return False
+
+    def rotate(self):
+        piece = self.current_piece
+        rotation = (piece['rotation'] + 1) % len(TETRIS_PIECES[piece['type']])
+        if self.valid_move(piece, 0, 0, rotation):
+            piece['rotation'] = rotation
+            return True
+        return False
+
+    def soft_drop(self):
+        """Move the piece down one row, locking it if it cannot fall"""
+        if self.valid_move(self.current_piece, 0, 1):
+            self.current_piece['y'] += 1
+            return 0
+        return self.lock_piece()
+
+    def hard_drop(self):
+        """Drop the current piece to the floor and lock it; returns lines cleared"""
+        if self.game_over:
+            return 0
+        piece = self.current_piece
+        piece['y'] = self.board.drop_y(piece['type'], piece['rotation'], piece['x'], piece['y'])
+        return self.lock_piece()
+
+    def lock_piece(self):
+        piece = self.current_piece
+        self.board.place(piece['type'], piece['rotation'], piece['x'], piece['y'])
+        cleared = self.board.clear_lines()
+
+        self.pieces_placed += 1
+        self.lines_cleared += cleared
+        self.score += line_clear_score(cleared, self.level)
+        self.level = level_for_lines(self.lines_cleared)
+        self.fall_speed = fall_speed_for_level(self.level)
+        self.fall_time = 0
+
+        self.current_piece = self.next_piece
+        self.next_piece = self.new_piece()
+        if not self.valid_move(self.current_piece, 0, 0):
+            self.game_over = True
+        return cleared
+
+    def step(self, action='none'):
+        """Apply one action and advance gravity by one frame; returns lines cleared"""
+        if self.game_over:
+            return 0
+
+        if action == 'left':
+            self.move(-1)
+        elif action == 'right':
+            self.move(1)
+        elif action == 'rotate':
+            self.rotate()
+        elif action == 'down':
+            if self.valid_move(self.current_piece, 0, 1):
+                self.current_piece['y'] += 1
+        elif action == 'drop':
+            self.frames += 1
+            return self.hard_drop()
+        elif action != 'none':
+            raise ValueError(f"Unknown action: {action}")
+
+        self.frames += 1
+        self.fall_time += self.frame_ms
+        if self.fall_time >= self.fall_speed:
+            self.fall_time = 0
+            return self.soft_drop()
+        return 0
+
+    def place(self, rotation, x):
+        """Rotate and shift the current piece from its spawn position, then hard drop"""
+        piece = self.current_piece
+        if not self.valid_move(piece, x - piece['x'], 0, rotation):
+            return None
+        piece['rotation'] = rotation
+        piece['x'] = x
+        return self.hard_drop()
+
+def random_policy(sim):
+    """Drop each piece at a random rotation and column"""
+    piece = sim.current_piece
+    rotations = len(TETRIS_PIECES[piece['type']])
+    for _ in range(20):
+        rotation = sim.rng.randrange(rotations)
+        x = sim.rng.randint(-2, sim.board.width - 1)
+        if sim.place(rotation, x) is not None:
+            return
+    sim.hard_drop()
+
+def gravity_policy(sim):
+    """Random frame-by-frame inputs, letting gravity do most of the work"""
+    sim.step(sim.rng.choice(ACTIONS[:5]))
+
+_bot = None
+
+def ai_policy(sim):
+    """Place each piece with the heuristic search bot"""
+    global _bot
+    if _bot is None:
+        _bot = TetrisBot()
+    play_sim(sim, _bot)
+
+POLICIES = {
+    'random': random_policy,
+    'gravity': gravity_policy,
+    'ai': ai_policy,
+}
+
+def get_policy(name):
+    if name not in POLICIES:
+        raise ValueError(f"Unknown policy '{name}'. Choose from: {', '.join(sorted(POLICIES))}")
+    return POLICIES[name]
+
+def run_game(seed, max_pieces=1000, policy='random', height=GRID_HEIGHT):
+    """Play one game to game over (or max_pieces) and return its statistics"""
+    sim = TetrisSim(seed, height=height)
+    play = get_policy(policy)
+    level_pieces = {}
+    level_frames = {}
+
+    while not sim.game_over and sim.pieces_placed < max_pieces:
+        level = sim.level
+        pieces, frames = sim.pieces_placed, sim.frames
+        play(sim)
+        level_pieces[level] = level_pieces.get(level, 0) + sim.pieces_placed - pieces
+        level_frames[level] = level_frames.get(level, 0) + sim.frames - frames
+
+    return {
+        'seed': seed,
+        'pieces': sim.pieces_placed,
+        'lines': sim.lines_cleared,
+        'score': sim.score,
+        'level': sim.level,
+        'frames': sim.frames,
+        'game_over': sim.game_over,
+        'level_pieces': level_pieces,
+        'level_frames': level_frames
+    }
+
+def _run_game_args(args):
+    return run_game(*args)
+
+def run_batch(games=100, max_pieces=1000, workers=None, seed=0, policy='random',
+              height=GRID_HEIGHT):
+    """Run independent seeded games across a process pool and aggregate the results"""
+    get_policy(policy)
+    jobs = [(seed + i, max_pieces, policy, height) for i in range(games)]
+    chunksize = max(1, games // ((workers or os.cpu_count() or 1) * 4))
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_run_game_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_game_args, jobs, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    pieces = sum(r['pieces'] for r in results)
+    lines = sum(r['lines'] for r in results)
+    level_pieces = {}
+    level_frames = {}
+    for r in results:
+        for level, count in r['level_pieces'].items():
+            level_pieces[level] = level_pieces.get(level, 0) + count
+        for level, count in r['level_frames'].items():
+            level_frames[level] = level_frames.get(level, 0) + count
+
+    return {
+        'games': games,
+        'elapsed': elapsed,
+        'pieces': pieces,
+        'lines': lines,
+        'pieces_per_sec': pieces / elapsed if elapsed else 0,
+        'lines_per_sec': lines / elapsed if elapsed else 0,
+        'average_score': sum(r['score'] for r in results) / games if games else 0,
+        'max_level': max((r['level'] for r in results), default=1),
+        'level_pieces': level_pieces,
+        'level_frames': level_frames,
+        'results': results
+    }
+
+def print_report(report):
+    print(f"\n🧱 Tetris batch: {report['games']} games in {report['elapsed']:.2f}s")
+    print(f"Pieces: {report['pieces']:,} ({report['pieces_per_sec']:,.0f}/sec)")
+    print(f"Lines:  {report['lines']:,} ({report['lines_per_sec']:,.0f}/sec)")
+    print(f"Average score: {report['average_score']:.1f}")
+    print(f"Highest level: {report['max_level']}")
+
+    if report['level_pieces']:
+        # Policies that hard drop every piece never run gravity frames, so time per piece means nothing
+        timed = any(report['level_frames'].values())
+        print("\nLevel  Fall speed  Pieces" + ("      Seconds/piece" if timed else ""))
+        for level in sorted(report['level_pieces']):
+            pieces = report['level_pieces'][level]
+            row = f"{level:5d}  {fall_speed_for_level(level):7d}ms  {pieces:10,d}"
+            if timed:
+                seconds = report['level_frames'].get(level, 0) * FRAME_MS / 1000
+                row += f"  {seconds / pieces if pieces else 0:13.2f}"
+            print(row)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless Tetris games in parallel")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--max-pieces', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--policy', default='random', choices=sorted(POLICIES))
+    parser.add_argument('--height', type=int, default=GRID_HEIGHT)
+    args = parser.parse_args()
+
+    report = run_batch(args.games, args.max_pieces, args.workers, args.seed,
+                       args.policy, args.height)
+    print_report(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Text Render Cache
+Shared font and text-surface cache for the pygame games
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_MAX_SURFACES = 256
+
+class TextCache:
+    def __init__(self, max_surfaces=DEFAULT_MAX_SURFACES):
+        self.max_surfaces = max_surfaces
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, name, size):
+        """Return a font, loading it only the first time it is requested"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, size, color, name=None, antialias=True):
+        """Return a rendered text surface, reusing it while the text is unchanged"""
+        key = (name, size, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(name, size).render(text, antialias, color)
+        self.surfaces[key] = surface
+
+        # Evict the least recently used surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces (fonts stay loaded)"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+_shared_cache = None
+
+def get_text_cache():
+    """Return the cache shared by all games in this process"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = TextCache()
+    return _shared_cache
+
+def render_text(text, size, color, name=None):
+    """Render text through the shared cache"""
+    return get_text_cache().render(text, size, color, name)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Tic-Tac-Toe Arena
+Plays AI variants against each other headless and reports strength and speed
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+
+from tictactoe_core import TicTacToeBoard
+from tictactoe_engine import KInARowBoard, SearchEngine
+from tictactoe_game import TicTacToeAI
+
+def other(mark):
+    return 'O' if mark == 'X' else 'X'
+
+class RandomPlayer:
+    """Any empty cell, chosen with a seeded RNG"""
+    perfect = False
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def choose(self, board, mark, moves):
+        return self.rng.choice(board.empty_cells()), 0
+
+class MinimaxPlayer:
+    """Memoized minimax search, the vs-AI opponent before the tablebase"""
+    perfect = True
+
+    def __init__(self, seed=None):
+        self.nodes = 0
+        # Minimax values by (canonical board, player's mark). Each match builds its
+        # own, so the first game pays for a cold search and earlier matches add no hits
+        self.table = {}
+
+    def minimax(self, board, mark, to_move):
+        self.nodes += 1
+        winner = board.winner()
+        if winner == mark:
+            return 1
+        elif winner == other(mark):
+            return -1
+        elif board.is_full():
+            return 0
+
+        # Whose turn it is follows from the board, so the position alone is the key
+        key = (board.canonical_key(), mark)
+        cached = self.table.get(key)
+        if cached is not None:
+            return cached
+
+        scores = []
+        for row, col in board.empty_cells():
+            board.place(row, col, to_move)
+            scores.append(self.minimax(board, mark, other(to_move)))
+            board.remove(row, col)
+        best_score = max(scores) if to_move == mark else min(scores)
+        self.table[key] = best_score
+        return best_score
+
+    def choose(self, board, mark, moves):
+        self.nodes = 0
+        best_score = -float('inf')
+        best_move = None
+        for row, col in board.empty_cells():
+            board.place(row, col, mark)
+            score = self.minimax(board, mark, other(mark))
+            board.remove(row, col)
+            if score > best_score:
+                best_score = score
+                best_move = (row, col)
+        return best_move, self.nodes
+
+class TablebasePlayer:
+    """TicTacToeAI's tablebase lookup"""
+    perfect = True
+
+    def __init__(self, seed=None):
+        self.ai = TicTacToeAI()
+
+    def choose(self, board, mark, moves):
+        # Point the AI at the arena's board instead of its own
+        self.ai.bitboard = board
+        self.ai.board = board.cells
+        self.ai.ai_player = mark
+        self.ai.human_player = other(mark)
+        return self.ai.get_best_move(), 0
+
+class EnginePlayer:
+    """The N×N alpha-beta engine on a 3×3 board"""
+    perfect = True
+
+    def __init__(self, seed=None):
+        self.board = KInARowBoard(3, 3)
+        self.engine = SearchEngine()
+
+    def choose(self, board, mark, moves):
+        while self.board.moves:
+            self.board.undo()
+        for row, col in moves:
+            self.board.place(row * 3 + col)
+        move = self.engine.best_move(self.board)
+        return move, self.engine.last_search['nodes']
+
+PLAYERS = {
+    'random': RandomPlayer,
+    'minimax': MinimaxPlayer,
+    'tablebase': TablebasePlayer,
+    'engine': EnginePlayer
+}
+
+class PlayerStats:
+    def __init__(self, name):
+        self.name = name
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+        self.nodes = 0
+        self.latencies = []
+
+    @property
+    def games(self):
+        return self.wins + self.draws + self.losses
+
+    def percentile(self, fraction):
+        samples = sorted(self.latencies)
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))] if samples else 0.0
+
+def play_game(x_player, o_player, x_stats, o_stats):
+    """Play one game on a fresh board; returns the winning mark or None for a draw"""
+    board = TicTacToeBoard()
+    moves = []
+    players = {'X': (x_player, x_stats), 'O': (o_player, o_stats)}
+    mark = 'X'
+    while board.winner() is None and not board.is_full():
+        player, stats = players[mark]
+        start = time.perf_counter()
+        (row, col), nodes = player.choose(board, mark, moves)
+        stats.latencies.append(time.perf_counter() - start)
+        stats.nodes += nodes
+        if not board.is_empty(row, col):
+            raise ValueError(f"{stats.name} played the occupied cell {(row, col)}")
+        board.place(row, col, mark)
+        moves.append((row, col))
+        mark = other(mark)
+    return board.winner()
+
+def run_match(first, second, games=100, seed=0):
+    """Play games between two named players, swapping X and O every game"""
+    for name in (first, second):
+        if name not in PLAYERS:
+            raise ValueError(f"Unknown player '{name}'. Choose from: {', '.join(PLAYERS)}")
+    players = (PLAYERS[first](seed), PLAYERS[second](seed + 1))
+    stats = (PlayerStats(first), PlayerStats(second))
+
+    for game in range(games):
+        x, o = (0, 1) if game % 2 == 0 else (1, 0)
+        winner = play_game(players[x], players[o], stats[x], stats[o])
+        if winner is None:
+            stats[x].draws += 1
+            stats[o].draws += 1
+        else:
+            won, lost = (x, o) if winner == 'X' else (o, x)
+            stats[won].wins += 1
+            stats[lost].losses += 1
+    return stats
+
+def print_match(stats):
+    first, second = stats
+    print(f"\n⚔️  {first.name} vs {second.name}: {first.games} games, sides swapped every game")
+    print("Player        Win    Draw    Loss  Nodes/move   p50 us   p90 us   p99 us   max us")
+    for player in stats:
+        moves = len(player.latencies)
+        print(f"{player.name:<10s} {player.wins / player.games:6.1%} {player.draws / player.games:6.1%} "
+              f"{player.losses / player.games:6.1%} {player.nodes / moves:11.1f} "
+              f"{player.percentile(0.5) * 1e6:8.1f} {player.percentile(0.9) * 1e6:8.1f} "
+              f"{player.percentile(0.99) * 1e6:8.1f} {max(player.latencies) * 1e6:8.1f}")
+
+def check_match(stats, max_p99_ms=None):
+    """Regressions in a finished match: perfect players losing, or slow moves"""
+    problems = []
+    for player in stats:
+        if PLAYERS[player.name].perfect and player.losses:
+            problems.append(f"{player.name} lost {player.losses} game(s) but should never lose")
+        p99_ms = player.percentile(0.99) * 1000
+        if max_p99_ms is not None and p99_ms > max_p99_ms:
+            problems.append(f"{player.name} p99 move time {p99_ms:.2f} ms exceeds {max_p99_ms} ms")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Pit Tic-Tac-Toe AIs against each other")
+    parser.add_argument('players', nargs='*',
+                        help=f"two of {', '.join(PLAYERS)} (default: every pairing)")
+    parser.add_argument('--games', type=int, default=100, help="games per match (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--check', action='store_true',
+                        help="exit with status 1 if a perfect player loses or --max-p99-ms is exceeded")
+    parser.add_argument('--max-p99-ms', type=float, help="slowest allowed p99 move time")
+    args = parser.parse_args()
+
+    if args.players and len(args.players) != 2:
+        parser.error("give exactly two players, or none for every pairing")
+    pairings = [tuple(args.players)] if args.players else list(itertools.combinations(PLAYERS, 2))
+
+    problems = []
+    for first, second in pairings:
+        try:
+            stats = run_match(first, second, args.games, args.seed)
+        except ValueError as e:
+            parser.error(str(e))
+        print_match(stats)
+        problems.extend(check_match(stats, args.max_p99_ms))
+
+    if args.check:
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+if __name__ == '__main__':
+    main()
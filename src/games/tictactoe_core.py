@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Tic-Tac-Toe Core
+Bitboard board with precomputed win lines and symmetry tables
+"""
+
+import time
+
+BOARD_SIZE = 3
+FULL_MASK = (1 << BOARD_SIZE * BOARD_SIZE) - 1
+
+# Bit for each cell; bit 0 is the top-left corner, numbered row by row
+CELL_BITS = [[1 << (row * BOARD_SIZE + col) for col in range(BOARD_SIZE)]
+             for row in range(BOARD_SIZE)]
+CELLS = [(index // BOARD_SIZE, index % BOARD_SIZE) for index in range(BOARD_SIZE * BOARD_SIZE)]
+
+def line_mask(cells):
+    mask = 0
+    for row, col in cells:
+        mask |= CELL_BITS[row][col]
+    return mask
+
+WIN_LINES = (
+    [line_mask([(row, col) for col in range(BOARD_SIZE)]) for row in range(BOARD_SIZE)] +
+    [line_mask([(row, col) for row in range(BOARD_SIZE)]) for col in range(BOARD_SIZE)] +
+    [line_mask([(i, i) for i in range(BOARD_SIZE)]),
+     line_mask([(i, BOARD_SIZE - 1 - i) for i in range(BOARD_SIZE)])]
+)
+
+# Cell orders (row-major indices) for the 8 rotations and reflections of the board
+SYMMETRIES = [
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # Identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # Rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # Rotate 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # Rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # Mirror left-right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # Mirror top-bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # Main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0)   # Anti-diagonal
+]
+
+def permute_mask(mask, order):
+    """Move each cell of a mask to its place under a symmetry"""
+    result = 0
+    for index, source in enumerate(order):
+        if mask >> source & 1:
+            result |= 1 << index
+    return result
+
+# SYMMETRY_TABLES[symmetry][mask] -> transformed mask, so canonical keys are 16 lookups
+SYMMETRY_TABLES = [[permute_mask(mask, order) for mask in range(FULL_MASK + 1)]
+                   for order in SYMMETRIES]
+
+def has_line(mask):
+    for line in WIN_LINES:
+        if mask & line == line:
+            return True
+    return False
+
+# WINNING[mask] is 1 when the mask holds a complete line
+WINNING = bytes(has_line(mask) for mask in range(FULL_MASK + 1))
+
+class TicTacToeBoard:
+    def __init__(self):
+        # One 9-bit mask per player for the search, plus marks for drawing
+        self.masks = {'X': 0, 'O': 0}
+        self.cells = [[' ' for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+
+    def place(self, row, col, mark):
+        self.masks[mark] |= CELL_BITS[row][col]
+        self.cells[row][col] = mark
+
+    def remove(self, row, col):
+        mark = self.cells[row][col]
+        if mark != ' ':
+            self.masks[mark] &= ~CELL_BITS[row][col]
+            self.cells[row][col] = ' '
+
+    def is_empty(self, row, col):
+        return not (self.masks['X'] | self.masks['O']) & CELL_BITS[row][col]
+
+    def empty_mask(self):
+        return FULL_MASK & ~(self.masks['X'] | self.masks['O'])
+
+    def empty_cells(self):
+        """Empty (row, col) cells in row-major order"""
+        empty = self.empty_mask()
+        cells = []
+        while empty:
+            low = empty & -empty
+            cells.append(CELLS[low.bit_length() - 1])
+            empty ^= low
+        return cells
+
+    def winner(self):
+        masks = self.masks
+        if WINNING[masks['X']]:
+            return 'X'
+        if WINNING[masks['O']]:
+            return 'O'
+        return None
+
+    def is_full(self):
+        masks = self.masks
+        return masks['X'] | masks['O'] == FULL_MASK
+
+    def canonical_key(self):
+        """Smallest encoding of the position over its 8 symmetries"""
+        x = self.masks['X']
+        o = self.masks['O']
+        return min(table[x] | table[o] << 9 for table in SYMMETRY_TABLES)
+
+def benchmark(iterations=200000):
+    """Compare nested-list win and full-board checks with the bitboard version"""
+    import random
+
+    rng = random.Random(1)
+    positions = []
+    for _ in range(1000):
+        board = TicTacToeBoard()
+        cells = rng.sample(CELLS, rng.randint(0, 9))
+        for turn, (row, col) in enumerate(cells):
+            board.place(row, col, 'XO'[turn % 2])
+        positions.append(board)
+
+    def legacy_check(grid):
+        for row in grid:
+            if row[0] == row[1] == row[2] != ' ':
+                return row[0]
+        for col in range(3):
+            if grid[0][col] == grid[1][col] == grid[2][col] != ' ':
+                return grid[0][col]
+        if grid[0][0] == grid[1][1] == grid[2][2] != ' ':
+            return grid[0][0]
+        if grid[0][2] == grid[1][1] == grid[2][0] != ' ':
+            return grid[0][2]
+        return all(cell != ' ' for row in grid for cell in row)
+
+    rounds = max(1, iterations // len(positions))
+    count = rounds * len(positions)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for board in positions:
+            legacy_check(board.cells)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for board in positions:
+            board.winner() or board.is_full()
+    bitboard_time = time.perf_counter() - start
+
+    print(f"Terminal checks: {count:,}")
+    print(f"Nested lists: {legacy_time * 1e9 / count:8.1f} ns/check")
+    print(f"Bitboard:     {bitboard_time * 1e9 / count:8.1f} ns/check")
+    print(f"Speedup:      {legacy_time / bitboard_time:8.1f}x")
+
+if __name__ == '__main__':
+    benchmark()
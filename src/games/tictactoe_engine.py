@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+K-in-a-Row Engine
+Alpha-beta search with iterative deepening for N×N boards (4×4, 5×5, gomoku...)
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+MARKS = ('X', 'O')
+EMPTY = ' '
+
+# Board sizes and line lengths the game menu offers
+VARIANTS = {
+    'tictactoe': (3, 3),
+    '4x4': (4, 4),
+    '5x5': (5, 4),
+    'gomoku': (15, 5)
+}
+
+WIN_SCORE = 1000000
+DEFAULT_TIME_LIMIT = 1.0
+CHECK_EVERY = 256  # Nodes between clock checks; a power of two
+
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out"""
+
+def build_windows(size, k):
+    """Every run of k cells (as flat indices) that can hold a winning line"""
+    windows = []
+    for row in range(size):
+        for col in range(size):
+            for d_row, d_col in DIRECTIONS:
+                end_row = row + d_row * (k - 1)
+                end_col = col + d_col * (k - 1)
+                if 0 <= end_row < size and 0 <= end_col < size:
+                    windows.append(tuple((row + d_row * i) * size + col + d_col * i
+                                         for i in range(k)))
+    return windows
+
+class KInARowBoard:
+    """N×N board that keeps per-line stone counts up to date move by move
+
+    Each window of k cells counts the stones of each player in it, so a
+    move only touches the windows through its own cell. That gives the win
+    check (a window reaching k) and the evaluation (open windows weighted
+    by how full they are) without rescanning the board.
+    """
+
+    def __init__(self, size=3, k=3):
+        if not 3 <= k <= size:
+            raise ValueError(f"Need 3 <= k <= size, got size {size} and k {k}")
+        self.size = size
+        self.k = k
+        self.cells = [EMPTY] * (size * size)
+        self.windows = build_windows(size, k)
+        self.cell_windows = [[] for _ in self.cells]
+        for window_id, window in enumerate(self.windows):
+            for index in window:
+                self.cell_windows[index].append(window_id)
+        self.counts = ([0] * len(self.windows), [0] * len(self.windows))
+        # Value of a window holding n stones of one player and none of the other
+        self.weights = [0] + [10 ** (n - 1) for n in range(1, k)] + [WIN_SCORE]
+
+        # Only cells close to existing stones are worth searching on big boards
+        radius = 2 if size <= 8 else 1
+        self.neighbours = []
+        for index in range(size * size):
+            row, col = divmod(index, size)
+            self.neighbours.append([r * size + c
+                                    for r in range(max(0, row - radius), min(size, row + radius + 1))
+                                    for c in range(max(0, col - radius), min(size, col + radius + 1))
+                                    if (r, c) != (row, col)])
+        self.near = [0] * (size * size)
+
+        self.turn = 0
+        self.score = 0  # Evaluation from X's point of view
+        self.winner = None
+        self.moves = []
+
+    @property
+    def current_mark(self):
+        return MARKS[self.turn]
+
+    def is_full(self):
+        return len(self.moves) == len(self.cells)
+
+    def place(self, index):
+        """Play the side to move at a flat cell index"""
+        player = self.turn
+        mine = self.counts[player]
+        theirs = self.counts[1 - player]
+        weights = self.weights
+        self.moves.append((index, self.score, self.winner))
+
+        delta = 0
+        for window_id in self.cell_windows[index]:
+            rival = theirs[window_id]
+            count = mine[window_id]
+            if rival == 0:
+                delta += weights[count + 1] - weights[count]
+                if count + 1 == self.k:
+                    self.winner = player
+            elif count == 0:
+                # The window was the opponent's until now
+                delta += weights[rival]
+            mine[window_id] = count + 1
+        self.score += delta if player == 0 else -delta
+
+        self.cells[index] = MARKS[player]
+        for neighbour in self.neighbours[index]:
+            self.near[neighbour] += 1
+        self.turn = 1 - player
+
+    def undo(self):
+        index, self.score, self.winner = self.moves.pop()
+        self.turn = player = 1 - self.turn
+        mine = self.counts[player]
+        for window_id in self.cell_windows[index]:
+            mine[window_id] -= 1
+        self.cells[index] = EMPTY
+        for neighbour in self.neighbours[index]:
+            self.near[neighbour] -= 1
+
+    def candidate_moves(self):
+        """Empty cells next to a stone (or the centre on an empty board)"""
+        if not self.moves:
+            return [(self.size // 2) * self.size + self.size // 2]
+        cells = self.cells
+        near = self.near
+        return [index for index in range(len(cells)) if near[index] and cells[index] == EMPTY]
+
+    def move_priority(self, index):
+        """How much a move extends our lines plus how much it blocks theirs"""
+        mine = self.counts[self.turn]
+        theirs = self.counts[1 - self.turn]
+        weights = self.weights
+        value = 0
+        for window_id in self.cell_windows[index]:
+            if theirs[window_id] == 0:
+                value += weights[mine[window_id] + 1]
+            elif mine[window_id] == 0:
+                value += weights[theirs[window_id] + 1]
+        return value
+
+class SearchEngine:
+    """Negamax with alpha-beta, killer moves and iterative deepening under a deadline"""
+
+    def __init__(self, time_limit=DEFAULT_TIME_LIMIT, max_depth=None):
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.nodes = 0
+        self.deadline = None
+        self.killers = []
+        self.last_search = None
+
+    def check_time(self):
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+    def close(self):
+        """Release any worker processes (nothing to do for a single-process search)"""
+
+    def ordered_moves(self, board, ply):
+        moves = board.candidate_moves()
+        moves.sort(key=board.move_priority, reverse=True)
+        killer = self.killers[ply] if ply < len(self.killers) else None
+        if killer in moves:
+            moves.remove(killer)
+            moves.insert(0, killer)
+        return moves
+
+    def negamax(self, board, depth, ply, alpha, beta):
+        self.nodes += 1
+        if self.nodes & (CHECK_EVERY - 1) == 0:
+            self.check_time()
+
+        if board.winner is not None:
+            # The previous move won; sooner losses score lower
+            return -(WIN_SCORE - ply)
+        if board.is_full():
+            return 0
+        if depth == 0:
+            return board.score if board.turn == 0 else -board.score
+
+        best = -WIN_SCORE - 1
+        for index in self.ordered_moves(board, ply):
+            board.place(index)
+            score = -self.negamax(board, depth - 1, ply + 1, -beta, -alpha)
+            board.undo()
+            if score > best:
+                best = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                while len(self.killers) <= ply:
+                    self.killers.append(None)
+                self.killers[ply] = index
+                break
+        return best
+
+    def search_root(self, board, moves, depth):
+        alpha = -WIN_SCORE - 1
+        best_move = moves[0]
+        for index in moves:
+            board.place(index)
+            score = -self.negamax(board, depth - 1, 1, -WIN_SCORE - 1, -alpha)
+            board.undo()
+            if score > alpha:
+                alpha = score
+                best_move = index
+        return best_move, alpha
+
+    def best_move(self, board, time_limit=None):
+        """Deepen one ply at a time until the budget runs out; returns (row, col)"""
+        start = time.perf_counter()
+        limit = self.time_limit if time_limit is None else time_limit
+        # No limit (with max_depth set) searches to a fixed depth
+        self.deadline = None if limit is None else start + limit
+        self.nodes = 0
+        self.killers = []
+        history = len(board.moves)
+
+        moves = self.ordered_moves(board, 0)
+        best_move = moves[0]
+        best_score = 0
+        completed = 0
+        max_depth = len(board.cells) - len(board.moves)
+        if self.max_depth:
+            max_depth = min(max_depth, self.max_depth)
+
+        for depth in range(1, max_depth + 1):
+            try:
+                move, score = self.search_root(board, moves, depth)
+            except SearchTimeout:
+                # Drop the unfinished iteration and keep the last complete one
+                while len(board.moves) > history:
+                    board.undo()
+                break
+            best_move, best_score, completed = move, score, depth
+            # Search the best move first next time round
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) >= WIN_SCORE - len(board.cells):
+                break  # Forced result found; deeper search cannot change it
+
+        self.last_search = {
+            'depth': completed,
+            'nodes': self.nodes,
+            'score': best_score,
+            'seconds': time.perf_counter() - start
+        }
+        return divmod(best_move, board.size)
+
+# Per-process state of a root-split worker, set up by init_worker
+_worker = {}
+
+def init_worker(shared_alpha, stop):
+    _worker['alpha'] = shared_alpha
+    _worker['stop'] = stop
+    _worker['boards'] = {}
+
+class WorkerEngine(SearchEngine):
+    """Searches one root move; also stops when another worker has found a forced win"""
+
+    def __init__(self, deadline, stop):
+        super().__init__()
+        # Wall-clock time, so the deadline means the same thing in every process
+        self.wall_deadline = deadline
+        self.stop = stop
+
+    def check_time(self):
+        if self.stop.value or (self.wall_deadline is not None and time.time() > self.wall_deadline):
+            raise SearchTimeout()
+
+def search_root_move(size, k, history, index, depth, deadline):
+    """Worker task: score one root move; returns (index, score or None, alpha used, nodes)"""
+    board = _worker['boards'].get((size, k))
+    if board is None:
+        board = _worker['boards'][(size, k)] = KInARowBoard(size, k)
+    while board.moves:
+        board.undo()
+    for move in history:
+        board.place(move)
+
+    shared_alpha = _worker['alpha']
+    stop = _worker['stop']
+    alpha = shared_alpha.value
+    engine = WorkerEngine(deadline, stop)
+    board.place(index)
+    try:
+        score = -engine.negamax(board, depth - 1, 1, -WIN_SCORE - 1, -alpha)
+    except SearchTimeout:
+        return index, None, alpha, engine.nodes
+    finally:
+        while len(board.moves) > len(history):
+            board.undo()
+
+    if score > alpha:
+        # Tighten the window for root moves other workers have yet to start
+        with shared_alpha.get_lock():
+            if score > shared_alpha.value:
+                shared_alpha.value = score
+        if score >= WIN_SCORE - len(board.cells):
+            stop.value = 1
+    return index, score, alpha, engine.nodes
+
+class ParallelSearchEngine(SearchEngine):
+    """Iterative deepening with each depth's root moves split across worker processes
+
+    Workers share the best root score so far as their alpha bound, and a
+    forced win found by one worker cancels the rest. Which bound a worker
+    sees depends on who finishes first, so equal-scoring moves can come out
+    differently from run to run, so recorded games save its moves.
+    """
+
+    def __init__(self, time_limit=DEFAULT_TIME_LIMIT, max_depth=None, workers=None):
+        super().__init__(time_limit, max_depth)
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = None
+        self.shared_alpha = None
+        self.stop = None
+        self.wall_deadline = None
+
+    def start(self):
+        if self.executor is None:
+            self.shared_alpha = multiprocessing.Value('i', 0)
+            self.stop = multiprocessing.Value('b', 0)
+            self.executor = ProcessPoolExecutor(self.workers, initializer=init_worker,
+                                                initargs=(self.shared_alpha, self.stop))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def best_move(self, board, time_limit=None):
+        self.start()
+        limit = self.time_limit if time_limit is None else time_limit
+        self.wall_deadline = None if limit is None else time.time() + limit
+        return super().best_move(board, limit)
+
+    def search_root(self, board, moves, depth):
+        self.shared_alpha.value = -WIN_SCORE - 1
+        self.stop.value = 0
+        history = [move for move, _, _ in board.moves]
+        futures = [self.executor.submit(search_root_move, board.size, board.k, history,
+                                        index, depth, self.wall_deadline)
+                   for index in moves]
+        results = [future.result() for future in futures]
+        self.nodes += sum(nodes for _, _, _, nodes in results)
+
+        # Only scores above the alpha a worker started with are exact
+        exact = {index: score for index, score, alpha, _ in results
+                 if score is not None and score > alpha}
+        if not self.stop.value and any(score is None for _, score, _, _ in results):
+            raise SearchTimeout()
+        best_move = max(moves, key=lambda index: exact.get(index, -WIN_SCORE - 2))
+        return best_move, exact[best_move]
+
+def describe_score(score):
+    """Human-readable outcome for a search score from the mover's side"""
+    if score >= WIN_SCORE - 1000:
+        return f"wins in {WIN_SCORE - score}"
+    if score <= -(WIN_SCORE - 1000):
+        return f"loses in {WIN_SCORE + score}"
+    return f"eval {score:+d}"
+
+def benchmark(time_limit=DEFAULT_TIME_LIMIT):
+    """Self-play a few moves per variant and report depth reached and move latency"""
+    print(f"\n⏱️  Budget {time_limit * 1000:.0f} ms per move")
+    print("Variant     Board  Moves  Depth(avg)  Nodes/move  Latency(max ms)")
+    for name, (size, k) in VARIANTS.items():
+        board = KInARowBoard(size, k)
+        engine = SearchEngine(time_limit)
+        depths = []
+        nodes = []
+        latencies = []
+        while board.winner is None and not board.is_full() and len(board.moves) < 8:
+            row, col = engine.best_move(board)
+            board.place(row * size + col)
+            depths.append(engine.last_search['depth'])
+            nodes.append(engine.last_search['nodes'])
+            latencies.append(engine.last_search['seconds'])
+        print(f"{name:<10s} {size:2d}x{size:<2d}  {len(depths):5d}  {sum(depths) / len(depths):10.1f}  "
+              f"{sum(nodes) // len(nodes):10,d}  {max(latencies) * 1000:15.1f}")
+
+def benchmark_parallel(worker_counts=(1, 2, 4, 8), variant='gomoku', depth=6):
+    """Time one fixed-depth search from a mid-game position at each worker count"""
+    size, k = VARIANTS[variant]
+    board = KInARowBoard(size, k)
+    opening = SearchEngine(max_depth=2)
+    for _ in range(4):
+        row, col = opening.best_move(board)
+        board.place(row * size + col)
+
+    start = time.perf_counter()
+    SearchEngine(time_limit=None, max_depth=depth).best_move(board)
+    sequential_time = time.perf_counter() - start
+
+    print(f"\n🧵 {variant} ({size}x{size}, {k} in a row), depth {depth}, {os.cpu_count()} CPU(s); "
+          f"single-process search: {sequential_time:.2f} s")
+    print("Workers  Time(s)      Nodes  Speedup  Move")
+    baseline = None
+    for workers in worker_counts:
+        # Spin the pool up with a one-ply search outside the timing
+        engine = ParallelSearchEngine(time_limit=None, max_depth=1, workers=workers)
+        engine.best_move(board)
+        engine.max_depth = depth
+        start = time.perf_counter()
+        move = engine.best_move(board)
+        elapsed = time.perf_counter() - start
+        engine.close()
+        baseline = baseline or elapsed
+        print(f"{workers:7d}  {elapsed:7.2f}  {engine.last_search['nodes']:9,d}  "
+              f"{baseline / elapsed:6.2f}x  {move}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the K-in-a-row search engine")
+    parser.add_argument('--time-limit', type=float, default=DEFAULT_TIME_LIMIT,
+                        help="seconds per move (default: %(default)s)")
+    parser.add_argument('--parallel', action='store_true',
+                        help="compare root-split search at 1/2/4/8 worker processes")
+    parser.add_argument('--variant', choices=VARIANTS, default='gomoku')
+    parser.add_argument('--depth', type=int, default=6)
+    args = parser.parse_args()
+
+    if args.parallel:
+        benchmark_parallel(variant=args.variant, depth=args.depth)
+    else:
+        benchmark(args.time_limit)
+
+if __name__ == '__main__':
+    main()
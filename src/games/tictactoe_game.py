@@ -1,9 +1,23 @@
 import os
 import sys
+from replay import record_terminal, recorded
+from tictactoe_core import TicTacToeBoard
+from tictactoe_engine import KInARowBoard, ParallelSearchEngine, SearchEngine, describe_score
+from tictactoe_tablebase import load_tablebase
+
+# Larger boards for the search engine: (label, size, marks in a row to win)
+BIG_BOARDS = {
+    '1': ("4x4, 4 in a row", 4, 4),
+    '2': ("5x5, 4 in a row", 5, 4),
+    '3': ("Gomoku 15x15, 5 in a row", 15, 5)
+}
+ENGINE_TIME_LIMIT = 1.0  # Seconds the AI may think per move on large boards
 
 class TicTacToe:
     def __init__(self):
-        self.board = [[' ' for _ in range(3)] for _ in range(3)]
+        # Moves go through the bitboard; self.board is its grid of marks for display
+        self.bitboard = TicTacToeBoard()
+        self.board = self.bitboard.cells
         self.current_player = 'X'
     
     def clear_screen(self):
@@ -18,32 +32,16 @@ class TicTacToe:
         print()
     
     def make_move(self, row, col):
-        if self.board[row][col] == ' ':
-            self.board[row][col] = self.current_player
+        if self.bitboard.is_empty(row, col):
+            self.bitboard.place(row, col, self.current_player)
             return True
         return False
     
     def check_winner(self):
-        # Check rows
-        for row in self.board:
-            if row[0] == row[1] == row[2] != ' ':
-                return row[0]
-        
-        # Check columns
-        for col in range(3):
-            if self.board[0][col] == self.board[1][col] == self.board[2][col] != ' ':
-                return self.board[0][col]
-        
-        # Check diagonals
-        if self.board[0][0] == self.board[1][1] == self.board[2][2] != ' ':
-            return self.board[0][0]
-        if self.board[0][2] == self.board[1][1] == self.board[2][0] != ' ':
-            return self.board[0][2]
-        
-        return None
+        return self.bitboard.winner()
     
     def is_board_full(self):
-        return all(cell != ' ' for row in self.board for cell in row)
+        return self.bitboard.is_full()
     
     def switch_player(self):
         self.current_player = 'O' if self.current_player == 'X' else 'X'
@@ -112,54 +110,17 @@ class TicTacToeAI(TicTacToe):
         super().__init__()
         self.human_player = 'X'
         self.ai_player = 'O'
-    
-    def minimax(self, depth, is_maximizing):
-        winner = self.check_winner()
-        
-        if winner == self.ai_player:
-            return 1
-        elif winner == self.human_player:
-            return -1
-        elif self.is_board_full():
-            return 0
-        
-        if is_maximizing:
-            best_score = -float('inf')
-            for i in range(3):
-                for j in range(3):
-                    if self.board[i][j] == ' ':
-                        self.board[i][j] = self.ai_player
-                        score = self.minimax(depth + 1, False)
-                        self.board[i][j] = ' '
-                        best_score = max(score, best_score)
-            return best_score
-        else:
-            best_score = float('inf')
-            for i in range(3):
-                for j in range(3):
-                    if self.board[i][j] == ' ':
-                        self.board[i][j] = self.human_player
-                        score = self.minimax(depth + 1, True)
-                        self.board[i][j] = ' '
-                        best_score = min(score, best_score)
-            return best_score
+        self.last_search = None
+        self.tablebase = load_tablebase()
     
     def get_best_move(self):
-        best_score = -float('inf')
-        best_move = None
-        
-        for i in range(3):
-            for j in range(3):
-                if self.board[i][j] == ' ':
-                    self.board[i][j] = self.ai_player
-                    score = self.minimax(0, False)
-                    self.board[i][j] = ' '
-                    
-                    if score > best_score:
-                        best_score = score
-                        best_move = (i, j)
-        
-        return best_move
+        """Perfect-play move straight from the tablebase"""
+        move = self.tablebase.best_move(self.bitboard)
+        self.last_search = {
+            'source': 'tablebase',
+            'outcome': self.tablebase.outcome(self.bitboard)
+        }
+        return move
     
     def play_vs_ai(self):
         print("Welcome to Tic-Tac-Toe vs AI!")
@@ -170,6 +131,9 @@ class TicTacToeAI(TicTacToe):
         while True:
             self.clear_screen()
             print("Tic-Tac-Toe vs AI - You are X\n")
+            # Outcome only: timings would make the output, and so replays, differ run to run
+            if self.last_search:
+                print(f"🤖 AI {self.last_search['outcome']}")
             self.display_board()
             
             if self.current_player == self.human_player:
@@ -202,10 +166,6 @@ class TicTacToeAI(TicTacToe):
                     input("Press Enter to continue...")
             else:
                 # AI's turn
-                print("AI is thinking...")
-                import time
-                time.sleep(1)  # Add some drama
-                
                 row, col = self.get_best_move()
                 self.make_move(row, col)
                 
@@ -228,14 +188,118 @@ class TicTacToeAI(TicTacToe):
                 else:
                     self.switch_player()
 
-def main():
+class KInARowGame:
+    """Human vs the search engine on an N×N board with K in a row to win"""
+    
+    def __init__(self, size, k, time_limit=ENGINE_TIME_LIMIT, parallel=False):
+        self.board = KInARowBoard(size, k)
+        # Splitting the root across cores searches deeper on big boards; opt-in via --parallel
+        if parallel:
+            self.engine = ParallelSearchEngine(time_limit)
+        else:
+            self.engine = SearchEngine(time_limit)
+        self.last_search = None
+        self.size = size
+        self.k = k
+        self.human_player = 'X'
+    
+    def clear_screen(self):
+        os.system('cls' if os.name == 'nt' else 'clear')
+    
+    def display_board(self):
+        cells = self.board.cells
+        print("\n    " + " ".join(f"{col:>2}" for col in range(self.size)))
+        for row in range(self.size):
+            marks = "  ".join(cells[row * self.size:(row + 1) * self.size])
+            print(f"{row:>2}   {marks}")
+        print()
+    
+    def get_move(self):
+        while True:
+            try:
+                move = input("Your move (row,col) or 'q' to quit: ").strip()
+                if move.lower() == 'q':
+                    return None
+                
+                if ',' in move:
+                    row, col = map(int, move.split(','))
+                else:
+                    row, col = map(int, move.split())
+                
+                if not (0 <= row < self.size and 0 <= col < self.size):
+                    print(f"Please enter coordinates between 0-{self.size - 1}.")
+                elif self.board.cells[row * self.size + col] != ' ':
+                    print("That position is already taken! Try again.")
+                else:
+                    return row * self.size + col
+            except (ValueError, IndexError):
+                print("Please enter valid coordinates (e.g., '1,2' or '1 2').")
+    
+    def search_move(self):
+        """Search the AI's move; returns it with the depth, nodes and score for display"""
+        move = self.engine.best_move(self.board)
+        search = self.engine.last_search
+        return {'move': move, 'depth': search['depth'], 'nodes': search['nodes'], 'score': search['score']}
+    
+    def play_vs_ai(self):
+        try:
+            self.play_turns()
+        finally:
+            self.engine.close()
+    
+    def play_turns(self):
+        title = f"{self.size}x{self.size} vs AI - {self.k} in a row wins - You are X"
+        while True:
+            self.clear_screen()
+            print(title + "\n")
+            search = self.last_search
+            if search:
+                print(f"🤖 Last move: depth {search['depth']}, {search['nodes']:,} nodes "
+                      f"({describe_score(search['score'])})")
+            self.display_board()
+            
+            if self.board.winner is not None or self.board.is_full():
+                if self.board.winner is None:
+                    print("It's a tie!")
+                elif self.board.cells[self.board.moves[-1][0]] == self.human_player:
+                    print("🎉 You win!")
+                else:
+                    print("🤖 AI wins!")
+                break
+            
+            if self.board.current_mark == self.human_player:
+                index = self.get_move()
+                if index is None:
+                    print("Thanks for playing!")
+                    break
+                self.board.place(index)
+            else:
+                print("AI is thinking...")
+                # How deep the search gets depends on the machine, so replays reuse its result
+                self.last_search = recorded(self.search_move)
+                row, col = self.last_search['move']
+                self.board.place(row * self.size + col)
+
+def choose_big_board(parallel=False):
+    print("\nBoard sizes:")
+    for key, (label, _, _) in BIG_BOARDS.items():
+        print(f"{key}. {label}")
+    choice = input("\nChoose a board (1-3): ").strip()
+    if choice not in BIG_BOARDS:
+        print("Invalid choice.")
+        return None
+    _, size, k = BIG_BOARDS[choice]
+    return KInARowGame(size, k, parallel=parallel)
+
+def main(parallel=False):
     while True:
         print("\n=== TIC-TAC-TOE ===\n")
         print("1. Play vs Human")
         print("2. Play vs AI")
-        print("3. Quit")
+        print("3. Play vs AI on a larger board")
+        print("4. Quit")
         
-        choice = input("\nChoose an option (1-3): ").strip()
+        choice = input("\nChoose an option (1-4): ").strip()
         
         if choice == '1':
             game = TicTacToe()
@@ -244,12 +308,16 @@ def main():
             game = TicTacToeAI()
             game.play_vs_ai()
         elif choice == '3':
+            game = choose_big_board(parallel)
+            if game:
+                game.play_vs_ai()
+        elif choice == '4':
             print("Thanks for playing!")
             break
         else:
             print("Invalid choice. Please try again.")
         
-        if choice in ['1', '2']:
+        if choice in ['1', '2', '3']:
             play_again = input("\nPlay again? (y/n): ").strip().lower()
             if play_again != 'y':
                 print("Thanks for playing!")
@@ -257,7 +325,11 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        # --parallel searches large boards on every CPU core
+        if '--parallel' in sys.argv[1:]:
+            record_terminal('tictactoe', main, parallel=True)
+        else:
+            record_terminal('tictactoe', main)
     except KeyboardInterrupt:
         print("\nGame interrupted by user. Goodbye!")
         sys.exit()
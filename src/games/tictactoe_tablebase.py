@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Tic-Tac-Toe Tablebase
+Perfect-play moves and outcomes for every reachable position, read through mmap
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from pathlib import Path
+
+from tictactoe_core import CELLS, FULL_MASK, WINNING
+
+# Generated on first use and kept with the bytecode, like compiled level packs
+TABLEBASE_PATH = Path(__file__).parent / '__pycache__' / 'tictactoe.tablebase'
+TABLEBASE_MAGIC = b'TTTB'
+TABLEBASE_VERSION = 1
+TABLEBASE_HEADER = struct.Struct('<4sBH')
+
+# One byte per position: low nibble = best move (cell 0-8), high nibble = plies
+# until the game is decided with perfect play (odd: side to move wins, even:
+# it loses), DRAW when neither side can force a win.
+POSITIONS = 3 ** 9
+NO_MOVE = 0xF
+DRAW = 0x0
+GAME_OVER = 0xE
+UNREACHABLE = 0xFF
+
+# TERNARY[mask] adds 3**cell for each cell in the mask, so a position's
+# index is TERNARY[x] + 2 * TERNARY[o]
+TERNARY = [sum(3 ** cell for cell in range(9) if mask >> cell & 1) for mask in range(FULL_MASK + 1)]
+
+_loaded = None
+
+def position_index(x_mask, o_mask):
+    return TERNARY[x_mask] + 2 * TERNARY[o_mask]
+
+def build_tablebase():
+    """Solve every position reachable with X moving first; returns the entry bytes"""
+    entries = bytearray([UNREACHABLE]) * POSITIONS
+    # Scores for the side to move: 10 - d for a win in d plies, d - 10 for a loss
+    scores = {}
+
+    def solve(x_mask, o_mask):
+        index = position_index(x_mask, o_mask)
+        if index in scores:
+            return scores[index]
+        if WINNING[x_mask] or WINNING[o_mask]:
+            # The previous move won
+            entries[index] = GAME_OVER << 4 | NO_MOVE
+            scores[index] = -10
+            return -10
+        empty = FULL_MASK & ~(x_mask | o_mask)
+        if not empty:
+            entries[index] = GAME_OVER << 4 | NO_MOVE
+            scores[index] = 0
+            return 0
+
+        x_to_move = bin(x_mask).count('1') == bin(o_mask).count('1')
+        best_score = -11
+        best_cell = NO_MOVE
+        for cell in range(9):
+            bit = 1 << cell
+            if empty & bit:
+                if x_to_move:
+                    score = -solve(x_mask | bit, o_mask)
+                else:
+                    score = -solve(x_mask, o_mask | bit)
+                # One ply further away than the reply's result
+                if score > 0:
+                    score -= 1
+                elif score < 0:
+                    score += 1
+                if score > best_score:
+                    best_score = score
+                    best_cell = cell
+
+        plies = 10 - abs(best_score) if best_score else DRAW
+        entries[index] = plies << 4 | best_cell
+        scores[index] = best_score
+        return best_score
+
+    solve(0, 0)
+    return entries, len(scores)
+
+def write_tablebase(path=TABLEBASE_PATH):
+    entries, count = build_tablebase()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(TABLEBASE_HEADER.pack(TABLEBASE_MAGIC, TABLEBASE_VERSION, count))
+        f.write(entries)
+    return count
+
+def describe_outcome(plies):
+    """Outcome for the side to move, from an entry's plies nibble"""
+    if plies == DRAW:
+        return "draws with best play"
+    if plies == GAME_OVER:
+        return "has no moves left"
+    moves = (plies + 1) // 2
+    verb = "wins" if plies % 2 else "loses"
+    return f"{verb} in {moves} move{'s' if moves != 1 else ''}"
+
+class Tablebase:
+    """Lookups into a tablebase file (or bytes) without copying it"""
+
+    def __init__(self, data, source=None):
+        if len(data) != TABLEBASE_HEADER.size + POSITIONS:
+            raise ValueError(f"{source}: not a Tic-Tac-Toe tablebase")
+        magic, version, self.positions = TABLEBASE_HEADER.unpack_from(data)
+        if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION:
+            raise ValueError(f"{source}: unsupported tablebase version")
+        self.data = data
+        self.source = source
+
+    def entry(self, x_mask, o_mask):
+        entry = self.data[TABLEBASE_HEADER.size + position_index(x_mask, o_mask)]
+        if entry == UNREACHABLE:
+            raise ValueError("Position cannot be reached with X moving first")
+        return entry
+
+    def best_move(self, board):
+        """(row, col) of the perfect-play move for the side to move, or None if the game is over"""
+        cell = self.entry(board.masks['X'], board.masks['O']) & 0xF
+        return None if cell == NO_MOVE else CELLS[cell]
+
+    def outcome(self, board):
+        return describe_outcome(self.entry(board.masks['X'], board.masks['O']) >> 4)
+
+def map_tablebase(path):
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return Tablebase(data, str(path))
+    except ValueError:
+        data.close()
+        raise
+
+def load_tablebase(path=TABLEBASE_PATH):
+    """Map the tablebase file, generating it first if it is missing or stale"""
+    global _loaded
+    if _loaded is not None and _loaded.source == str(path):
+        return _loaded
+
+    try:
+        _loaded = map_tablebase(path)
+        return _loaded
+    except (OSError, ValueError):
+        pass
+    try:
+        write_tablebase(path)
+        _loaded = map_tablebase(path)
+        return _loaded
+    except (OSError, ValueError):
+        pass
+
+    # Read-only install: keep the solved table in memory for this run
+    entries, count = build_tablebase()
+    _loaded = Tablebase(TABLEBASE_HEADER.pack(TABLEBASE_MAGIC, TABLEBASE_VERSION, count) + entries,
+                        str(path))
+    return _loaded
+
+def benchmark(rounds=100000):
+    """Time tablebase generation, loading and per-move lookups"""
+    from tictactoe_core import TicTacToeBoard
+
+    start = time.perf_counter()
+    count = write_tablebase()
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tablebase = map_tablebase(TABLEBASE_PATH)
+    load_time = time.perf_counter() - start
+
+    board = TicTacToeBoard()
+    board.place(1, 1, 'X')
+    start = time.perf_counter()
+    for _ in range(rounds):
+        tablebase.best_move(board)
+    lookup_time = time.perf_counter() - start
+
+    print(f"\n⭕ {count:,} reachable positions, {TABLEBASE_HEADER.size + POSITIONS:,} bytes")
+    print(f"Generate: {build_time * 1000:8.2f} ms")
+    print(f"Load:     {load_time * 1e6:8.2f} us")
+    print(f"Lookup:   {lookup_time * 1e9 / rounds:8.1f} ns/move")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and benchmark the Tic-Tac-Toe tablebase")
+    parser.add_argument('--output', default=str(TABLEBASE_PATH), help="where to write the tablebase")
+    parser.add_argument('--benchmark', action='store_true')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark()
+    else:
+        count = write_tablebase(args.output)
+        print(f"✅ {args.output}: {count:,} positions")
+
+if __name__ == '__main__':
+    main()